@@ -0,0 +1,309 @@
+"""Script for generating synthetic spreadsheets of configurable size."""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from burndown.burndown import get_ideal_burndown
+from burndown.sprint_dates import SprintDates
+
+CATEGORIES = (
+    "Feature",
+    "Bug",
+    "Tech debt",
+    "Support",
+    "Documentation",
+    "Research",
+    "Operations",
+    "Security",
+)
+CREEP_CATEGORIES = ("Re-estimation", "Unplanned", "Bug", "Support", "Expedite")
+MATURITY_DIMENSIONS = (
+    "TEAM WORK",
+    "PLANNING",
+    "QUALITY",
+    "DELIVERY",
+    "RETROSPECTIVES",
+    "PRODUCT OWNERSHIP",
+    "TECHNICAL EXCELLENCE",
+    "CONTINUOUS IMPROVEMENT",
+)
+STORY_POINTS = (1, 2, 3, 5, 8, 13)
+
+
+class FixtureConfig(NamedTuple):
+    """The size and shape of the generated spreadsheets."""
+
+    n_releases: int = 2
+    n_sprints: int = 5
+    n_tasks: int = 40
+    sprint_length: int = 15
+    creep_rate: float = 0.25
+    done_rate: float = 0.8
+    n_categories: int = 4
+    n_creep_categories: int = 3
+    n_respondents: int = 8
+    n_dimensions: int = 4
+    start_date: str = "2022-01-03"
+    seed: int = 0
+
+
+FIXTURE_SIZES = {
+    "small": FixtureConfig(n_releases=2, n_sprints=5, n_tasks=40),
+    "medium": FixtureConfig(n_releases=4, n_sprints=10, n_tasks=200),
+    "large": FixtureConfig(n_releases=8, n_sprints=10, n_tasks=1000),
+}
+
+
+def get_category_names(names: tuple, n_names: int) -> List[str]:
+    """Return the first category names, numbering any names beyond the given ones.
+
+    Args:
+        names (tuple): The names to use first
+        n_names (int): The number of names
+
+    Returns:
+        List[str]: The category names
+    """
+    return [*names[:n_names], *(f"Other {i}" for i in range(len(names), n_names))]
+
+
+def get_sprint_names(config: FixtureConfig) -> List[str]:
+    """Return the names of the sprints in chronological order.
+
+    Args:
+        config (FixtureConfig): The configuration of the fixtures
+
+    Returns:
+        List[str]: The sprint names on the form 2.<release>-<sprint>
+    """
+    return [
+        f"2.{release}-{sprint}"
+        for release in range(config.n_releases)
+        for sprint in range(1, config.n_sprints + 1)
+    ]
+
+
+def generate_sprint_tasks(
+    rng: np.random.Generator, sprint_dates: pd.DatetimeIndex, config: FixtureConfig
+) -> pd.DataFrame:
+    """Generate the sprint tasks sheet of one sprint.
+
+    Args:
+        rng (np.random.Generator): The random number generator
+        sprint_dates (pd.DatetimeIndex): The dates of the sprint
+        config (FixtureConfig): The configuration of the fixtures
+
+    Returns:
+        pd.DataFrame: The tasks followed by the sum row of the spreadsheet
+    """
+    n_tasks = config.n_tasks
+    categories = get_category_names(CATEGORIES, config.n_categories)
+    creep_categories = get_category_names(CREEP_CATEGORIES, config.n_creep_categories)
+
+    original_estimate = rng.choice(STORY_POINTS, n_tasks).astype(float)
+    is_creep = rng.random(n_tasks) < config.creep_rate
+    creep_category = np.where(
+        is_creep, rng.choice(creep_categories, n_tasks), None
+    ).astype(object)
+    is_reestimation = creep_category == "Re-estimation"
+    # Re-estimations change the points of a planned task, other creep adds a task
+    reestimation = rng.choice([-2.0, -1.0, 1.0, 2.0, 3.0], n_tasks)
+    points = np.where(
+        is_reestimation,
+        np.maximum(original_estimate + reestimation, 1),
+        original_estimate,
+    )
+    creep = np.where(
+        is_reestimation, points - original_estimate, np.where(is_creep, points, 0)
+    )
+
+    # Creep happens during the sprint, and a task is closed after it has creeped
+    n_days = len(sprint_dates)
+    creep_day = np.where(is_creep, rng.integers(0, n_days - 1, n_tasks), 0)
+    closed_day = creep_day + (rng.random(n_tasks) * (n_days - creep_day)).astype(int)
+    is_done = rng.random(n_tasks) < config.done_rate
+    closed_hour = pd.to_timedelta(rng.integers(8, 18, n_tasks), unit="h")
+    # Planned tasks are created in the backlog before the sprint, creep when it creeps
+    created = sprint_dates[creep_day] - pd.to_timedelta(
+        np.where(is_creep, 0, rng.integers(0, 60, n_tasks)), unit="D"
+    )
+
+    tasks_df = pd.DataFrame(
+        {
+            "Key": [f"TASK-{i}" for i in range(n_tasks)],
+            "Points": points,
+            "Original estimate": original_estimate,
+            "category": rng.choice(categories, n_tasks),
+            "Created": created,
+            "Date Closed": (sprint_dates[closed_day] + closed_hour).where(is_done),
+            "burned": np.where(is_done, points, 0),
+            "creep": creep,
+            "creep_category": creep_category,
+            "creep_date": sprint_dates[creep_day].where(is_creep),
+        }
+    )
+    sum_row = pd.DataFrame({"Points": [tasks_df.loc[:, "Points"].sum()]})
+    return pd.concat([tasks_df, sum_row], ignore_index=True)
+
+
+def generate_burndown(
+    sprint_tasks_df: pd.DataFrame, sprint_dates: SprintDates
+) -> pd.DataFrame:
+    """Generate the burndown sheet of one sprint from its tasks.
+
+    Args:
+        sprint_tasks_df (pd.DataFrame): The generated sprint tasks
+        sprint_dates (SprintDates): Sprint dates object
+
+    Returns:
+        pd.DataFrame: The ideal and remaining points of each day indexed by the date
+    """
+    dates = pd.DatetimeIndex(sprint_dates.dates)
+    tasks_df = sprint_tasks_df.loc[sprint_tasks_df.loc[:, "category"].notna()]
+    planned = tasks_df.loc[:, "creep_category"].isna()
+    start_points = tasks_df.loc[planned, "Points"].sum()
+
+    def get_accumulated(event_dates: pd.Series, points: pd.Series) -> np.ndarray:
+        """Sum the points onto the days, and accumulate them."""
+        positions = dates.searchsorted(event_dates.dt.normalize())
+        valid = event_dates.notna().to_numpy()
+        return np.cumsum(
+            np.bincount(
+                positions[valid], weights=points.to_numpy()[valid], minlength=len(dates)
+            )
+        )
+
+    remaining = (
+        start_points
+        + get_accumulated(tasks_df.loc[:, "creep_date"], tasks_df.loc[:, "creep"])
+        - get_accumulated(tasks_df.loc[:, "Date Closed"], tasks_df.loc[:, "burned"])
+    )
+    return pd.DataFrame(
+        {
+            "ideal_burndown": get_ideal_burndown(sprint_dates, start_points),
+            "remaining": remaining,
+        },
+        index=pd.Index(dates, name="date"),
+    )
+
+
+def generate_agile_maturity(
+    rng: np.random.Generator, config: FixtureConfig
+) -> pd.DataFrame:
+    """Generate the answers of one round of the agile maturity survey.
+
+    Args:
+        rng (np.random.Generator): The random number generator
+        config (FixtureConfig): The configuration of the fixtures
+
+    Returns:
+        pd.DataFrame: The answers with one row per respondent
+    """
+    dimensions = get_category_names(MATURITY_DIMENSIONS, config.n_dimensions)
+    answers = {"Name": [f"Respondent {i}" for i in range(config.n_respondents)]}
+    for dimension in dimensions:
+        levels = rng.integers(1, 6, config.n_respondents)
+        answers[f"{dimension.upper()}: How mature is the team?"] = np.where(
+            rng.random(config.n_respondents) < 0.05,
+            "Not applicable",
+            [f"LEVEL {level}: Description of level {level}" for level in levels],
+        )
+    return pd.DataFrame(answers)
+
+
+def generate_fixtures(data_dir: Path, config: FixtureConfig) -> None:
+    """Generate and save all the spreadsheets.
+
+    The burndown.xlsx, sprint_tasks.xlsx, capacity.xlsx and agile_maturity.xlsx
+    spreadsheets are written with one sheet per sprint.
+
+    Args:
+        data_dir (Path): Directory to store the spreadsheets to
+        config (FixtureConfig): The configuration of the fixtures
+    """
+    rng = np.random.default_rng(config.seed)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    burndown_sheets: Dict[str, pd.DataFrame] = dict()
+    sprint_tasks_sheets: Dict[str, pd.DataFrame] = dict()
+    capacities: Dict[str, float] = dict()
+    survey_sheets: Dict[str, pd.DataFrame] = dict()
+    start_date = pd.to_datetime(config.start_date)
+    for sprint_name in get_sprint_names(config):
+        # The sprint ends on the day the next sprint starts (the planning is mid-day)
+        last_day = (start_date + pd.DateOffset(config.sprint_length - 1)).date()
+        sprint_dates = SprintDates(start_date, config.sprint_length, [last_day])
+        sprint_tasks_df = generate_sprint_tasks(
+            rng, pd.DatetimeIndex(sprint_dates.dates), config
+        )
+        sprint_tasks_sheets[sprint_name] = sprint_tasks_df
+        burndown_sheets[sprint_name] = generate_burndown(sprint_tasks_df, sprint_dates)
+        capacities[sprint_name] = float(rng.integers(4, 8) * 9)
+        survey_sheets[sprint_name] = generate_agile_maturity(rng, config)
+        start_date = start_date + pd.DateOffset(config.sprint_length - 1)
+
+    print(f"Saving spreadsheets to: {data_dir}")
+    with pd.ExcelWriter(data_dir.joinpath("burndown.xlsx")) as writer:
+        for sprint_name, burndown_df in burndown_sheets.items():
+            burndown_df.to_excel(writer, sheet_name=sprint_name)
+    with pd.ExcelWriter(data_dir.joinpath("sprint_tasks.xlsx")) as writer:
+        for sprint_name, sprint_tasks_df in sprint_tasks_sheets.items():
+            sprint_tasks_df.to_excel(writer, sheet_name=sprint_name, index=False)
+    with pd.ExcelWriter(data_dir.joinpath("capacity.xlsx")) as writer:
+        for sprint_name, person_days in capacities.items():
+            # The person days are read from the cell F11
+            capacity_df = pd.DataFrame(index=range(11), columns=list("ABCDEF"))
+            capacity_df.iloc[10, 5] = person_days
+            capacity_df.to_excel(
+                writer, sheet_name=sprint_name, index=False, header=False
+            )
+    with pd.ExcelWriter(data_dir.joinpath("agile_maturity.xlsx")) as writer:
+        for sprint_name, survey_df in survey_sheets.items():
+            survey_df.to_excel(writer, sheet_name=sprint_name, index=False)
+
+
+def main() -> None:
+    """Generate synthetic spreadsheets."""
+    root_path = Path(__file__).parents[1].resolve()
+
+    parser = argparse.ArgumentParser(description="Generate synthetic spreadsheets.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=root_path.joinpath("benchmark", "data"),
+        help="Directory to store the spreadsheets to",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        default="small",
+        choices=list(FIXTURE_SIZES.keys()),
+        help="Preset size of the spreadsheets (overridden by the options below)",
+    )
+    for field, default in FixtureConfig._field_defaults.items():
+        if field == "start_date":
+            continue
+        parser.add_argument(
+            f"--{field}",
+            type=type(default),
+            help=f"Override the {field.replace('_', ' ')} of the preset",
+        )
+    args = parser.parse_args()
+
+    config = FIXTURE_SIZES[args.size]._replace(
+        **{
+            field: getattr(args, field)
+            for field in FixtureConfig._fields
+            if getattr(args, field, None) is not None
+        }
+    )
+    generate_fixtures(args.output, config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""Script for comparing the benchmarks of the hot paths against a saved baseline."""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from benchmark.generate import FIXTURE_SIZES
+from benchmark.suite import Measurement, print_header, run_benchmarks
+
+# Increase when the format of the baseline changes
+BASELINE_VERSION = 1
+# The benchmarks of the SprintTasks, excel_io and plots hot paths, and of the startup
+HOT_PATHS = ("read_sheet", "SprintTasks.", "plots.", "startup ")
+# The seconds the fastest startup may take whatever the baseline, so that --help and
+# the daily update stay fast enough for shell prompts and cron
+STARTUP_BUDGETS: Dict[str, float] = {
+    "startup burndown --help": 0.5,
+    "startup burndown.burndown --help": 0.5,
+    "startup survey.plot_agile_maturity --help": 0.5,
+    "startup daily update": 1.0,
+}
+
+
+class Thresholds(NamedTuple):
+    """The changes which are tolerated before a benchmark counts as regressed.
+
+    A benchmark regresses when both its best and its median time grow by more than
+    all of
+    - the relative tolerance of the baseline median
+    - the number of standard deviations of the combined noise of both runs
+    - the minimum absolute change in seconds
+    Requiring the best time to grow too ignores runs which were slowed down by
+    other processes.
+    The same applies to the peak memory with its own relative and absolute
+    tolerance (the peak memory is not noisy).
+    """
+
+    relative: float = 0.1
+    n_sigmas: float = 3.0
+    min_seconds: float = 0.005
+    memory_relative: float = 0.1
+    min_memory: int = 2**20
+
+
+class Comparison(NamedTuple):
+    """The comparison of a benchmark with its baseline."""
+
+    size: str
+    name: str
+    baseline_median: Optional[float]
+    current_median: Optional[float]
+    threshold: Optional[float]
+    baseline_memory: Optional[int]
+    current_memory: Optional[int]
+    status: str
+
+    @property
+    def is_regression(self) -> bool:
+        """Return whether the benchmark regressed.
+
+        Returns:
+            bool: True if the time or the memory regressed, or the time is over
+                its budget
+        """
+        return self.status in ("slower", "more memory", "over budget")
+
+
+def get_noise(timings: Sequence[float]) -> float:
+    """Estimate the standard deviation of timings robustly to outliers.
+
+    The median absolute deviation is scaled to the standard deviation of a normal
+    distribution.
+
+    Args:
+        timings (Sequence[float]): The timings of the runs
+
+    Returns:
+        float: The estimated standard deviation
+    """
+    median = statistics.median(timings)
+    return 1.4826 * statistics.median([abs(timing - median) for timing in timings])
+
+
+def save_baseline(
+    measurements: List[Measurement], path: Path, configs: Optional[dict] = None
+) -> None:
+    """Save the measurements as the baseline.
+
+    Args:
+        measurements (List[Measurement]): The measurements to save
+        path (Path): Path to the JSON file
+        configs (Optional[dict], optional): The configuration of each size.
+            Defaults to None (FIXTURE_SIZES).
+    """
+    configs = configs if configs is not None else FIXTURE_SIZES
+    sizes = list(dict.fromkeys(measurement.size for measurement in measurements))
+    baseline = {
+        "version": BASELINE_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "configs": {size: configs[size]._asdict() for size in sizes},
+        "measurements": [
+            {**measurement._asdict(), "timings": list(measurement.timings)}
+            for measurement in measurements
+        ],
+    }
+    print(f"Saving baseline to: {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2))
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """Load a saved baseline.
+
+    Args:
+        path (Path): Path to the JSON file
+
+    Raises:
+        ValueError: If the baseline was saved in another format
+
+    Returns:
+        Dict[str, Any]: The baseline, where the measurements are Measurement objects
+    """
+    baseline = json.loads(path.read_text())
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"The baseline {path} has version {baseline.get('version')}, but version "
+            f"{BASELINE_VERSION} is required. Save a new baseline with --save"
+        )
+    baseline["measurements"] = [
+        Measurement(**{**measurement, "timings": tuple(measurement["timings"])})
+        for measurement in baseline["measurements"]
+    ]
+    return baseline
+
+
+def compare(
+    baseline: List[Measurement],
+    current: List[Measurement],
+    thresholds: Thresholds = Thresholds(),
+    budgets: Optional[Dict[str, float]] = None,
+) -> List[Comparison]:
+    """Compare the current measurements with the baseline and the budgets.
+
+    Args:
+        baseline (List[Measurement]): The measurements of the baseline
+        current (List[Measurement]): The current measurements
+        thresholds (Thresholds, optional): The tolerated changes.
+            Defaults to Thresholds().
+        budgets (Optional[Dict[str, float]], optional): The seconds the fastest run
+            of a benchmark may take. Defaults to None (STARTUP_BUDGETS).
+
+    Returns:
+        List[Comparison]: The comparison of every benchmark in either run
+    """
+    budgets = budgets if budgets is not None else STARTUP_BUDGETS
+    baseline_by_key = {(m.size, m.name): m for m in baseline}
+    current_by_key = {(m.size, m.name): m for m in current}
+    comparisons = list()
+    for key in dict.fromkeys([*current_by_key.keys(), *baseline_by_key.keys()]):
+        base = baseline_by_key.get(key)
+        new = current_by_key.get(key)
+        is_over_budget = (
+            new is not None and key[1] in budgets and new.best > budgets[key[1]]
+        )
+        if base is None or new is None:
+            status = "new" if base is None else "missing"
+            comparisons.append(
+                Comparison(
+                    *key,
+                    baseline_median=None if base is None else base.median,
+                    current_median=None if new is None else new.median,
+                    threshold=None,
+                    baseline_memory=None if base is None else base.peak_memory,
+                    current_memory=None if new is None else new.peak_memory,
+                    status="over budget" if is_over_budget else status,
+                )
+            )
+            continue
+
+        noise = (get_noise(base.timings) ** 2 + get_noise(new.timings) ** 2) ** 0.5
+        threshold = max(
+            thresholds.relative * base.median,
+            thresholds.n_sigmas * noise,
+            thresholds.min_seconds,
+        )
+        memory_threshold = max(
+            thresholds.memory_relative * base.peak_memory, thresholds.min_memory
+        )
+        change = min(new.median - base.median, new.best - base.best)
+        if is_over_budget:
+            status = "over budget"
+        elif change > threshold:
+            status = "slower"
+        elif new.peak_memory - base.peak_memory > memory_threshold:
+            status = "more memory"
+        elif max(new.median - base.median, new.best - base.best) < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        comparisons.append(
+            Comparison(
+                *key,
+                baseline_median=base.median,
+                current_median=new.median,
+                threshold=threshold,
+                baseline_memory=base.peak_memory,
+                current_memory=new.peak_memory,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """Format the comparisons as a table.
+
+    Args:
+        comparisons (List[Comparison]): The comparisons from compare
+
+    Returns:
+        str: The table with one row per benchmark
+    """
+
+    def format_value(value: Optional[float], scale: float = 1, digits: int = 4) -> str:
+        """Format an optional value."""
+        return "-" if value is None else f"{value / scale:.{digits}f}"
+
+    header = (
+        f"{'Size':<8} {'Benchmark':<45} {'Base (s)':>9} {'Now (s)':>9} "
+        f"{'Change':>8} {'Allowed (s)':>11} {'Base MiB':>9} {'Now MiB':>9}  Status"
+    )
+    rows = [header, "-" * len(header)]
+    for comparison in comparisons:
+        change = (
+            f"{100 * (comparison.current_median / comparison.baseline_median - 1):+.1f}%"
+            if comparison.threshold is not None and comparison.baseline_median > 0
+            else "-"
+        )
+        status = comparison.status.upper() if comparison.is_regression else ""
+        rows.append(
+            f"{comparison.size:<8} {comparison.name:<45} "
+            f"{format_value(comparison.baseline_median):>9} "
+            f"{format_value(comparison.current_median):>9} {change:>8} "
+            f"{format_value(comparison.threshold):>11} "
+            f"{format_value(comparison.baseline_memory, 2**20, 2):>9} "
+            f"{format_value(comparison.current_memory, 2**20, 2):>9}  "
+            f"{status or comparison.status}"
+        )
+    return "\n".join(rows)
+
+
+def main() -> None:
+    """Run the benchmarks of the hot paths and compare them with the baseline."""
+    root_path = Path(__file__).parents[1].resolve()
+
+    parser = argparse.ArgumentParser(
+        description="Check the hot paths for performance regressions."
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=Path,
+        default=root_path.joinpath("benchmark", "baseline.json"),
+        help="Path to the JSON baseline",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Save the run as the new baseline instead of comparing with it",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        choices=list(FIXTURE_SIZES.keys()),
+        help="Sizes of the synthetic spreadsheets (defaults to the sizes of the "
+        "baseline, or small when saving)",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeats",
+        type=int,
+        default=5,
+        help="Number of timed runs of each benchmark",
+    )
+    defaults = Thresholds()
+    parser.add_argument(
+        "-r",
+        "--relative",
+        type=float,
+        default=defaults.relative,
+        help="Tolerated relative increase of the median time",
+    )
+    parser.add_argument(
+        "--n_sigmas",
+        type=float,
+        default=defaults.n_sigmas,
+        help="Tolerated increase in standard deviations of the timing noise",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save:
+        if not args.baseline.exists():
+            parser.error(f"No baseline at {args.baseline}, save one with --save")
+        try:
+            baseline = load_baseline(args.baseline)
+        except ValueError as error:
+            parser.error(str(error))
+        if baseline["machine"] != platform.platform():
+            print(
+                f"Warning: the baseline was saved on {baseline['machine']}, "
+                "the timings may not be comparable"
+            )
+        changed_configs = [
+            size
+            for size, config in baseline["configs"].items()
+            if FIXTURE_SIZES[size]._asdict() != config
+        ]
+        if len(changed_configs) != 0:
+            parser.error(
+                f"The sizes {changed_configs} have changed since the baseline, "
+                "save a new baseline with --save"
+            )
+    sizes = args.sizes
+    if sizes is None:
+        sizes = list(baseline["configs"].keys()) if baseline is not None else ["small"]
+
+    print_header(sizes)
+    measurements = run_benchmarks(sizes, args.repeats, HOT_PATHS)
+    if args.save:
+        save_baseline(measurements, args.baseline)
+        return
+
+    print(f"\nCompared with the baseline of {baseline['created']}:")
+    comparisons = compare(
+        [m for m in baseline["measurements"] if m.size in sizes],
+        measurements,
+        Thresholds(relative=args.relative, n_sigmas=args.n_sigmas),
+    )
+    print(format_comparisons(comparisons))
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    if len(regressions) != 0:
+        parser.exit(1, f"\n{len(regressions)} benchmarks regressed\n")
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,602 @@
+"""Script for benchmarking the pipeline on synthetic spreadsheets of several sizes."""
+
+import argparse
+import contextlib
+import io
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmark.generate import FIXTURE_SIZES, FixtureConfig, generate_fixtures
+
+ROOT_PATH = Path(__file__).parents[1].resolve()
+
+
+class Benchmark(NamedTuple):
+    """A function to benchmark and the number of items it processes."""
+
+    name: str
+    function: Callable[[], Any]
+    n_items: int
+    unit: str
+
+
+class Measurement(NamedTuple):
+    """The timings and peak memory of a benchmark."""
+
+    size: str
+    name: str
+    n_items: int
+    unit: str
+    timings: Tuple[float, ...]
+    peak_memory: int
+
+    @property
+    def best(self) -> float:
+        """Return the fastest of the timings.
+
+        Returns:
+            float: The fastest time in seconds
+        """
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        """Return the median of the timings.
+
+        Returns:
+            float: The median time in seconds
+        """
+        return statistics.median(self.timings)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of items processed per second of the fastest run.
+
+        Returns:
+            float: The items per second
+        """
+        return self.n_items / self.best if self.best > 0 else float("inf")
+
+
+def get_benchmarks(data_dir: Path, charts_dir: Path) -> List[Benchmark]:
+    """Return the benchmarks of the spreadsheets in a directory.
+
+    The inputs of each benchmark are prepared before it is timed, so that only the
+    benchmarked function itself is measured.
+
+    Args:
+        data_dir (Path): Directory containing the spreadsheets
+        charts_dir (Path): Directory to store the charts to
+
+    Returns:
+        List[Benchmark]: The benchmarks
+    """
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    from burndown import plots
+    from burndown.excel_io import read_sheet
+    from burndown.forecast import forecast_sprint_tasks
+    from burndown.lead_time import get_control_limits
+    from burndown.sprint_dates import SprintDates
+    from burndown.sprint_tasks import (
+        BURNDOWN_COLUMNS,
+        SprintTasks,
+        find_sprint_tasks_path,
+        read_sprint_tasks_sheets,
+    )
+    from survey.analytics import get_dimension_means
+    from survey.plot_agile_maturity import get_agile_maturity, get_level_matrix
+    from survey.plots import plot_agile_maturity, plot_agile_maturity_trends
+
+    plt.switch_backend("Agg")
+    sprint_tasks_path = find_sprint_tasks_path(data_dir)
+    burndown_path = data_dir.joinpath("burndown.xlsx")
+    survey_path = data_dir.joinpath("agile_maturity.xlsx")
+
+    sprint_tasks = SprintTasks(sprint_tasks_path, burndown_path)
+    sprint_names = list(sprint_tasks.sprint_tasks_sheets.keys())
+    releases = list(dict.fromkeys(name.split("-")[0] for name in sprint_names))
+    n_tasks = sum(len(sheet) for sheet in sprint_tasks.sprint_tasks_sheets.values())
+
+    # The per sprint charts are rendered for the last sprint
+    sprint_name = sprint_names[-1]
+    n_sprint_tasks = len(sprint_tasks.sprint_tasks_sheets[sprint_name])
+    burndown_df = sprint_tasks.burndown_sheets[sprint_name]
+    sprint_dates = SprintDates(burndown_df.index[0], len(burndown_df.index))
+    total_burn = sprint_tasks.get_total_burn().drop(columns="Release")
+    burn_categories = sprint_tasks.get_burn_categories()
+    creep_categories = sprint_tasks.get_creep_categories()
+    sprint_planning_burn_df = pd.concat(
+        [
+            sprint_tasks.get_sprint_planning_burn(sprint_name),
+            burndown_df.loc[:, ["ideal_burndown"]],
+        ],
+        axis=1,
+    )
+    creep_burn_df = sprint_tasks.get_creep_burn(sprint_name)
+    daily_creep = sprint_tasks.get_daily_creep(sprint_name)
+    sprint_burn_df = sprint_tasks.get_total_sprint_creep_and_burn()[sprint_name]
+    release_burnup_df = sprint_tasks.get_release_burnup(releases[-1])
+    release_dates = SprintDates(
+        release_burnup_df.index[0], len(release_burnup_df.index)
+    )
+    # The forecast starts from the scope of the release so far
+    remaining_points = release_burnup_df.loc[:, "scope"].iloc[-1]
+    _, fan, completion = forecast_sprint_tasks(
+        sprint_tasks,
+        total_burn,
+        creep_categories,
+        remaining_points,
+        release=releases[-1],
+        seed=0,
+    )
+    flow_df = sprint_tasks.get_cumulative_flow(sprint_names)
+    flow_dates = SprintDates(flow_df.index[0], len(flow_df.index))
+    lead_times = sprint_tasks.get_lead_times()
+    control_limits = get_control_limits(lead_times)
+    level_matrix = get_level_matrix(read_sheet(survey_path))
+    dimension_means = get_dimension_means(level_matrix)
+
+    def per_sprint(method: Callable[[str], Any]) -> Callable[[], Any]:
+        """Return a function calling the method for every sprint."""
+        return lambda: [method(name) for name in sprint_names]
+
+    benchmarks = [
+        Benchmark(
+            "read_sheet burndown",
+            lambda: read_sheet(
+                burndown_path, sheet_name=None, index_col=None, usecols=BURNDOWN_COLUMNS
+            ),
+            len(sprint_names),
+            "sheets",
+        ),
+        Benchmark(
+            "read_sheet sprint_tasks",
+            lambda: read_sprint_tasks_sheets(sprint_tasks_path),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.__init__",
+            lambda: SprintTasks(sprint_tasks_path, burndown_path),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_total_sprint_creep_and_burn",
+            sprint_tasks.get_total_sprint_creep_and_burn,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_sprint_start_dates",
+            sprint_tasks.get_sprint_start_dates,
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "SprintTasks.get_release_burnup",
+            lambda: [sprint_tasks.get_release_burnup(release) for release in releases],
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_creep_categories",
+            sprint_tasks.get_creep_categories,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_burn_categories",
+            sprint_tasks.get_burn_categories,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_sprint_planning_burn",
+            per_sprint(sprint_tasks.get_sprint_planning_burn),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_creep_burn",
+            per_sprint(sprint_tasks.get_creep_burn),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_daily_creep",
+            per_sprint(sprint_tasks.get_daily_creep),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_total_burn",
+            sprint_tasks.get_total_burn,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_metric_cube",
+            sprint_tasks.get_metric_cube,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_cumulative_flow",
+            lambda: sprint_tasks.get_cumulative_flow(sprint_names),
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "SprintTasks.get_lead_times",
+            sprint_tasks.get_lead_times,
+            n_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_burndown",
+            lambda: plots.plot_burndown(
+                burndown_df, sprint_dates, charts_dir, sprint_name
+            ),
+            len(burndown_df),
+            "days",
+        ),
+        Benchmark(
+            "plots.plot_double_burndown",
+            lambda: plots.plot_double_burndown(
+                sprint_planning_burn_df,
+                creep_burn_df,
+                daily_creep,
+                sprint_dates,
+                charts_dir,
+                sprint_name,
+            ),
+            n_sprint_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_sprint_burn_and_creep",
+            lambda: plots.plot_sprint_burn_and_creep(
+                sprint_burn_df,
+                sprint_dates,
+                charts_dir,
+                sprint_name,
+            ),
+            n_sprint_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_release_burnup",
+            lambda: plots.plot_release_burnup(
+                release_burnup_df, release_dates, charts_dir, releases[-1]
+            ),
+            len(release_burnup_df),
+            "days",
+        ),
+        Benchmark(
+            "plots.plot_sprint_creep_categories",
+            lambda: plots.plot_sprint_creep_categories(
+                creep_categories.loc[[sprint_name]].drop(columns="Release").T,
+                charts_dir,
+                sprint_name,
+            ),
+            n_sprint_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_sprint_categories",
+            lambda: plots.plot_sprint_categories(
+                burn_categories.loc[[sprint_name]].drop(columns="Release").T,
+                charts_dir,
+                sprint_name,
+            ),
+            n_sprint_tasks,
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_burn_trend",
+            lambda: plots.plot_burn_trend(
+                burn_categories.drop(columns="Release"), charts_dir, percentage=False
+            ),
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "plots.plot_creep_trend",
+            lambda: plots.plot_creep_trend(
+                creep_categories.drop(columns="Release"), charts_dir, percentage=False
+            ),
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "plots.plot_burndown_trend",
+            lambda: plots.plot_burndown_trend(total_burn, charts_dir),
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "plots.plot_achievement_trend",
+            lambda: plots.plot_achievement_trend(total_burn, charts_dir),
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "plots.plot_burn_per_person_day",
+            lambda: plots.plot_burn_per_person_day(total_burn, charts_dir),
+            len(sprint_names),
+            "sprints",
+        ),
+        Benchmark(
+            "forecast.forecast_sprint_tasks",
+            lambda: forecast_sprint_tasks(
+                sprint_tasks,
+                total_burn,
+                creep_categories,
+                remaining_points,
+                release=releases[-1],
+                seed=0,
+            ),
+            100_000,
+            "trials",
+        ),
+        Benchmark(
+            "plots.plot_release_forecast",
+            lambda: plots.plot_release_forecast(
+                release_burnup_df, fan, completion, charts_dir, releases[-1]
+            ),
+            len(fan),
+            "sprints",
+        ),
+        Benchmark(
+            "plots.plot_cumulative_flow",
+            lambda: plots.plot_cumulative_flow(flow_df, flow_dates, charts_dir, "all"),
+            len(flow_df),
+            "days",
+        ),
+        Benchmark(
+            "plots.plot_lead_time_histogram",
+            lambda: plots.plot_lead_time_histogram(lead_times, charts_dir),
+            len(lead_times),
+            "tasks",
+        ),
+        Benchmark(
+            "plots.plot_lead_time_control_chart",
+            lambda: plots.plot_lead_time_control_chart(
+                lead_times, control_limits, charts_dir
+            ),
+            len(lead_times),
+            "tasks",
+        ),
+        Benchmark(
+            "survey.get_agile_maturity",
+            lambda: get_agile_maturity(survey_path),
+            len(level_matrix),
+            "answers",
+        ),
+        Benchmark(
+            "survey.plot_agile_maturity",
+            lambda: plot_agile_maturity(dimension_means, charts_dir),
+            len(dimension_means),
+            "rounds",
+        ),
+        Benchmark(
+            "survey.plot_agile_maturity_trends",
+            lambda: plot_agile_maturity_trends(dimension_means, charts_dir),
+            len(dimension_means),
+            "rounds",
+        ),
+    ]
+    return benchmarks
+
+
+def get_startup_benchmarks(data_dir: Path) -> List[Benchmark]:
+    """Return the benchmarks of starting the command line interfaces.
+
+    Each benchmark runs python in a new process, so it includes the interpreter
+    startup and the imports. The daily update stores the remaining points of the
+    first day in the generated burndown spreadsheet, as burndown.burndown -p does.
+
+    Args:
+        data_dir (Path): Directory containing the spreadsheets
+
+    Returns:
+        List[Benchmark]: The benchmarks
+    """
+    import openpyxl
+
+    burndown_path = data_dir.joinpath("burndown.xlsx")
+    workbook = openpyxl.load_workbook(burndown_path, read_only=True)
+    first_day = workbook.worksheets[0].cell(row=2, column=1).value
+    workbook.close()
+    daily_update = (
+        "from datetime import datetime; "
+        "from burndown.excel_io import save_indexed_values; "
+        f"save_indexed_values({str(burndown_path)!r}, 'remaining', "
+        f"{{None: {{datetime.fromisoformat({first_day.isoformat()!r}): 10.0}}}})"
+    )
+
+    def run_python(*args: str) -> Callable[[], Any]:
+        """Return a function running python with the arguments."""
+        return lambda: subprocess.run(
+            [sys.executable, *args], cwd=ROOT_PATH, capture_output=True, check=True
+        )
+
+    return [
+        *[
+            Benchmark(
+                f"startup {module} --help",
+                run_python("-m", module, "--help"),
+                1,
+                "runs",
+            )
+            for module in (
+                "burndown",
+                "burndown.burndown",
+                "survey.plot_agile_maturity",
+            )
+        ],
+        Benchmark("startup daily update", run_python("-c", daily_update), 1, "runs"),
+    ]
+
+
+def measure(benchmark: Benchmark, size: str, repeats: int = 3) -> Measurement:
+    """Measure the peak memory and the timings of a benchmark.
+
+    The peak memory is measured in a first run, which also warms up the caches.
+    The timings are measured in the following runs without tracing the memory, as
+    tracing slows down the allocations.
+
+    Args:
+        benchmark (Benchmark): The benchmark to measure
+        size (str): The name of the size of the spreadsheets
+        repeats (int, optional): The number of timed runs. Defaults to 3.
+
+    Returns:
+        Measurement: The timings and peak memory
+    """
+    # The functions print the paths of the saved charts
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            baseline_memory = tracemalloc.get_traced_memory()[0]
+            benchmark.function()
+            peak_memory = tracemalloc.get_traced_memory()[1] - baseline_memory
+        finally:
+            tracemalloc.stop()
+
+        timings = list()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            benchmark.function()
+            timings.append(time.perf_counter() - start)
+
+    return Measurement(
+        size=size,
+        name=benchmark.name,
+        n_items=benchmark.n_items,
+        unit=benchmark.unit,
+        timings=tuple(timings),
+        peak_memory=peak_memory,
+    )
+
+
+def run_benchmarks(
+    sizes: Sequence[str],
+    repeats: int = 3,
+    name_filters: Optional[Sequence[str]] = None,
+    configs: Optional[dict] = None,
+) -> List[Measurement]:
+    """Generate the spreadsheets of each size and measure the benchmarks on them.
+
+    Args:
+        sizes (Sequence[str]): The sizes to run (keys of the configs)
+        repeats (int, optional): The number of timed runs. Defaults to 3.
+        name_filters (Optional[Sequence[str]], optional): Only run the benchmarks
+            whose name contains one of these strings. Defaults to None (all
+            benchmarks).
+        configs (Optional[dict], optional): The configuration of each size.
+            Defaults to None (FIXTURE_SIZES).
+
+    Returns:
+        List[Measurement]: The measurements of all the sizes
+    """
+    configs = configs if configs is not None else FIXTURE_SIZES
+    measurements = list()
+    for size in sizes:
+        config: FixtureConfig = configs[size]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir, "data")
+            charts_dir = Path(tmp_dir, "charts")
+            charts_dir.mkdir()
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_fixtures(data_dir, config)
+            for benchmark in [
+                *get_benchmarks(data_dir, charts_dir),
+                *get_startup_benchmarks(data_dir),
+            ]:
+                if name_filters is not None and not any(
+                    name_filter in benchmark.name for name_filter in name_filters
+                ):
+                    continue
+                measurement = measure(benchmark, size, repeats)
+                print_measurement(measurement)
+                measurements.append(measurement)
+    return measurements
+
+
+def print_header(sizes: Sequence[str], configs: Optional[dict] = None) -> None:
+    """Print the configuration of the sizes and the header of the results table.
+
+    Args:
+        sizes (Sequence[str]): The sizes to run (keys of the configs)
+        configs (Optional[dict], optional): The configuration of each size.
+            Defaults to None (FIXTURE_SIZES).
+    """
+    configs = configs if configs is not None else FIXTURE_SIZES
+    for size in sizes:
+        config = configs[size]
+        print(
+            f"{size}: {config.n_releases} releases x {config.n_sprints} sprints x "
+            f"{config.n_tasks} tasks"
+        )
+    print(
+        f"{'Size':<8} {'Benchmark':<45} {'Best (s)':>9} {'Median':>9} "
+        f"{'Throughput':>22} {'Peak (MiB)':>10}"
+    )
+
+
+def print_measurement(measurement: Measurement) -> None:
+    """Print a measurement as a row of the results table.
+
+    Args:
+        measurement (Measurement): The measurement to print
+    """
+    throughput = f"{measurement.throughput:,.0f} {measurement.unit}/s"
+    print(
+        f"{measurement.size:<8} {measurement.name:<45} "
+        f"{measurement.best:>9.4f} {measurement.median:>9.4f} "
+        f"{throughput:>22} {measurement.peak_memory / 2**20:>10.2f}"
+    )
+
+
+def main() -> None:
+    """Benchmark the pipeline on synthetic spreadsheets."""
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline.")
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        default=["small", "medium"],
+        choices=list(FIXTURE_SIZES.keys()),
+        help="Sizes of the synthetic spreadsheets to benchmark",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeats",
+        type=int,
+        default=3,
+        help="Number of timed runs of each benchmark",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        nargs="+",
+        help="Only run the benchmarks whose name contains one of these strings",
+    )
+    args = parser.parse_args()
+
+    print_header(args.sizes)
+    run_benchmarks(args.sizes, args.repeats, args.filter)
+
+
+if __name__ == "__main__":
+    main()
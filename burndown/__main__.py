@@ -0,0 +1,373 @@
+"""Entry point for running several burndown commands on one loaded dataset.
+
+Example:
+    python -m burndown plot sprint double trends -r 2.6 -s 4
+"""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from burndown.metrics import METRIC_FORMATS
+from burndown.options import (
+    AGGREGATION_LABELS,
+    PLOT_TARGETS,
+    RELEASE_TARGETS,
+    SPRINT_TARGETS,
+    WATCH_TARGETS,
+)
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from burndown.targets import SharedData
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    root_path = Path(__file__).parents[1].resolve()
+
+    parser = argparse.ArgumentParser(
+        prog="python -m burndown",
+        description="Run several burndown commands on one loaded dataset.",
+    )
+    parser.add_argument(
+        "--data_dir",
+        type=Path,
+        default=root_path.joinpath("data"),
+        help="Directory containing the spreadsheets",
+    )
+    parser.add_argument(
+        "--charts_dir",
+        type=Path,
+        default=root_path.joinpath("charts"),
+        help="Directory to store the charts to",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plot_parser = subparsers.add_parser(
+        "plot", help="Plot one or more charts from the same loaded data"
+    )
+    plot_parser.add_argument(
+        "targets",
+        nargs="+",
+        choices=PLOT_TARGETS,
+        help="The charts to plot",
+    )
+    plot_parser.add_argument("-r", "--release", type=str, help="Release number")
+    plot_parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
+    plot_parser.add_argument(
+        "-u",
+        "--until_day",
+        type=str,
+        help="Until what day to get the double burndown to (on the form yyyy-mm-dd)",
+    )
+    plot_parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    plot_parser.add_argument(
+        "-a",
+        "--aggregate",
+        default="sprint",
+        choices=list(AGGREGATION_LABELS.keys()),
+        help="Whether to plot the trends per sprint, release or calendar quarter",
+    )
+    plot_parser.add_argument(
+        "--as_of",
+        type=str,
+        help="Plot the sprint tasks as they were at this time (on the form "
+        "yyyy-mm-dd or yyyy-mm-ddThh:mm) from the snapshot archive",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Re-render the charts affected by changes of the spreadsheets",
+    )
+    watch_parser.add_argument(
+        "targets",
+        nargs="*",
+        choices=PLOT_TARGETS,
+        default=list(WATCH_TARGETS),
+        help=f"The charts to keep up to date (defaults to {' '.join(WATCH_TARGETS)})",
+    )
+    watch_parser.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checking the spreadsheets for changes",
+    )
+    watch_parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    watch_parser.add_argument(
+        "-a",
+        "--aggregate",
+        default="sprint",
+        choices=list(AGGREGATION_LABELS.keys()),
+        help="Whether to plot the trends per sprint, release or calendar quarter",
+    )
+
+    metrics_parser = subparsers.add_parser(
+        "metrics", help="Export the metrics of the releases or sprints"
+    )
+    metrics_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help=f"Path to store the metrics to (ending with one of {METRIC_FORMATS})",
+    )
+    metrics_parser.add_argument(
+        "-b",
+        "--by",
+        default="release",
+        choices=["release", "sprint"],
+        help="Whether to export the metrics per release or per sprint",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve the charts and metrics from data kept in memory",
+    )
+    serve_parser.add_argument(
+        "--host", type=str, default="127.0.0.1", help="Host to bind to"
+    )
+    serve_parser.add_argument("-p", "--port", type=int, default=8000, help="Port")
+    serve_parser.add_argument(
+        "-c",
+        "--cache_size",
+        type=int,
+        default=64,
+        help="Maximum number of rendered charts to keep in memory",
+    )
+    serve_parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+
+    snapshot_parser = subparsers.add_parser(
+        "snapshot",
+        help="Archive the changes of the sprint tasks since the last snapshot",
+    )
+
+    close_parser = subparsers.add_parser(
+        "close",
+        help="Copy a finished sprint from the spreadsheets to the compact archive",
+    )
+    close_parser.add_argument(
+        "-r", "--release", type=str, help="Release number", required=True
+    )
+    close_parser.add_argument(
+        "-s", "--sprint_number", type=str, help="Sprint number", required=True
+    )
+    close_parser.add_argument(
+        "--remove_sheets",
+        action="store_true",
+        help="Also remove the sheets of the sprint from the spreadsheets, so that they "
+        "are no longer parsed. The spreadsheets are re-saved with openpyxl, which "
+        "drops their charts, images and pivot tables",
+    )
+
+    for subparser in (
+        plot_parser,
+        watch_parser,
+        metrics_parser,
+        serve_parser,
+        snapshot_parser,
+        close_parser,
+    ):
+        add_profile_argument(subparser)
+    return parser
+
+
+def run_plot(args: argparse.Namespace, data: "SharedData") -> None:
+    """Plot the requested targets.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments of the plot command
+        data (SharedData): The data shared between the targets
+    """
+    import pandas as pd
+
+    from burndown.targets import render_target
+
+    days_off = (
+        [pd.to_datetime(date) for date in args.days_off]
+        if args.days_off is not None
+        else None
+    )
+    until_day = None if args.until_day is None else pd.to_datetime(args.until_day)
+
+    args.charts_dir.mkdir(parents=True, exist_ok=True)
+
+    # Load everything up front when any target needs the sprint tasks, so that the
+    # burndown sheets are shared as well
+    if any(target != "burndown" for target in args.targets):
+        data.load()
+
+    # Remove duplicates while keeping the order
+    for target in dict.fromkeys(args.targets):
+        render_target(
+            target,
+            data,
+            args.charts_dir,
+            sprint_name=(
+                f"{args.release}-{args.sprint_number}"
+                if args.sprint_number is not None
+                else None
+            ),
+            release=args.release,
+            days_off=days_off,
+            until_day=until_day,
+            aggregate=args.aggregate,
+        )
+
+
+def run_close(args: argparse.Namespace, data: "SharedData") -> None:
+    """Archive a finished sprint, and remove its sheets from the spreadsheets if asked.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments of the close command
+        data (SharedData): The data of the sprint
+    """
+    from burndown.excel_io import remove_sheets
+    from burndown.sprint_archive import ARCHIVE_DIR_NAME, SprintArchive
+
+    sprint_name = f"{args.release}-{args.sprint_number}"
+    archive = SprintArchive(args.data_dir.joinpath(ARCHIVE_DIR_NAME))
+    with data.timer.stage("close"):
+        archive.close_sprint(data.sprint_tasks, sprint_name)
+        if args.remove_sheets:
+            for path in (
+                data.burndown_path,
+                data.sprint_tasks_path,
+                data.capacity_path,
+            ):
+                if path.suffix == ".xlsx" and path.exists():
+                    remove_sheets(path, [sprint_name])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse the arguments and dispatch the commands.
+
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments.
+            Defaults to None (sys.argv).
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "plot":
+        if any(target in SPRINT_TARGETS for target in args.targets) and (
+            args.release is None or args.sprint_number is None
+        ):
+            parser.error(
+                f"-r/--release and -s/--sprint_number are required for {SPRINT_TARGETS}"
+            )
+        if any(target in RELEASE_TARGETS for target in args.targets) and (
+            args.release is None
+        ):
+            parser.error(f"-r/--release is required for {RELEASE_TARGETS}")
+    if args.command == "metrics" and args.output.suffix not in METRIC_FORMATS:
+        parser.error(f"The output must end with one of {METRIC_FORMATS}")
+
+    with profiling(args.profile, args.profile_memory):
+        # pandas and matplotlib are slow to import, so only import them once the
+        # arguments are known to be valid
+        import pandas as pd
+
+        from burndown.targets import SharedData, StageTimer
+
+        timer = StageTimer()
+        # Only the plots can be made from a snapshot of the sprint tasks
+        as_of = (
+            pd.to_datetime(args.as_of)
+            if args.command == "plot" and args.as_of is not None
+            else None
+        )
+        data = SharedData(args.data_dir, timer, as_of)
+        if args.command == "plot":
+            run_plot(args, data)
+        elif args.command == "watch":
+            from burndown.watch import watch
+
+            days_off = (
+                [pd.to_datetime(date) for date in args.days_off]
+                if args.days_off is not None
+                else None
+            )
+            try:
+                watch(
+                    data,
+                    args.charts_dir,
+                    targets=args.targets,
+                    interval=args.interval,
+                    days_off=days_off,
+                    aggregate=args.aggregate,
+                )
+            except KeyboardInterrupt:
+                print("Stopped watching")
+        elif args.command == "metrics":
+            from burndown.metrics import get_sprint_tasks_metrics, save_metrics
+
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            sprint_tasks = data.sprint_tasks
+            with timer.stage("metrics"):
+                save_metrics(
+                    get_sprint_tasks_metrics(sprint_tasks, args.by), args.output
+                )
+        elif args.command == "snapshot":
+            from burndown.snapshots import SNAPSHOT_DIR_NAME, SnapshotArchive
+            from burndown.sprint_tasks import read_sprint_tasks_sheets
+
+            archive = SnapshotArchive(args.data_dir.joinpath(SNAPSHOT_DIR_NAME))
+            with timer.stage("load"):
+                sprint_tasks_sheets = read_sprint_tasks_sheets(
+                    data.sprint_tasks_path, with_key=True
+                )
+            with timer.stage("snapshot"):
+                snapshot_path = archive.capture(sprint_tasks_sheets)
+            if snapshot_path is None:
+                print("The sprint tasks did not change since the last snapshot")
+            else:
+                print(f"Saving snapshot to: {snapshot_path}")
+        elif args.command == "close":
+            run_close(args, data)
+        elif args.command == "serve":
+            from burndown.server import serve
+
+            days_off = (
+                [pd.to_datetime(date) for date in args.days_off]
+                if args.days_off is not None
+                else None
+            )
+            try:
+                serve(
+                    data,
+                    host=args.host,
+                    port=args.port,
+                    cache_size=args.cache_size,
+                    days_off=days_off,
+                )
+            except KeyboardInterrupt:
+                print("Stopped serving")
+        timer.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,21 @@
 """Module containing functions for the sprint burndown."""
 
 import argparse
+import csv
+import sys
+from datetime import date, datetime
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO
 
-import pandas as pd
+from burndown.excel_io import save_indexed_values
+from burndown.profiling import add_profile_argument, profiling
 
-from burndown.excel_io import read_sheet, save_sheet
-from burndown.sprint_dates import SprintDates
+if TYPE_CHECKING:
+    from burndown.sprint_dates import SprintDates
 
 
 def get_ideal_burndown(
-    sprint_dates: SprintDates, storypoints_start: int
+    sprint_dates: "SprintDates", storypoints_start: int
 ) -> List[float]:
     """Get the ideal burndown.
 
@@ -35,28 +39,103 @@ def get_ideal_burndown(
     return ideal_burndown
 
 
-if __name__ == "__main__":
+def read_remaining_records(
+    records_file: TextIO, default_sheet_name: Optional[str] = None
+) -> Dict[Optional[str], Dict[datetime, float]]:
+    """Read the remaining storypoints of several days from a CSV file.
+
+    The file must have a header with the columns date (on the form yyyy-mm-dd) and
+    remaining, and optionally sprint (the name of the sheet, e.g. 2.5-5).
+    If a day occurs several times, the last record is used.
+
+    Args:
+        records_file (TextIO): The opened CSV file
+        default_sheet_name (Optional[str], optional): Sheet of the records without
+            a sprint. Defaults to None (the first sheet).
+
+    Raises:
+        ValueError: If a record cannot be parsed
+
+    Returns:
+        Dict[Optional[str], Dict[datetime, float]]: The remaining storypoints by
+            date, by sheet name
+    """
+    reader = csv.DictReader(records_file)
+    missing_columns = {"date", "remaining"} - set(reader.fieldnames or list())
+    if len(missing_columns) != 0:
+        raise ValueError(f"The records are missing the columns {missing_columns}")
+
+    sheet_records: Dict[Optional[str], Dict[datetime, float]] = dict()
+    for record in reader:
+        sheet_name = (record.get("sprint") or "").strip() or default_sheet_name
+        try:
+            date_ = datetime.strptime(record["date"].strip(), "%Y-%m-%d")
+            remaining = float(record["remaining"])
+        except (AttributeError, TypeError, ValueError) as error:
+            raise ValueError(f"Line {reader.line_num}: {error}") from error
+        sheet_records.setdefault(sheet_name, dict())[date_] = remaining
+    return sheet_records
+
+
+def main() -> None:
+    """Add the remaining storypoints of one or more days to the burndown sheets."""
     root_path = Path(__file__).parents[1].resolve()
     sheet_dir = root_path.joinpath("data")
     sheet_path = sheet_dir.joinpath("burndown.xlsx")
 
-    with pd.ExcelFile(str(sheet_path)) as xl:
-        sheet_name = xl.sheet_names[0]
-
-    df_to_save = read_sheet(sheet_path, sheet_name=sheet_name, index_col="date")
-
     parser = argparse.ArgumentParser(
         description="Add storypoints for the current sheet."
     )
-    parser.add_argument("-p", "--story_points", type=str, help="Remaining story points")
+    parser.add_argument(
+        "-p", "--story_points", type=float, help="Remaining story points"
+    )
     parser.add_argument(
         "-d", "--date", default=None, type=str, help="Date on the form yyyy-mm-dd"
     )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=str,
+        help="CSV file with the columns sprint, date and remaining ('-' for stdin)",
+    )
+    parser.add_argument(
+        "-r", "--release", type=str, help="Release number (defaults to first sheet)"
+    )
+    parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    date_ = (
-        pd.to_datetime(args.date) if args.date is not None else pd.to_datetime("today")
-    )
-    df_to_save.loc[date_.normalize(), "remaining"] = args.story_points
+    if (args.story_points is None) == (args.file is None):
+        parser.error("Give either -p/--story_points or -f/--file")
+    if (args.release is None) != (args.sprint_number is None):
+        parser.error("-r/--release and -s/--sprint_number must be given together")
+
+    with profiling(args.profile, args.profile_memory):
+        sheet_name = (
+            f"{args.release}-{args.sprint_number}" if args.release is not None else None
+        )
+
+        try:
+            if args.file is not None:
+                if args.file == "-":
+                    sheet_values = read_remaining_records(sys.stdin, sheet_name)
+                else:
+                    with open(args.file, newline="") as records_file:
+                        sheet_values = read_remaining_records(records_file, sheet_name)
+            else:
+                date_ = (
+                    datetime.strptime(args.date, "%Y-%m-%d")
+                    if args.date is not None
+                    else datetime.combine(date.today(), datetime.min.time())
+                )
+                sheet_values = {sheet_name: {date_: args.story_points}}
 
-    save_sheet(df_to_save=df_to_save, path=sheet_path, sheet_name=sheet_name)
+            save_indexed_values(
+                path=sheet_path, column="remaining", sheet_values=sheet_values
+            )
+        except ValueError as error:
+            parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,20 @@
 
 import argparse
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from burndown.burndown import get_ideal_burndown
 from burndown.excel_io import save_sheet
-from burndown.sprint_dates import SprintDates
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from burndown.sprint_dates import SprintDates
 
 
 def start_new_sprint(
     sheet_path: Path,
     sheet_name: str,
-    sprint_dates: SprintDates,
+    sprint_dates: "SprintDates",
     storypoints_start: int,
 ) -> None:
     """Start a new sprint.
@@ -28,6 +30,8 @@ def start_new_sprint(
         start_date (Timestamp): Start date of sprint
         sprint_length (int): Days planned for the sprint
     """
+    import pandas as pd
+
     ideal_burndown = get_ideal_burndown(sprint_dates, storypoints_start)
     remaining = [None for _ in range(len(sprint_dates.dates))]
     remaining[0] = storypoints_start
@@ -45,12 +49,13 @@ def start_new_sprint(
     save_sheet(burndown_df, sheet_path, sheet_name)
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Start a new sprint in the burndown spreadsheet."""
     root_path = Path(__file__).parents[1].resolve()
 
     sheet_dir = root_path.joinpath("data")
     sheet_dir.mkdir(parents=True, exist_ok=True)
-    sheet_path_ = sheet_dir.joinpath("burndown.xlsx")
+    sheet_path = sheet_dir.joinpath("burndown.xlsx")
 
     parser = argparse.ArgumentParser(description="Start a sprint.")
     parser.add_argument(
@@ -94,30 +99,40 @@ if __name__ == "__main__":
         help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
     )
 
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    if args.start_date is not None:
-        date = pd.to_datetime(args.start_date)
-    else:
-        date = pd.to_datetime("today")
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
 
-    days_off = (
-        [pd.to_datetime(date) for date in args.days_off]
-        if args.days_off is not None
-        else list()
-    )
+        from burndown.sprint_dates import SprintDates
 
-    if args.count_mid_day:
-        days_off.append((pd.to_datetime(date) + pd.DateOffset(args.length)).date())
-        args.length += 1
+        if args.start_date is not None:
+            date = pd.to_datetime(args.start_date)
+        else:
+            date = pd.to_datetime("today")
 
-    sprint_dates_ = SprintDates(date, args.length, days_off)
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else list()
+        )
 
-    sheet_name_ = f"{args.release}-{args.sprint_number}"
+        if args.count_mid_day:
+            days_off.append((pd.to_datetime(date) + pd.DateOffset(args.length)).date())
+            args.length += 1
 
-    start_new_sprint(
-        sheet_path=sheet_path_,
-        sheet_name=sheet_name_,
-        sprint_dates=sprint_dates_,
-        storypoints_start=args.storypoints_start,
-    )
+        sprint_dates = SprintDates(date, args.length, days_off)
+
+        sheet_name = f"{args.release}-{args.sprint_number}"
+
+        start_new_sprint(
+            sheet_path=sheet_path,
+            sheet_name=sheet_name,
+            sprint_dates=sprint_dates,
+            storypoints_start=args.storypoints_start,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Module for loading the sprint tasks from CSV exports of the issue tracker."""
+
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import pandas as pd
+
+from burndown.profiling import span
+from burndown.schema import TASK_KEY_COLUMN
+
+SPRINT_COLUMN = "sprint"
+DATE_COLUMNS = ("creep_date", "Created", "Date Closed")
+# Explicit dtypes avoid the type inference of every chunk
+COLUMN_DTYPES = {
+    "burned": "float64",
+    "creep": "float64",
+    "Original estimate": "float64",
+    "Points": "float64",
+    "category": "object",
+    "creep_category": "object",
+    SPRINT_COLUMN: "object",
+    TASK_KEY_COLUMN: "object",
+}
+
+
+def _read_csv_chunks(
+    path: Path,
+    usecols: Sequence[str],
+    chunksize: int,
+    optional_columns: Sequence[str] = (),
+) -> List[pd.DataFrame]:
+    """Read a CSV file in chunks.
+
+    Args:
+        path (Path): Path to the CSV file
+        usecols (Sequence[str]): Columns to parse
+        chunksize (int): Number of rows to parse at a time
+        optional_columns (Sequence[str], optional): Columns to parse if the file
+            has them. Defaults to ().
+
+    Returns:
+        List[pd.DataFrame]: The chunks of the file
+    """
+    usecols = list(usecols)
+    if len(optional_columns) != 0:
+        header = pd.read_csv(path, nrows=0).columns
+        usecols += [column for column in optional_columns if column in header]
+    with span(f"read {path.name}", "load"), pd.read_csv(
+        path,
+        usecols=usecols,
+        dtype={
+            column: dtype
+            for column, dtype in COLUMN_DTYPES.items()
+            if column in usecols
+        },
+        parse_dates=[column for column in DATE_COLUMNS if column in usecols],
+        chunksize=chunksize,
+    ) as reader:
+        return list(reader)
+
+
+def read_sprint_tasks_csv(
+    path: Path,
+    usecols: Sequence[str],
+    chunksize: int = 100_000,
+    optional_columns: Sequence[str] = (),
+) -> Dict[str, pd.DataFrame]:
+    """Read the sprint tasks of all the sprints from one CSV file.
+
+    The file must contain a sprint column with the name of the sprint (e.g. 2.5-5) of
+    each task.
+
+    Args:
+        path (Path): Path to the CSV file
+        usecols (Sequence[str]): Columns to parse (besides the sprint column)
+        chunksize (int, optional): Number of rows to parse at a time.
+            Defaults to 100_000.
+        optional_columns (Sequence[str], optional): Columns to parse if the file
+            has them. Defaults to ().
+
+    Returns:
+        Dict[str, pd.DataFrame]: The sprint tasks by the name of the sprint
+    """
+    chunks = _read_csv_chunks(
+        path, [*usecols, SPRINT_COLUMN], chunksize, optional_columns
+    )
+    if len(chunks) == 0:
+        return dict()
+    tasks_df = pd.concat(chunks, ignore_index=True)
+    return {
+        str(sprint_name): sprint_df.drop(columns=SPRINT_COLUMN).reset_index(drop=True)
+        for sprint_name, sprint_df in tasks_df.groupby(SPRINT_COLUMN, sort=False)
+    }
+
+
+def read_sprint_tasks_csv_dir(
+    csv_dir: Path,
+    usecols: Sequence[str],
+    chunksize: int = 100_000,
+    optional_columns: Sequence[str] = (),
+) -> Dict[str, pd.DataFrame]:
+    """Read the sprint tasks from a directory with one CSV file per sprint.
+
+    The files must be named after the sprint (e.g. 2.5-5.csv).
+
+    Args:
+        csv_dir (Path): Directory containing the CSV files
+        usecols (Sequence[str]): Columns to parse
+        chunksize (int, optional): Number of rows to parse at a time.
+            Defaults to 100_000.
+        optional_columns (Sequence[str], optional): Columns to parse if the files
+            have them. Defaults to ().
+
+    Returns:
+        Dict[str, pd.DataFrame]: The sprint tasks by the name of the sprint
+    """
+    sprint_tasks = dict()
+    for path in sorted(csv_dir.glob("*.csv")):
+        chunks = _read_csv_chunks(path, usecols, chunksize, optional_columns)
+        sprint_tasks[path.stem] = (
+            pd.concat(chunks, ignore_index=True)
+            if len(chunks) != 0
+            else pd.DataFrame(columns=usecols)
+        )
+    return sprint_tasks
@@ -0,0 +1,84 @@
+"""Module for computing cumulative flow diagrams from the events of the tasks."""
+
+import numpy as np
+import pandas as pd
+
+# The states of a task in the order they are stacked from the bottom
+FLOW_STATES = ("closed", "creep", "in_sprint", "backlog")
+FLOW_LABELS = {
+    "closed": "Closed",
+    "creep": "Creep added",
+    "in_sprint": "In sprint",
+    "backlog": "Created",
+}
+
+
+def get_cumulative_flow(
+    created: pd.Series,
+    entered: pd.Series,
+    closed: pd.Series,
+    is_creep: pd.Series,
+    values: pd.Series,
+    dates: pd.DatetimeIndex,
+) -> pd.DataFrame:
+    """Get the value of the tasks in each state at the end of every day.
+
+    A task is in the backlog from it is created until it enters the sprint (at the
+    sprint planning or when it creeps), then in the sprint (or creep) until it is
+    closed. Every change of state is an event adding the value of the task to one
+    state and removing it from another. The events are summed onto the days and
+    accumulated, so the states of all the days are computed in one sweep over the
+    events instead of filtering the tasks of every day.
+
+    Args:
+        created (pd.Series): The date each task was created
+        entered (pd.Series): The date each task entered the sprint
+        closed (pd.Series): The date each task was closed (NaT if still open)
+        is_creep (pd.Series): Whether each task entered as creep
+        values (pd.Series): The value of each task (e.g. its points or 1)
+        dates (pd.DatetimeIndex): The days of the diagram. Events before the first
+            day count from the first day, events after the last day are ignored.
+
+    Returns:
+        pd.DataFrame: The value in each of FLOW_STATES at the end of each day
+    """
+    n_tasks = len(entered)
+    # The events of a task must be in order, so tasks closed before they entered
+    # enter when they are closed, and tasks created after they entered (or without
+    # a creation date) are created when they enter
+    closed = closed.to_numpy(dtype="datetime64[ns]")
+    entered = entered.to_numpy(dtype="datetime64[ns]")
+    entered = np.where(~np.isnat(closed) & (closed < entered), closed, entered)
+    created = created.to_numpy(dtype="datetime64[ns]")
+    created = np.where(np.isnat(created) | (created > entered), entered, created)
+    values = values.to_numpy(dtype=float)
+    sprint_state = np.where(
+        is_creep.to_numpy(dtype=bool),
+        FLOW_STATES.index("creep"),
+        FLOW_STATES.index("in_sprint"),
+    )
+    backlog = np.full(n_tasks, FLOW_STATES.index("backlog"))
+
+    # Each task is created, enters and may be closed
+    event_dates = np.concatenate([created, entered, entered, closed, closed])
+    event_states = np.concatenate(
+        [
+            backlog,
+            backlog,
+            sprint_state,
+            sprint_state,
+            np.full(n_tasks, FLOW_STATES.index("closed")),
+        ]
+    )
+    event_values = np.concatenate([values, -values, values, -values, values])
+
+    valid = ~np.isnat(event_dates) & (event_dates <= dates[-1].to_datetime64())
+    day = np.clip(dates.searchsorted(event_dates[valid], side="right") - 1, 0, None)
+    flow = np.bincount(
+        day * len(FLOW_STATES) + event_states[valid],
+        weights=event_values[valid],
+        minlength=len(dates) * len(FLOW_STATES),
+    ).reshape(len(dates), len(FLOW_STATES))
+    return pd.DataFrame(
+        np.cumsum(flow, axis=0), index=pd.Index(dates, name="date"), columns=FLOW_STATES
+    )
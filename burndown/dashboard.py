@@ -0,0 +1,171 @@
+"""Script for generating a self-contained HTML dashboard of all the sprints."""
+
+import argparse
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from burndown.sprint_tasks import SprintTasks
+
+TEMPLATE_PATH = Path(__file__).parent.joinpath("dashboard_template.html")
+
+
+def _to_list(values: Any, decimals: int = 2) -> List[float]:
+    """Convert values to a JSON friendly list of rounded floats.
+
+    Args:
+        values (Any): Array like values to convert
+        decimals (int, optional): Number of decimals to keep. Defaults to 2.
+
+    Returns:
+        List[float]: The rounded values where NaN are replaced by None
+    """
+    import numpy as np
+
+    rounded = np.round(np.asarray(values, dtype=float), decimals)
+    return [None if np.isnan(value) else float(value) for value in rounded]
+
+
+def get_dashboard_data(sprint_tasks: "SprintTasks") -> Dict[str, Any]:
+    """Get the data of all the sprints in a compact form.
+
+    All the sprints share one date axis, so each sprint only stores the offset of its
+    first day into the axis.
+    The categories are stored once, and referred to by their position.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+
+    Returns:
+        Dict[str, Any]: The data of the dashboard
+    """
+    import pandas as pd
+
+    sprint_start_dates = sprint_tasks.get_sprint_start_dates().sort_values()
+    sprint_names = list(sprint_start_dates.index)
+    dates = pd.date_range(
+        sprint_start_dates.min(),
+        max(sprint_tasks.burndown_sheets[name].index.max() for name in sprint_names),
+        freq="D",
+    )
+
+    burn_categories = sprint_tasks.get_burn_categories()
+    creep_categories = sprint_tasks.get_creep_categories()
+    burn_category_names = [col for col in burn_categories.columns if col != "Release"]
+    creep_category_names = [col for col in creep_categories.columns if col != "Release"]
+
+    # The burndowns of all the sprints are computed at once
+    metric_cube = sprint_tasks.get_metric_cube(sprint_names)
+    sprints = list()
+    for sprint_name in sprint_names:
+        burndown_df = sprint_tasks.burndown_sheets[sprint_name]
+        metrics_df = metric_cube.get_sprint(sprint_name)
+        daily_creep = metrics_df.loc[:, list(metric_cube.metrics[2:])]
+        sprints.append(
+            {
+                "name": sprint_name,
+                "release": sprint_name.split("-")[0],
+                "start": int(dates.get_loc(burndown_df.index.min())),
+                "ideal": _to_list(burndown_df.loc[:, "ideal_burndown"]),
+                "remaining": _to_list(metrics_df.loc[:, "planning_remaining"]),
+                "creep_remaining": _to_list(metrics_df.loc[:, "creep_remaining"]),
+                # Only the categories which crept in this sprint are stored
+                "daily_creep": {
+                    str(creep_category_names.index(category)): _to_list(values)
+                    for category, values in daily_creep.items()
+                    if (values != 0).any()
+                },
+                "burn_categories": _to_list(
+                    burn_categories.loc[sprint_name, burn_category_names]
+                ),
+                "creep_categories": _to_list(
+                    creep_categories.loc[sprint_name, creep_category_names]
+                ),
+            }
+        )
+
+    total_burn = sprint_tasks.get_total_burn().reindex(sprint_names)
+    trends = {
+        column: _to_list(total_burn.loc[:, column])
+        for column in (
+            "total_points",
+            "sprint_start_burned",
+            "achievement",
+            "burn_per_person_day",
+            "rolling_average",
+        )
+    }
+
+    return {
+        "first_date": str(dates[0].date()),
+        "n_dates": len(dates),
+        "burn_categories": burn_category_names,
+        "creep_categories": creep_category_names,
+        "sprints": sprints,
+        "trends": trends,
+    }
+
+
+def render_dashboard(dashboard_data: Dict[str, Any]) -> str:
+    """Render the dashboard data into a self-contained HTML page.
+
+    Args:
+        dashboard_data (Dict[str, Any]): The data of the dashboard
+
+    Returns:
+        str: The HTML page
+    """
+    data_json = json.dumps(dashboard_data, separators=(",", ":"))
+    # Make sure the data cannot close the script tag it is embedded in
+    data_json = data_json.replace("</", "<\\/")
+    template = TEMPLATE_PATH.read_text(encoding="utf-8")
+    return template.replace("/*DASHBOARD_DATA*/", data_json)
+
+
+def save_dashboard(sprint_tasks: "SprintTasks", save_path: Path) -> None:
+    """Generate and save the dashboard.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        save_path (Path): Path to store the HTML file to
+    """
+    html = render_dashboard(get_dashboard_data(sprint_tasks))
+    print(f"Saving dashboard to: {save_path}")
+    save_path.write_text(html, encoding="utf-8")
+
+
+def main() -> None:
+    """Generate the dashboard of all the sprints."""
+    root_path = Path(__file__).parents[1].resolve()
+    charts_dir = root_path.joinpath("charts")
+    sheet_dir = root_path.joinpath("data")
+    burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+    parser = argparse.ArgumentParser(description="Generate the HTML dashboard.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=charts_dir.joinpath("dashboard.html"),
+        help="Path to store the dashboard to",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=find_sprint_tasks_path(sheet_dir),
+            burndown_path=burndown_path,
+        )
+        save_dashboard(sprint_tasks, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 """Module for storing and loading to excel."""
 
 import string
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
 
-import pandas as pd
+from burndown.profiling import span
 
+# pandas is imported where it is used, so that save_indexed_values does not pay for it
+if TYPE_CHECKING:
+    import pandas as pd
 
-def save_sheet(df_to_save: pd.DataFrame, path: Path, sheet_name: str) -> None:
+
+def save_sheet(df_to_save: "pd.DataFrame", path: Path, sheet_name: str) -> None:
     """Store a dateframe to a sheet.
 
     Args:
@@ -15,12 +20,15 @@ def save_sheet(df_to_save: pd.DataFrame, path: Path, sheet_name: str) -> None:
         path (Path): Path to excel file to store sheet to
         sheet_name (str): Name of sheet
     """
+    import pandas as pd
+
     print(f"Saving sheet '{sheet_name}' to: {path}")
-    writer = pd.ExcelWriter(
-        path, engine="openpyxl", mode="a", if_sheet_exists="replace"
-    )
-    df_to_save.to_excel(writer, sheet_name=sheet_name)
-    writer.save()
+    # Sheets can only be appended to existing files
+    mode, if_sheet_exists = ("a", "replace") if path.exists() else ("w", None)
+    with pd.ExcelWriter(
+        path, engine="openpyxl", mode=mode, if_sheet_exists=if_sheet_exists
+    ) as writer:
+        df_to_save.to_excel(writer, sheet_name=sheet_name)
 
 
 def read_sheet(
@@ -28,9 +36,11 @@ def read_sheet(
     sheet_name: Optional[str] = None,
     index_col: Optional[str] = None,
     usecols: Optional[List] = None,
-) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+) -> Union["pd.DataFrame", Dict[str, "pd.DataFrame"]]:
     """Load a dataframe from a sheet.
 
+    Each sheet is parsed in its own span when profiling.
+
     Args:
         path (Path): Path to excel file to load from
         sheet_name (Optional[str], optional): Name of sheet. Defaults to None.
@@ -40,9 +50,20 @@ def read_sheet(
     Returns:
         Union[pd.DataFrame, Dict[str, pd.DataFrame]]: Content of sheet(s)
     """
-    return pd.read_excel(
-        str(path), sheet_name=sheet_name, index_col=index_col, usecols=usecols
-    )
+    import pandas as pd
+
+    with span(f"read {path.name}", "load"):
+        with span(f"open {path.name}", "load"):
+            workbook = pd.ExcelFile(str(path))
+        with workbook:
+            sheet_names = workbook.sheet_names if sheet_name is None else [sheet_name]
+            sheets = dict()
+            for name in sheet_names:
+                with span(f"parse {path.name}", "load", sheet=name):
+                    sheets[name] = workbook.parse(
+                        name, index_col=index_col, usecols=usecols
+                    )
+    return sheets if sheet_name is None else sheets[sheet_name]
 
 
 def read_cell(
@@ -62,16 +83,111 @@ def read_cell(
     Returns:
         Any: Value of the cell
     """
+    import pandas as pd
+
     # Map column to the index number
     alphabet_dict = dict(enumerate(string.ascii_uppercase))
     reverse_alphabet_dict = {number: letter for letter, number in alphabet_dict.items()}
     column = reverse_alphabet_dict[column]
 
-    return pd.read_excel(
-        str(path),
-        sheet_name=sheet_name,
-        skiprows=row - 1,
-        usecols=[column],
-        nrows=1,
-        header=None,
-    ).values[0][0]
+    with span(f"read cell {path.name}", "load", sheet=sheet_name):
+        return pd.read_excel(
+            str(path),
+            sheet_name=sheet_name,
+            skiprows=row - 1,
+            usecols=[column],
+            nrows=1,
+            header=None,
+        ).values[0][0]
+
+
+def save_indexed_values(
+    path: Path,
+    column: str,
+    sheet_values: Mapping[Optional[str], Mapping[datetime, Any]],
+) -> List[str]:
+    """Store values to the rows of sheets with the given indices.
+
+    Only openpyxl is used, so that updating the values is fast enough to be done
+    from shell prompts and cron jobs.
+    The workbook is written once, and only if all the sheets exist.
+    Rows are appended for the indices which are not in the sheet.
+
+    Args:
+        path (Path): Path to excel file to store the values to
+        column (str): Name of the column to store the values to
+        sheet_values (Mapping[Optional[str], Mapping[datetime, Any]]): The values
+            to store by the index (the first column) of their rows, by the name of
+            the sheet (None for the first sheet)
+
+    Raises:
+        ValueError: If a sheet or the column does not exist
+
+    Returns:
+        List[str]: Names of the sheets the values were stored to
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(str(path))
+    missing_sheets = [
+        sheet_name
+        for sheet_name in sheet_values
+        if sheet_name is not None and sheet_name not in workbook.sheetnames
+    ]
+    if len(missing_sheets) != 0:
+        raise ValueError(f"No sheets named {missing_sheets} in {path}")
+
+    sheet_names = list()
+    for sheet_name, values in sheet_values.items():
+        sheet = (
+            workbook[sheet_name] if sheet_name is not None else workbook.worksheets[0]
+        )
+        header = [cell.value for cell in sheet[1]]
+        if column not in header:
+            raise ValueError(f"No column named '{column}' in sheet '{sheet.title}'")
+        column_number = header.index(column) + 1
+
+        # Look up the rows once instead of scanning the sheet for every value
+        row_numbers = {
+            row[0].value: row[0].row for row in sheet.iter_rows(min_row=2, max_col=1)
+        }
+        for index_value, value in values.items():
+            if index_value not in row_numbers:
+                row_numbers[index_value] = sheet.max_row + 1
+                sheet.cell(row=row_numbers[index_value], column=1, value=index_value)
+            sheet.cell(row=row_numbers[index_value], column=column_number, value=value)
+
+        print(f"Saving {len(values)} '{column}' values to sheet '{sheet.title}'")
+        sheet_names.append(sheet.title)
+
+    print(f"Saving workbook to: {path}")
+    workbook.save(str(path))
+    return sheet_names
+
+
+def remove_sheets(path: Path, sheet_names: List[str]) -> List[str]:
+    """Remove sheets from an Excel file.
+
+    The workbook is only written if a sheet was removed, and the last sheet is never
+    removed (a workbook must contain a sheet). The workbook is re-saved by openpyxl,
+    which drops the charts, images and pivot tables of all its sheets.
+
+    Args:
+        path (Path): Path to excel file to remove the sheets from
+        sheet_names (List[str]): Names of the sheets to remove
+
+    Returns:
+        List[str]: Names of the removed sheets
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(str(path))
+    removed = list()
+    for sheet_name in sheet_names:
+        if sheet_name in workbook.sheetnames and len(workbook.sheetnames) > 1:
+            del workbook[sheet_name]
+            removed.append(sheet_name)
+    if len(removed) != 0:
+        print(f"Removing sheets {removed} from: {path}")
+        workbook.save(str(path))
+    return removed
@@ -0,0 +1,290 @@
+"""Module for forecasting the completion of a release with Monte Carlo simulations.
+
+Every trial draws the future sprints from the history of past sprints, where the burn
+per person day and the creep of a sprint are drawn together as they are correlated.
+The remaining points of a trial decrease by the burn of the planned capacity, and
+increase by the creep. The trials are simulated at once as arrays of trials by
+sprints.
+"""
+
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from burndown.profiling import profiled
+
+if TYPE_CHECKING:
+    from burndown.sprint_tasks import SprintTasks
+
+# The percentiles of the remaining points drawn as the bands of the fan chart
+FAN_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def get_sprint_history(
+    total_burn: pd.DataFrame, creep_categories: pd.DataFrame
+) -> pd.DataFrame:
+    """Get the burn per person day and the creep of the past sprints.
+
+    Args:
+        total_burn (pd.DataFrame): The total burn from SprintTasks.get_total_burn
+        creep_categories (pd.DataFrame): The creep categories from
+            SprintTasks.get_creep_categories
+
+    Returns:
+        pd.DataFrame: The burn_per_person_day, person_days and creep of the sprints
+            with capacity, indexed by the sprint names
+    """
+    creep = (
+        creep_categories.drop(columns="Release", errors="ignore")
+        .sum(axis=1)
+        .reindex(total_burn.index, fill_value=0)
+    )
+    history = pd.DataFrame(
+        {
+            "burn_per_person_day": total_burn.loc[:, "burn_per_person_day"],
+            "person_days": total_burn.loc[:, "person_days"],
+            "creep": creep,
+        }
+    )
+    # Sprints without capacity cannot be scaled to the planned capacity
+    return history.loc[np.isfinite(history.loc[:, "burn_per_person_day"])]
+
+
+@profiled("forecast")
+def simulate_remaining(
+    remaining_points: float,
+    burn_per_person_day: np.ndarray,
+    creep: np.ndarray,
+    capacity: np.ndarray,
+    n_trials: int = 100_000,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Simulate the remaining points after each future sprint.
+
+    Args:
+        remaining_points (float): The points remaining of the release
+        burn_per_person_day (np.ndarray): The burn per person day of the past sprints
+        creep (np.ndarray): The creep of the past sprints
+        capacity (np.ndarray): The planned person days of each future sprint
+        n_trials (int, optional): The number of trials. Defaults to 100_000.
+        seed (Optional[int], optional): Seed of the random number generator.
+            Defaults to None.
+
+    Raises:
+        ValueError: If there are no past sprints to draw from
+
+    Returns:
+        np.ndarray: The remaining points of each trial (rows) after each future
+            sprint (columns)
+    """
+    if len(burn_per_person_day) == 0:
+        raise ValueError("Cannot forecast without any past sprints with capacity")
+    rng = np.random.default_rng(seed)
+    # Single precision halves the memory of the trials, which is plenty for points
+    burn_per_person_day = np.asarray(burn_per_person_day, dtype=np.float32)
+    creep = np.asarray(creep, dtype=np.float32)
+    past_sprints = rng.integers(
+        0, len(burn_per_person_day), size=(n_trials, len(capacity)), dtype=np.int32
+    )
+    progress = burn_per_person_day[past_sprints]
+    progress *= np.asarray(capacity, dtype=np.float32)
+    progress -= creep[past_sprints]
+    remaining = np.cumsum(progress, axis=1, out=progress)
+    np.subtract(np.float32(remaining_points), remaining, out=remaining)
+    return remaining
+
+
+def get_completion_sprints(remaining: np.ndarray) -> np.ndarray:
+    """Get the number of future sprints each trial needs to complete the release.
+
+    Args:
+        remaining (np.ndarray): The remaining points from simulate_remaining
+
+    Returns:
+        np.ndarray: The number of sprints of each trial, where trials which do not
+            complete within the simulated sprints get one sprint more than simulated
+    """
+    completed = remaining <= 0
+    return np.where(
+        completed.any(axis=1), completed.argmax(axis=1) + 1, remaining.shape[1] + 1
+    )
+
+
+def get_completion_percentiles(
+    completion_sprints: np.ndarray,
+    n_sprints: int,
+    percentiles: Sequence[float] = (50, 85, 95),
+) -> np.ndarray:
+    """Get the number of sprints needed with the given probabilities.
+
+    The sprints are integers, so the percentiles are read from the cumulative
+    counts of the sprints instead of sorting the trials.
+
+    Args:
+        completion_sprints (np.ndarray): The sprints from get_completion_sprints
+        n_sprints (int): The number of simulated sprints
+        percentiles (Sequence[float], optional): The probabilities in percent.
+            Defaults to (50, 85, 95).
+
+    Returns:
+        np.ndarray: The number of sprints of each percentile, where n_sprints + 1
+            means not within the simulated sprints
+    """
+    counts = np.bincount(completion_sprints, minlength=n_sprints + 2)
+    cumulative = np.cumsum(counts) / len(completion_sprints)
+    return np.searchsorted(cumulative, np.asarray(percentiles) / 100 - 1e-12)
+
+
+def forecast_release(
+    history: pd.DataFrame,
+    remaining_points: float,
+    last_date: pd.Timestamp,
+    sprint_length: Union[int, pd.Timedelta],
+    capacity: Optional[Union[float, Sequence[float]]] = None,
+    n_sprints: int = 26,
+    n_trials: int = 100_000,
+    percentiles: Sequence[float] = (50, 85, 95),
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Forecast the completion date of a release.
+
+    Args:
+        history (pd.DataFrame): The past sprints from get_sprint_history
+        remaining_points (float): The points remaining of the release
+        last_date (pd.Timestamp): The end of the latest sprint
+        sprint_length (Union[int, pd.Timedelta]): The length of a sprint in days
+        capacity (Optional[Union[float, Sequence[float]]], optional): The planned
+            person days of the future sprints, where the last one is repeated.
+            Defaults to None (the mean of the last 5 sprints).
+        n_sprints (int, optional): The number of future sprints to simulate.
+            Defaults to 26.
+        n_trials (int, optional): The number of trials. Defaults to 100_000.
+        percentiles (Sequence[float], optional): The probabilities of the completion
+            dates in percent. Defaults to (50, 85, 95).
+        seed (Optional[int], optional): Seed of the random number generator.
+            Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The percentiles of the remaining points
+            at the end of every future sprint (the fan) indexed by the end dates,
+            and the sprints and completion date of each percentile, where the date
+            is NaT if the release is not completed within the simulated sprints
+    """
+    if capacity is None:
+        capacity = history.loc[:, "person_days"].iloc[-5:].mean()
+    capacity = np.atleast_1d(np.asarray(capacity, dtype=float))
+    capacity = np.concatenate(
+        [
+            capacity[:n_sprints],
+            np.repeat(capacity[-1], max(n_sprints - len(capacity), 0)),
+        ]
+    )
+    sprint_length = pd.Timedelta(sprint_length, unit="D")
+    end_dates = pd.DatetimeIndex(
+        [last_date + i * sprint_length for i in range(n_sprints + 1)], name="date"
+    )
+
+    remaining = simulate_remaining(
+        remaining_points,
+        history.loc[:, "burn_per_person_day"].to_numpy(),
+        history.loc[:, "creep"].to_numpy(),
+        capacity,
+        n_trials,
+        seed,
+    )
+    fan = pd.DataFrame(
+        np.vstack(
+            [
+                np.full((1, len(FAN_PERCENTILES)), remaining_points),
+                np.percentile(np.clip(remaining, 0, None), FAN_PERCENTILES, axis=0).T,
+            ]
+        ),
+        index=end_dates,
+        columns=list(FAN_PERCENTILES),
+    )
+
+    completion_sprints = (
+        get_completion_sprints(remaining)
+        if remaining_points > 0
+        else np.zeros(n_trials, dtype=int)
+    )
+    sprints = get_completion_percentiles(completion_sprints, n_sprints, percentiles)
+    completion = pd.DataFrame(
+        {
+            "sprints": sprints,
+            "date": [
+                end_dates[sprint] if sprint <= n_sprints else pd.NaT
+                for sprint in sprints
+            ],
+        },
+        index=pd.Index(list(percentiles), name="percentile"),
+    )
+    return fan, completion
+
+
+def get_latest_release(sprint_start_dates: pd.Series) -> str:
+    """Get the release of the latest sprint.
+
+    Args:
+        sprint_start_dates (pd.Series): The start dates indexed by the sprint names
+
+    Returns:
+        str: The release of the sprint which started last
+    """
+    return str(sprint_start_dates.idxmax()).split("-")[0]
+
+
+def forecast_sprint_tasks(
+    sprint_tasks: "SprintTasks",
+    total_burn: pd.DataFrame,
+    creep_categories: pd.DataFrame,
+    remaining_points: float,
+    release: Optional[str] = None,
+    capacity: Optional[Union[float, Sequence[float]]] = None,
+    n_trials: int = 100_000,
+    seed: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Forecast the completion of a release from the loaded sprint tasks.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        total_burn (pd.DataFrame): The total burn of all the sprints
+        creep_categories (pd.DataFrame): The creep categories of all the sprints
+        remaining_points (float): The points remaining of the release, including
+            the work planned for its future sprints (the release burnup only knows
+            the scope of the sprints so far)
+        release (Optional[str], optional): The release to forecast. Defaults to
+            None (the release of the latest sprint).
+        capacity (Optional[Union[float, Sequence[float]]], optional): The planned
+            person days of the future sprints. Defaults to None (the mean of the
+            last 5 sprints).
+        n_trials (int, optional): The number of trials. Defaults to 100_000.
+        seed (Optional[int], optional): Seed of the random number generator.
+            Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: The release burnup, the
+            fan and the completion percentiles from forecast_release
+    """
+    sprint_start_dates = sprint_tasks.get_sprint_start_dates().sort_values()
+    if release is None:
+        release = get_latest_release(sprint_start_dates)
+    release_burnup_df = sprint_tasks.get_release_burnup(release)
+    # The length of the sprints is the typical time between the sprint starts, or
+    # the days of the only sprint (including its last day)
+    if len(sprint_start_dates) > 1:
+        sprint_length = sprint_start_dates.diff().dropna().median()
+    else:
+        first_day, last_day = release_burnup_df.index[[0, -1]]
+        sprint_length = last_day - first_day + pd.Timedelta(days=1)
+    fan, completion = forecast_release(
+        get_sprint_history(total_burn, creep_categories),
+        remaining_points,
+        release_burnup_df.index[-1],
+        sprint_length,
+        capacity=capacity,
+        n_trials=n_trials,
+        seed=seed,
+    )
+    return release_burnup_df, fan, completion
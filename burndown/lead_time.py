@@ -0,0 +1,69 @@
+"""Module for the statistics of the lead times of the tasks."""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+LEAD_TIME_PERCENTILES = (50, 85, 95)
+# Scales the mean moving range to three standard deviations (XmR chart)
+MOVING_RANGE_SCALE = 2.66
+
+
+def get_lead_time_percentiles(
+    lead_times: pd.DataFrame,
+    by: str = "sprint",
+    percentiles: Sequence[float] = LEAD_TIME_PERCENTILES,
+) -> pd.DataFrame:
+    """Get the percentiles of the lead times of each group of tasks.
+
+    Args:
+        lead_times (pd.DataFrame): The lead times from SprintTasks.get_lead_times
+        by (str, optional): The column to group the tasks by (e.g. sprint, Release
+            or category). Defaults to "sprint".
+        percentiles (Sequence[float], optional): The percentiles in percent.
+            Defaults to (50, 85, 95).
+
+    Returns:
+        pd.DataFrame: The number of tasks, the mean and the percentiles (e.g. 85%)
+            of the lead time of each group
+    """
+    grouped = lead_times.groupby(by, observed=True, sort=False)["lead_time"]
+    quantiles = grouped.quantile(np.asarray(percentiles) / 100).unstack()
+    quantiles.columns = [f"{percentile}%" for percentile in percentiles]
+    return pd.concat(
+        [grouped.count().rename("tasks"), grouped.mean().rename("mean"), quantiles],
+        axis=1,
+    )
+
+
+def get_control_limits(lead_times: pd.DataFrame) -> pd.Series:
+    """Get the limits of the natural variation of the lead times (an XmR chart).
+
+    The moving range is the difference between the lead times of consecutively
+    closed tasks.
+
+    Args:
+        lead_times (pd.DataFrame): The lead times from SprintTasks.get_lead_times
+
+    Returns:
+        pd.Series: The mean, lower and upper limit of the lead time (NaN without
+            lead times)
+    """
+    values = (
+        lead_times.sort_values("Date Closed", kind="stable")
+        .loc[:, "lead_time"]
+        .dropna()
+        .to_numpy()
+    )
+    if len(values) == 0:
+        return pd.Series({"mean": np.nan, "lower": np.nan, "upper": np.nan})
+    mean = values.mean()
+    moving_range = np.abs(np.diff(values)).mean() if len(values) > 1 else 0.0
+    return pd.Series(
+        {
+            "mean": mean,
+            "lower": max(mean - MOVING_RANGE_SCALE * moving_range, 0.0),
+            "upper": mean + MOVING_RANGE_SCALE * moving_range,
+        }
+    )
@@ -0,0 +1,299 @@
+"""Module for the daily metrics of all the sprints stored as one cube.
+
+The remaining points of a day only depend on the tasks closed and added until that
+day, so the burndown as it looked on day N of a sprint is the first N + 1 days of
+its final burndown. The cube holds the metrics of every day of every sprint, so any
+as-of view is a slice of it instead of a recomputation.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# The metrics preceding the daily creep of each creep category
+REMAINING_METRICS = ("planning_remaining", "creep_remaining")
+_DAY_NS = 24 * 60 * 60 * 10**9
+
+
+class MetricCube(NamedTuple):
+    """The daily metrics of several sprints.
+
+    Sprints shorter than the longest sprint are padded with NaT dates and NaN
+    values.
+
+    Attributes:
+        sprint_names (Sequence[str]): The name of each sprint
+        dates (np.ndarray): The dates of shape (sprints, days)
+        metrics (Sequence[str]): The remaining points of the sprint planning and
+            creep, followed by the daily creep of each creep category
+        values (np.ndarray): The metrics of shape (sprints, days, metrics)
+    """
+
+    sprint_names: Sequence[str]
+    dates: np.ndarray
+    metrics: Sequence[str]
+    values: np.ndarray
+
+    def get_sprint(
+        self, sprint_name: str, until_date: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
+        """Get the metrics of a sprint as they were at a date.
+
+        Args:
+            sprint_name (str): Name of the sprint
+            until_date (Optional[pd.Timestamp], optional): The last date to include.
+                Defaults to None (all the days of the sprint).
+
+        Returns:
+            pd.DataFrame: The metrics (columns) of each date (index) of the sprint
+        """
+        sprint = list(self.sprint_names).index(sprint_name)
+        dates = self.dates[sprint]
+        days = ~np.isnat(dates)
+        if until_date is not None:
+            days &= dates <= pd.Timestamp(until_date).to_datetime64()
+        return pd.DataFrame(
+            self.values[sprint, days],
+            index=pd.DatetimeIndex(dates[days], name="date"),
+            columns=list(self.metrics),
+        )
+
+    def get_day(self, day: int) -> pd.DataFrame:
+        """Get the metrics of every sprint on the same day of the sprint.
+
+        Args:
+            day (int): The day of the sprints, where the sprint start is day 0
+
+        Returns:
+            pd.DataFrame: The date and metrics (columns) of each sprint (index).
+                Sprints with fewer days are NaN.
+        """
+        day_df = pd.DataFrame(
+            self.values[:, day],
+            index=pd.Index(self.sprint_names, name="sprint"),
+            columns=list(self.metrics),
+        )
+        day_df.insert(0, "date", self.dates[:, day])
+        return day_df
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the cube as a long table without the padding.
+
+        Returns:
+            pd.DataFrame: The sprint, day, date and metrics of every day
+        """
+        sprints, days = np.nonzero(~np.isnat(self.dates))
+        cube_df = pd.DataFrame(self.values[sprints, days], columns=list(self.metrics))
+        cube_df.insert(0, "sprint", np.asarray(self.sprint_names)[sprints])
+        cube_df.insert(1, "day", days)
+        cube_df.insert(2, "date", self.dates[sprints, days])
+        return cube_df
+
+
+def _get_days(
+    sprint_dates: np.ndarray,
+    n_days: np.ndarray,
+    sprints: np.ndarray,
+    event_dates: np.ndarray,
+    exact: bool = False,
+) -> np.ndarray:
+    """Get the first day of its sprint on or after each event.
+
+    All the sprints are searched at once by searching for (sprint, day) keys.
+
+    Args:
+        sprint_dates (np.ndarray): The dates of shape (sprints, days), NaT padded
+        n_days (np.ndarray): The number of days of each sprint
+        sprints (np.ndarray): The sprint of each event
+        event_dates (np.ndarray): The date of each event (day normalized)
+        exact (bool, optional): Whether the event must be on a date of the sprint.
+            Defaults to False.
+
+    Returns:
+        np.ndarray: The day of each event, or -1 for events without a day
+    """
+    has_date = ~np.isnat(sprint_dates)
+    key_sprints, _ = np.nonzero(has_date)
+    keys = (key_sprints.astype(np.int64) << 32) + (
+        sprint_dates[has_date].astype(np.int64) // _DAY_NS + 2**31
+    )
+    valid = ~np.isnat(event_dates)
+    event_keys = (sprints.astype(np.int64) << 32) + (
+        np.where(valid, event_dates.astype(np.int64), 0) // _DAY_NS + 2**31
+    )
+    positions = np.searchsorted(keys, event_keys, side="left")
+    # Keys of later sprints are larger, so the position is in the sprint or after it
+    offsets = np.concatenate([[0], np.cumsum(n_days)[:-1]])
+    days = positions - offsets[sprints]
+    valid &= days < n_days[sprints]
+    if exact:
+        valid &= keys[np.minimum(positions, len(keys) - 1)] == event_keys
+    return np.where(valid, days, -1)
+
+
+def _sum_days(
+    n_sprints: int,
+    n_days: int,
+    sprints: np.ndarray,
+    days: np.ndarray,
+    weights: np.ndarray,
+    n_metrics: int = 1,
+    metrics: Union[np.ndarray, int] = 0,
+) -> np.ndarray:
+    """Sum the weights of the events of each (sprint, day, metric).
+
+    Args:
+        n_sprints (int): Number of sprints
+        n_days (int): Number of days of the longest sprint
+        sprints (np.ndarray): The sprint of each event
+        days (np.ndarray): The day of each event, where -1 is ignored
+        weights (np.ndarray): The weight of each event
+        n_metrics (int, optional): Number of metrics. Defaults to 1.
+        metrics (Union[np.ndarray, int], optional): The metric of each event.
+            Defaults to 0.
+
+    Returns:
+        np.ndarray: The sums of shape (sprints, days, metrics)
+    """
+    valid = days >= 0
+    bins = (sprints * n_days + days) * n_metrics + metrics
+    return np.bincount(
+        bins[valid],
+        weights=weights[valid],
+        minlength=n_sprints * n_days * n_metrics,
+    ).reshape(n_sprints, n_days, n_metrics)
+
+
+def _concat_sprints(
+    dfs: Dict[str, pd.DataFrame], sprint_names: List[str]
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Concatenate the DataFrames of the sprints with the code of their sprint.
+
+    Args:
+        dfs (Dict[str, pd.DataFrame]): DataFrame of each sprint
+        sprint_names (List[str]): Name of the sprints
+
+    Returns:
+        Tuple[pd.DataFrame, np.ndarray]: The concatenated DataFrame and the sprint
+            of each row
+    """
+    frames = [dfs[name] for name in sprint_names]
+    sprints = np.repeat(np.arange(len(frames)), [len(df) for df in frames])
+    return pd.concat(frames, ignore_index=True), sprints
+
+
+def get_metric_cube(
+    sprint_names: Sequence[str],
+    sprint_dates: Sequence[pd.DatetimeIndex],
+    sprint_planning_dfs: Dict[str, pd.DataFrame],
+    creep_dfs: Dict[str, pd.DataFrame],
+) -> MetricCube:
+    """Compute the daily metrics of all the sprints in one pass.
+
+    The metrics equal those of SprintTasks.get_sprint_planning_burn,
+    get_creep_burn and get_daily_creep: burn on the sprint start is counted from
+    the next day, and burned creep is counted once both added and closed. Every
+    addition and burn is an event on a (sprint, day), summed with one bincount and
+    accumulated over the days.
+
+    Args:
+        sprint_names (Sequence[str]): Name of the sprints
+        sprint_dates (Sequence[pd.DatetimeIndex]): The dates of each sprint
+        sprint_planning_dfs (Dict[str, pd.DataFrame]): The sprint planning tasks
+            of each sprint
+        creep_dfs (Dict[str, pd.DataFrame]): The creep tasks of each sprint
+
+    Returns:
+        MetricCube: The metrics of every day of the sprints
+    """
+    sprint_names = list(sprint_names)
+    n_sprints = len(sprint_names)
+    n_days = np.array([len(dates) for dates in sprint_dates], dtype=np.int64)
+    max_days = int(n_days.max()) if n_sprints > 0 else 0
+    dates = np.full((n_sprints, max_days), np.datetime64("NaT"), dtype="M8[ns]")
+    for sprint, sprint_index in enumerate(sprint_dates):
+        dates[sprint, : n_days[sprint]] = np.sort(sprint_index.to_numpy(dtype="M8[ns]"))
+
+    def get_days(
+        sprints: np.ndarray, event_dates: pd.Series, exact: bool = False
+    ) -> np.ndarray:
+        """Get the day of the events in the sprints (-1 if none)."""
+        return _get_days(
+            dates, n_days, sprints, event_dates.to_numpy(dtype="M8[ns]"), exact
+        )
+
+    # Burn on the sprint start is first counted on the next day
+    planning_df, planning_sprints = _concat_sprints(sprint_planning_dfs, sprint_names)
+    start_points = (
+        planning_df.groupby(planning_sprints)["Original estimate"]
+        .sum()
+        .reindex(np.arange(n_sprints), fill_value=0)
+        .to_numpy(dtype=float)
+    )
+    burn_days = get_days(planning_sprints, planning_df.loc[:, "Date Closed"])
+    burn_days = np.where(burn_days >= 0, np.maximum(burn_days, 1), -1)
+    burn_days = np.where(burn_days < n_days[planning_sprints], burn_days, -1)
+    planning_burn = _sum_days(
+        n_sprints,
+        max_days,
+        planning_sprints,
+        burn_days,
+        planning_df.loc[:, "burned"].fillna(0).to_numpy(dtype=float),
+    )
+
+    # Creep is burned once it is both added and closed, and not on the sprint start
+    creep_df, creep_sprints = _concat_sprints(creep_dfs, sprint_names)
+    creep = creep_df.loc[:, "creep"].fillna(0).to_numpy(dtype=float)
+    creep_days = get_days(creep_sprints, creep_df.loc[:, "date"])
+    closed_days = get_days(creep_sprints, creep_df.loc[:, "Date Closed"])
+    creep_burn_days = np.maximum(np.maximum(creep_days, closed_days), 1)
+    creep_burn_days = np.where(
+        (creep_days >= 0)
+        & (closed_days >= 0)
+        & (creep_burn_days < n_days[creep_sprints]),
+        creep_burn_days,
+        -1,
+    )
+    creep_added = _sum_days(n_sprints, max_days, creep_sprints, creep_days, creep)
+    creep_burn = _sum_days(
+        n_sprints,
+        max_days,
+        creep_sprints,
+        creep_burn_days,
+        creep_df.loc[:, "burned"].fillna(0).to_numpy(dtype=float),
+    )
+
+    # Daily creep is only counted on the dates of the sprint
+    creep_categories = creep_df.loc[:, "creep_category"].astype(object)
+    categories = sorted(creep_categories.dropna().unique())
+    category_codes = pd.Categorical(creep_categories, categories=categories).codes
+    daily_creep = _sum_days(
+        n_sprints,
+        max_days,
+        creep_sprints,
+        np.where(
+            category_codes >= 0,
+            get_days(creep_sprints, creep_df.loc[:, "date"], exact=True),
+            -1,
+        ),
+        creep,
+        len(categories),
+        category_codes.astype(np.int64),
+    )
+
+    values = np.concatenate(
+        [
+            start_points[:, None, None] - np.cumsum(planning_burn, axis=1),
+            np.cumsum(creep_added - creep_burn, axis=1),
+            daily_creep,
+        ],
+        axis=2,
+    )
+    values[np.isnat(dates)] = np.nan
+    return MetricCube(
+        sprint_names=tuple(sprint_names),
+        dates=dates,
+        metrics=REMAINING_METRICS + tuple(categories),
+        values=values,
+    )
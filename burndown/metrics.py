@@ -0,0 +1,197 @@
+"""Script for exporting the sprint metrics to JSON, CSV or Parquet."""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from burndown.sprint_tasks import SprintTasks
+
+METRIC_FORMATS = (".json", ".csv", ".parquet")
+METRIC_GROUPS = ("total", "burned", "creep", "burned_percentage", "creep_percentage")
+# The columns of the total burn which can be summed over several sprints
+ADDITIVE_COLUMNS = (
+    "total_points",
+    "sprint_start_burned",
+    "sprint_start_points",
+    "person_days",
+)
+
+
+def get_metric_group(metrics: "pd.DataFrame", group: str) -> "pd.DataFrame":
+    """Get the metrics of one group with the group removed from the column names.
+
+    Args:
+        metrics (pd.DataFrame): The metrics from get_metrics
+        group (str): One of METRIC_GROUPS
+
+    Returns:
+        pd.DataFrame: The metrics of the group
+    """
+    columns = [column for column in metrics.columns if column.startswith(f"{group}.")]
+    return metrics.loc[:, columns].rename(
+        columns=lambda column: column[len(group) + 1 :]
+    )
+
+
+def get_metrics(
+    total_burn: "pd.DataFrame",
+    burn_categories: "pd.DataFrame",
+    creep_categories: "pd.DataFrame",
+    by: str = "release",
+) -> "pd.DataFrame":
+    """Get the metrics of each release or sprint.
+
+    The sums are computed in one grouped pass over the frames, and the ratios are
+    derived from the sums.
+    The columns are named "<group>.<name>" where the group is one of METRIC_GROUPS.
+
+    Args:
+        total_burn (pd.DataFrame): The total burn of each sprint
+        burn_categories (pd.DataFrame): The burned points per category of each sprint
+        creep_categories (pd.DataFrame): The creep per category of each sprint
+        by (str, optional): Whether to get the metrics per "release" or "sprint".
+            Defaults to "release".
+
+    Raises:
+        ValueError: If by is neither "release" nor "sprint"
+
+    Returns:
+        pd.DataFrame: The metrics indexed by the release or sprint
+    """
+    import pandas as pd
+
+    if by not in ("release", "sprint"):
+        raise ValueError(f"Cannot get the metrics by '{by}', choose release or sprint")
+
+    sprints_df = pd.concat(
+        [
+            total_burn.loc[:, ADDITIVE_COLUMNS].astype(float).add_prefix("total."),
+            burn_categories.drop(columns="Release").add_prefix("burned."),
+            creep_categories.drop(columns="Release").add_prefix("creep."),
+        ],
+        axis=1,
+    ).fillna(0)
+    metrics = sprints_df.groupby(
+        total_burn.loc[:, "Release"] if by == "release" else sprints_df.index
+    ).sum()
+    metrics.index.name = "Release" if by == "release" else "Sprint"
+
+    burned = get_metric_group(metrics, "burned")
+    creep = get_metric_group(metrics, "creep")
+    metrics["total.burned"] = burned.sum(axis=1)
+    metrics["total.creep"] = creep.sum(axis=1)
+    metrics["total.achievement"] = (
+        100
+        * metrics["total.sprint_start_burned"]
+        / metrics["total.sprint_start_points"]
+    )
+    metrics["total.burn_per_person_day"] = (
+        metrics["total.total_points"] / metrics["total.person_days"]
+    )
+    return pd.concat(
+        [
+            metrics,
+            (100 * burned.div(metrics["total.burned"], axis=0)).add_prefix(
+                "burned_percentage."
+            ),
+            (100 * creep.div(metrics["total.creep"], axis=0)).add_prefix(
+                "creep_percentage."
+            ),
+        ],
+        axis=1,
+    )
+
+
+def get_sprint_tasks_metrics(
+    sprint_tasks: "SprintTasks", by: str = "release"
+) -> "pd.DataFrame":
+    """Get the metrics of each release or sprint from the sprint tasks.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        by (str, optional): Whether to get the metrics per "release" or "sprint".
+            Defaults to "release".
+
+    Returns:
+        pd.DataFrame: The metrics indexed by the release or sprint
+    """
+    return get_metrics(
+        sprint_tasks.get_total_burn(),
+        sprint_tasks.get_burn_categories(),
+        sprint_tasks.get_creep_categories(),
+        by=by,
+    )
+
+
+def save_metrics(metrics: "pd.DataFrame", save_path: Path) -> None:
+    """Save the metrics in the format given by the suffix of the path.
+
+    Parquet requires pyarrow or fastparquet to be installed.
+
+    Args:
+        metrics (pd.DataFrame): The metrics from get_metrics
+        save_path (Path): Path ending with one of METRIC_FORMATS
+
+    Raises:
+        ValueError: If the suffix is not one of METRIC_FORMATS
+    """
+    print(f"Saving metrics to: {save_path}")
+    if save_path.suffix == ".json":
+        metrics.to_json(save_path, orient="index", indent=2)
+    elif save_path.suffix == ".csv":
+        metrics.to_csv(save_path)
+    elif save_path.suffix == ".parquet":
+        metrics.to_parquet(save_path)
+    else:
+        raise ValueError(
+            f"Cannot save metrics to '{save_path.suffix}', choose from {METRIC_FORMATS}"
+        )
+
+
+def main() -> None:
+    """Export the metrics of all the releases or sprints."""
+    root_path = Path(__file__).parents[1].resolve()
+    charts_dir = root_path.joinpath("charts")
+    sheet_dir = root_path.joinpath("data")
+    burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+    parser = argparse.ArgumentParser(description="Export the sprint metrics.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=charts_dir.joinpath("metrics.json"),
+        help=f"Path to store the metrics to (ending with one of {METRIC_FORMATS})",
+    )
+    parser.add_argument(
+        "-b",
+        "--by",
+        default="release",
+        choices=["release", "sprint"],
+        help="Whether to export the metrics per release or per sprint",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        if args.output.suffix not in METRIC_FORMATS:
+            parser.error(f"The output must end with one of {METRIC_FORMATS}")
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=find_sprint_tasks_path(sheet_dir),
+            burndown_path=burndown_path,
+        )
+        save_metrics(get_sprint_tasks_metrics(sprint_tasks, args.by), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Module containing the choices of the command line interfaces.
+
+The module must only import from the standard library, so that the arguments can be
+parsed (and --help printed) without importing pandas or matplotlib.
+"""
+
+from typing import Dict
+
+PLOT_TARGETS = (
+    "burndown",
+    "sprint",
+    "double",
+    "trends",
+    "release",
+    "lead_time",
+    "cumulative_flow",
+    "dashboard",
+)
+# The targets plotted for a release, or for one of its sprints if given
+RELEASE_TARGETS = ("release", "cumulative_flow")
+SPRINT_TARGETS = ("burndown", "sprint", "double")
+WATCH_TARGETS = ("burndown", "sprint", "double", "trends")
+
+AGGREGATION_LABELS: Dict[str, str] = {
+    "sprint": "Sprint",
+    "release": "Release",
+    "quarter": "Quarter",
+}
@@ -0,0 +1,114 @@
+"""Script for plotting the cumulative flow diagram of a sprint or release."""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from pandas import Timestamp
+
+    from burndown.sprint_tasks import SprintTasks
+
+
+def plot_flow(
+    sprint_tasks: "SprintTasks",
+    release: str,
+    charts_dir: Path,
+    sprint_number: Optional[str] = None,
+    days_off: Optional[List["Timestamp"]] = None,
+    points: bool = True,
+) -> None:
+    """Plot the cumulative flow of a release, or of one of its sprints.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        release (str): The release to plot
+        charts_dir (Path): Directory to store the plot to
+        sprint_number (Optional[str], optional): The sprint of the release to plot.
+            Defaults to None (the whole release).
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+        points (bool, optional): Whether to sum the points instead of counting the
+            tasks. Defaults to True.
+    """
+    from burndown.plots import plot_cumulative_flow
+    from burndown.sprint_dates import SprintDates
+
+    if sprint_number is not None:
+        name = f"{release}-{sprint_number}"
+        sprint_names = [name]
+    else:
+        name = release
+        sprint_names = [
+            sprint_name
+            for sprint_name in sprint_tasks.sprint_tasks_sheets.keys()
+            if sprint_name.split("-")[0] == release
+        ]
+    flow_df = sprint_tasks.get_cumulative_flow(sprint_names, points)
+    sprint_dates = SprintDates(flow_df.index[0], len(flow_df.index), days_off)
+    plot_cumulative_flow(flow_df, sprint_dates, charts_dir, name, points)
+
+
+def main() -> None:
+    """Plot the points created, in the sprint, added as creep and closed each day."""
+    parser = argparse.ArgumentParser(description="Plot the cumulative flow.")
+    parser.add_argument(
+        "-r", "--release", type=str, help="Release number", required=True
+    )
+    parser.add_argument(
+        "-s",
+        "--sprint_number",
+        type=str,
+        help="Sprint number (if none is given, the whole release is plotted)",
+    )
+    parser.add_argument(
+        "-t",
+        "--tasks",
+        action="store_true",
+        help="Count the tasks instead of summing their points",
+    )
+    parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        root_path = Path(__file__).parents[1].resolve()
+        charts_dir = root_path.joinpath("charts")
+        sheet_dir = root_path.joinpath("data")
+        sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+        charts_dir.mkdir(parents=True, exist_ok=True)
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+        )
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+        plot_flow(
+            sprint_tasks,
+            args.release,
+            charts_dir,
+            args.sprint_number,
+            days_off,
+            points=not args.tasks,
+        )
+
+
+if __name__ == "__main__":
+    main()
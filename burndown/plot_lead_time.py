@@ -0,0 +1,99 @@
+"""Script for plotting the lead times of the tasks."""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from pandas import Timestamp
+
+    from burndown.sprint_tasks import SprintTasks
+
+
+def plot_lead_time(
+    sprint_tasks: "SprintTasks",
+    charts_dir: Path,
+    release: Optional[str] = None,
+    days_off: Optional[List["Timestamp"]] = None,
+) -> None:
+    """Print the lead time percentiles and plot the lead times.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        charts_dir (Path): Directory to store the plots to
+        release (Optional[str], optional): Release to plot the lead times of.
+            Defaults to None (all releases).
+        days_off (Optional[List[Timestamp]], optional):
+            Days without development besides the week-ends. Defaults to None.
+    """
+    from burndown.lead_time import get_control_limits, get_lead_time_percentiles
+    from burndown.plots import plot_lead_time_control_chart, plot_lead_time_histogram
+
+    lead_times = sprint_tasks.get_lead_times(days_off)
+    if release is not None:
+        lead_times = lead_times.loc[lead_times.loc[:, "Release"] == release]
+
+    print("Lead time in days of development:")
+    print("=" * 80)
+    print("Lead time per sprint:")
+    print("-" * 80)
+    print(get_lead_time_percentiles(lead_times, "sprint"))
+    print("-" * 80)
+    print("Lead time per category:")
+    print("-" * 80)
+    print(get_lead_time_percentiles(lead_times, "category"))
+    print("-" * 80)
+    print("\n")
+
+    plot_lead_time_histogram(lead_times, charts_dir)
+    plot_lead_time_control_chart(lead_times, get_control_limits(lead_times), charts_dir)
+
+
+def main() -> None:
+    """Plot the lead times from the tasks were created until they were closed."""
+    parser = argparse.ArgumentParser(description="Plot the lead times.")
+    parser.add_argument(
+        "-r",
+        "--release",
+        type=str,
+        help="Release number (if none is given, the lead times of all releases are "
+        "plotted)",
+    )
+    parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        root_path = Path(__file__).parents[1].resolve()
+        charts_dir = root_path.joinpath("charts")
+        sheet_dir = root_path.joinpath("data")
+        sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+        charts_dir.mkdir(parents=True, exist_ok=True)
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+        )
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+        plot_lead_time(sprint_tasks, charts_dir, args.release, days_off)
+
+
+if __name__ == "__main__":
+    main()
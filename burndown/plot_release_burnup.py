@@ -0,0 +1,81 @@
+"""Script for plotting the burnup of a release spanning several sprints."""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from burndown.profiling import add_profile_argument, profiling
+
+if TYPE_CHECKING:
+    from pandas import Timestamp
+
+    from burndown.sprint_tasks import SprintTasks
+
+
+def plot_release(
+    sprint_tasks: "SprintTasks",
+    release: str,
+    charts_dir: Path,
+    days_off: Optional[List["Timestamp"]] = None,
+) -> None:
+    """Plot the burnup of a release.
+
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        release (str): The release to plot
+        charts_dir (Path): Directory to store the plot to
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+    """
+    from burndown.plots import plot_release_burnup
+    from burndown.sprint_dates import SprintDates
+
+    release_burnup_df = sprint_tasks.get_release_burnup(release)
+    sprint_dates = SprintDates(
+        release_burnup_df.index[0], len(release_burnup_df.index), days_off
+    )
+    plot_release_burnup(release_burnup_df, sprint_dates, charts_dir, release)
+
+
+def main() -> None:
+    """Plot the scope and done points of all the sprints in a release."""
+    parser = argparse.ArgumentParser(description="Plot the release burnup.")
+    parser.add_argument(
+        "-r", "--release", type=str, help="Release number", required=True
+    )
+    parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        root_path = Path(__file__).parents[1].resolve()
+        charts_dir = root_path.joinpath("charts")
+        sheet_dir = root_path.joinpath("data")
+        sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+        charts_dir.mkdir(parents=True, exist_ok=True)
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+        )
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+        plot_release(sprint_tasks, args.release, charts_dir, days_off)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,45 +2,38 @@
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
+from burndown.profiling import add_profile_argument, profiling
 
-from burndown.plots import (
-    plot_sprint_burn_and_creep,
-    plot_sprint_categories,
-    plot_sprint_creep_categories,
-)
-from burndown.sprint_dates import SprintDates
-from burndown.sprint_tasks import SprintTasks
+if TYPE_CHECKING:
+    from pandas import Timestamp
 
+    from burndown.sprint_tasks import SprintTasks
 
-def main() -> None:
+
+def plot_sprint(
+    sprint_tasks: "SprintTasks",
+    sprint_name: str,
+    charts_dir: Path,
+    days_off: Optional[List["Timestamp"]] = None,
+) -> None:
     """
     Plot the total burn and creep together with the creep categories for a certain sprint.
-    """
-    root_path = Path(__file__).parents[1].resolve()
-    charts_dir = root_path.joinpath("charts")
-    sheet_dir = root_path.joinpath("data")
-    sprint_tasks_path = sheet_dir.joinpath("sprint_tasks.xlsx")
-    burndown_path = sheet_dir.joinpath("burndown.xlsx")
 
-    sprint_tasks = SprintTasks(
-        sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
-    )
-
-    parser = argparse.ArgumentParser(description="Plot metrics specific for a sprint.")
-    parser.add_argument("-r", "--release", type=str, help="Release number")
-    parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
-    parser.add_argument(
-        "-d",
-        "--days_off",
-        nargs="+",
-        type=str,
-        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        sprint_name (str): Name of the sprint
+        charts_dir (Path): Directory to store the plots to
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+    """
+    from burndown.plots import (
+        plot_sprint_burn_and_creep,
+        plot_sprint_categories,
+        plot_sprint_creep_categories,
     )
-    args = parser.parse_args()
-
-    sprint_name = f"{args.release}-{args.sprint_number}"
+    from burndown.sprint_dates import SprintDates
 
     total_sprint_burn_dfs = sprint_tasks.get_total_sprint_creep_and_burn()
     burn_categories_df = sprint_tasks.get_burn_categories()
@@ -48,11 +41,6 @@ def main() -> None:
 
     burn_df = total_sprint_burn_dfs[sprint_name]
 
-    days_off = (
-        [pd.to_datetime(date) for date in args.days_off]
-        if args.days_off is not None
-        else None
-    )
     sprint_dates = SprintDates(
         sprint_tasks.burndown_sheets[sprint_name].index[0],
         len(sprint_tasks.burndown_sheets[sprint_name].index),
@@ -74,5 +62,47 @@ def main() -> None:
     plot_sprint_creep_categories(sprint_creep_df, charts_dir, sprint_name)
 
 
+def main() -> None:
+    """
+    Plot the total burn and creep together with the creep categories for a certain sprint.
+    """
+    root_path = Path(__file__).parents[1].resolve()
+    charts_dir = root_path.joinpath("charts")
+    sheet_dir = root_path.joinpath("data")
+    burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+    parser = argparse.ArgumentParser(description="Plot metrics specific for a sprint.")
+    parser.add_argument("-r", "--release", type=str, help="Release number")
+    parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
+    parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=find_sprint_tasks_path(sheet_dir),
+            burndown_path=burndown_path,
+        )
+
+        sprint_name = f"{args.release}-{args.sprint_number}"
+
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+        plot_sprint(sprint_tasks, sprint_name, charts_dir, days_off)
+
+
 if __name__ == "__main__":
     main()
@@ -2,12 +2,35 @@
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
+from burndown.profiling import add_profile_argument, profiling
 
-from burndown.excel_io import read_sheet
-from burndown.plots import plot_burndown
-from burndown.sprint_dates import SprintDates
+if TYPE_CHECKING:
+    import pandas as pd
+    from pandas import Timestamp
+
+
+def plot_sprint_burndown(
+    burndown_df: "pd.DataFrame",
+    sprint_name: str,
+    charts_dir: Path,
+    days_off: Optional[List["Timestamp"]] = None,
+) -> None:
+    """Plot the burndown of a sprint.
+
+    Args:
+        burndown_df (pd.DataFrame): The burndown sheet of the sprint
+        sprint_name (str): Name of the sprint
+        charts_dir (Path): Directory to store the plot to
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+    """
+    from burndown.plots import plot_burndown
+    from burndown.sprint_dates import SprintDates
+
+    sprint_dates = SprintDates(burndown_df.index[0], len(burndown_df.index), days_off)
+    plot_burndown(burndown_df, sprint_dates, charts_dir, sprint_name)
 
 
 def main() -> None:
@@ -29,20 +52,24 @@ def main() -> None:
         help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
     )
 
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    sheet_path = sheet_dir.joinpath("burndown.xlsx")
-    sheet_name = f"{args.release}-{args.sprint_number}"
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
 
-    burndown_df = read_sheet(sheet_path, sheet_name, index_col="date")
-    days_off = (
-        [pd.to_datetime(date) for date in args.days_off]
-        if args.days_off is not None
-        else None
-    )
-    sprint_dates = SprintDates(burndown_df.index[0], len(burndown_df.index), days_off)
+        from burndown.excel_io import read_sheet
+
+        sheet_path = sheet_dir.joinpath("burndown.xlsx")
+        sheet_name = f"{args.release}-{args.sprint_number}"
 
-    plot_burndown(burndown_df, sprint_dates, charts_dir, sheet_name)
+        burndown_df = read_sheet(sheet_path, sheet_name, index_col="date")
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+        plot_sprint_burndown(burndown_df, sheet_name, charts_dir, days_off)
 
 
 if __name__ == "__main__":
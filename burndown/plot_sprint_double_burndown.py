@@ -4,58 +4,42 @@ Script for plotting the day to day double burndown (one for sprint burn another
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
+from burndown.profiling import add_profile_argument, profiling
 
-from burndown.plots import plot_double_burndown
-from burndown.sprint_dates import SprintDates
-from burndown.sprint_tasks import SprintTasks
+if TYPE_CHECKING:
+    from pandas import Timestamp
 
+    from burndown.sprint_tasks import SprintTasks
 
-def main() -> None:
-    """
-    Plot the total burn and creep together with the creep categories for a certain sprint.
-    """
-    parser = argparse.ArgumentParser(description="Plot the sprint trends.")
-    parser.add_argument(
-        "-r", "--release", type=str, help="Release number", required=True
-    )
-    parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
-    parser.add_argument(
-        "-u",
-        "--until_day",
-        type=str,
-        help="Until what day to get the burndown to (on the form yyyy-mm-dd)",
-    )
-    # NOTE: We shouldn't be needing the burndown sheet, and we shouldn't be
-    #       needing to add the days off argument every time. This is just due
-    #       to tech debt
-    parser.add_argument(
-        "-d",
-        "--days_off",
-        nargs="+",
-        type=str,
-        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
-    )
 
-    args = parser.parse_args()
-    sprint_name = f"{args.release}-{args.sprint_number}"
+def plot_sprint_double_burndown(
+    sprint_tasks: "SprintTasks",
+    sprint_name: str,
+    charts_dir: Path,
+    until_day: Optional["Timestamp"] = None,
+    days_off: Optional[List["Timestamp"]] = None,
+) -> None:
+    """
+    Plot the burndown of the sprint planning points together with the burndown of the creep.
 
-    until_day = (
-        pd.to_datetime("today")
-        if args.until_day is None
-        else pd.to_datetime(args.until_day)
-    )
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        sprint_name (str): Name of the sprint
+        charts_dir (Path): Directory to store the plot to
+        until_day (Optional[Timestamp], optional): Until what day to get the burndown
+            to. Defaults to None (today).
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+    """
+    import pandas as pd
 
-    root_path = Path(__file__).parents[1].resolve()
-    charts_dir = root_path.joinpath("charts")
-    sheet_dir = root_path.joinpath("data")
-    sprint_tasks_path = sheet_dir.joinpath("sprint_tasks.xlsx")
-    burndown_path = sheet_dir.joinpath("burndown.xlsx")
+    from burndown.plots import plot_double_burndown
+    from burndown.sprint_dates import SprintDates
 
-    sprint_tasks = SprintTasks(
-        sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
-    )
+    if until_day is None:
+        until_day = pd.to_datetime("today")
 
     # In case until_day is outside of the sprint range
     if until_day > sprint_tasks.burndown_sheets[sprint_name].index.max():
@@ -78,11 +62,6 @@ def main() -> None:
         sprint_name=sprint_name, until_date=until_day
     )
 
-    days_off = (
-        [pd.to_datetime(date) for date in args.days_off]
-        if args.days_off is not None
-        else None
-    )
     sprint_dates = SprintDates(
         sprint_tasks.burndown_sheets[sprint_name].index[0],
         len(sprint_tasks.burndown_sheets[sprint_name].index),
@@ -99,5 +78,68 @@ def main() -> None:
     )
 
 
+def main() -> None:
+    """
+    Plot the total burn and creep together with the creep categories for a certain sprint.
+    """
+    parser = argparse.ArgumentParser(description="Plot the sprint trends.")
+    parser.add_argument(
+        "-r", "--release", type=str, help="Release number", required=True
+    )
+    parser.add_argument("-s", "--sprint_number", type=str, help="Sprint number")
+    parser.add_argument(
+        "-u",
+        "--until_day",
+        type=str,
+        help="Until what day to get the burndown to (on the form yyyy-mm-dd)",
+    )
+    # NOTE: We shouldn't be needing the burndown sheet, and we shouldn't be
+    #       needing to add the days off argument every time. This is just due
+    #       to tech debt
+    parser.add_argument(
+        "-d",
+        "--days_off",
+        nargs="+",
+        type=str,
+        help="Days without development on the form yyyy-mm-dd (week-ends are inferred)",
+    )
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        import pandas as pd
+
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        sprint_name = f"{args.release}-{args.sprint_number}"
+
+        until_day = None if args.until_day is None else pd.to_datetime(args.until_day)
+
+        root_path = Path(__file__).parents[1].resolve()
+        charts_dir = root_path.joinpath("charts")
+        sheet_dir = root_path.joinpath("data")
+        sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+        )
+
+        days_off = (
+            [pd.to_datetime(date) for date in args.days_off]
+            if args.days_off is not None
+            else None
+        )
+
+        plot_sprint_double_burndown(
+            sprint_tasks,
+            sprint_name,
+            charts_dir,
+            until_day=until_day,
+            days_off=days_off,
+        )
+
+
 if __name__ == "__main__":
     main()
@@ -2,37 +2,59 @@
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from burndown.plots import (
-    plot_achievement_trend,
-    plot_burn_per_person_day,
-    plot_burn_trend,
-    plot_creep_trend,
-)
-from burndown.sprint_tasks import SprintTasks
+from burndown.options import AGGREGATION_LABELS
+from burndown.profiling import add_profile_argument, profiling
 
+if TYPE_CHECKING:
+    from burndown.sprint_tasks import SprintTasks
 
-def main() -> None:
-    """
-    Plot the total burn and creep together with the creep categories for a certain sprint.
+
+def plot_sprint_trends(
+    sprint_tasks: "SprintTasks",
+    charts_dir: Path,
+    release: Optional[str] = None,
+    aggregate: str = "sprint",
+    remaining_points: Optional[float] = None,
+    capacity: Optional[List[float]] = None,
+    n_trials: int = 100_000,
+) -> None:
     """
-    parser = argparse.ArgumentParser(description="Plot the sprint trends.")
-    parser.add_argument(
-        "-r",
-        "--release",
-        type=str,
-        help="Release number (if none is given, the trends will be plotted over all releases)",
-    )
-    args = parser.parse_args()
+    Print the release statistics and plot the trends across sprints.
 
-    root_path = Path(__file__).parents[1].resolve()
-    charts_dir = root_path.joinpath("charts")
-    sheet_dir = root_path.joinpath("data")
-    sprint_tasks_path = sheet_dir.joinpath("sprint_tasks.xlsx")
-    burndown_path = sheet_dir.joinpath("burndown.xlsx")
+    The completion of the release (or the latest release) is forecasted as well if
+    its remaining points are given.
 
-    sprint_tasks = SprintTasks(
-        sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+    Args:
+        sprint_tasks (SprintTasks): The loaded sprint tasks
+        charts_dir (Path): Directory to store the plots to
+        release (Optional[str], optional): Release to plot the trends of.
+            Defaults to None (all releases).
+        aggregate (str, optional): Whether to plot the trends per sprint, release
+            or quarter. Defaults to "sprint".
+        remaining_points (Optional[float], optional): The points remaining of the
+            forecasted release, including the work planned for its future sprints.
+            Defaults to None (no forecast).
+        capacity (Optional[List[float]], optional): The planned person days of the
+            future sprints, where the last one is repeated. Defaults to None (the
+            mean of the last 5 sprints).
+        n_trials (int, optional): The number of trials of the forecast.
+            Defaults to 100_000.
+    """
+    from burndown.forecast import forecast_sprint_tasks
+    from burndown.metrics import get_metric_group, get_metrics
+    from burndown.plots import (
+        plot_achievement_trend,
+        plot_burn_per_person_day,
+        plot_burn_trend,
+        plot_creep_trend,
+        plot_release_forecast,
+    )
+    from burndown.trend_aggregation import (
+        aggregate_categories,
+        aggregate_total_burn,
+        get_buckets,
     )
 
     # Obtain the data frames
@@ -41,62 +63,89 @@ def main() -> None:
     creep_categories = sprint_tasks.get_creep_categories()
 
     # Print release statistics
-    burn_categories_sum = burn_categories.groupby("Release").sum()
-    creep_categories_sum = creep_categories.groupby("Release").sum()
-    person_day_sum = (
-        total_burn.loc[:, ["person_days", "Release"]].groupby("Release").sum()
-    )
+    release_metrics = get_metrics(total_burn, burn_categories, creep_categories)
+    totals = get_metric_group(release_metrics, "total")
     print("Absolute sum:")
     print("=" * 80)
     print("Total person days:")
     print("-" * 80)
-    print(person_day_sum.sum(axis=1))
+    print(totals.loc[:, "person_days"])
     print("-" * 80)
     print("Total points burned:")
     print("-" * 80)
-    print(burn_categories_sum.sum(axis=1))
+    print(totals.loc[:, "burned"])
     print("-" * 80)
     print("Total points creep:")
     print("-" * 80)
-    print(creep_categories_sum.sum(axis=1))
+    print(totals.loc[:, "creep"])
     print("-" * 80)
     print("\n")
     print("Points burned:")
     print("=" * 80)
     print("Points burned per category:")
     print("-" * 80)
-    print(burn_categories_sum)
+    print(get_metric_group(release_metrics, "burned"))
     print("-" * 80)
     print("Creep burned per category:")
     print("-" * 80)
-    print(creep_categories_sum)
+    print(get_metric_group(release_metrics, "creep"))
     print("-" * 80)
     print("\n")
     print("Percentage burned:")
     print("=" * 80)
     print("Percentage burned per category:")
     print("-" * 80)
-    print(100 * burn_categories_sum.div(burn_categories_sum.sum(axis=1), axis=0))
+    print(get_metric_group(release_metrics, "burned_percentage"))
     print("-" * 80)
     print("Percentage creep per category:")
     print("-" * 80)
-    print(100 * creep_categories_sum.div(creep_categories_sum.sum(axis=1), axis=0))
+    print(get_metric_group(release_metrics, "creep_percentage"))
     print("-" * 80)
     print("\n")
 
+    # Forecast the release from all the sprints
+    if remaining_points is not None:
+        release_burnup_df, fan, completion = forecast_sprint_tasks(
+            sprint_tasks,
+            total_burn,
+            creep_categories,
+            remaining_points,
+            release=release,
+            capacity=capacity,
+            n_trials=n_trials,
+        )
+        forecast_release = release_burnup_df.loc[:, "sprint"].iloc[-1].split("-")[0]
+        print(f"Forecast of release {forecast_release}:")
+        print("=" * 80)
+        print(f"Remaining points: {fan.iloc[0, 0]:.1f}")
+        print("-" * 80)
+        print("Completed by the end of the sprint with probability:")
+        print("-" * 80)
+        print(completion)
+        print("-" * 80)
+        print("\n")
+
     # Get the required release and drop the column
-    if args.release is not None:
-        total_burn = total_burn.loc[total_burn.loc[:, "Release"] == args.release, :]
+    if release is not None:
+        total_burn = total_burn.loc[total_burn.loc[:, "Release"] == release, :]
         burn_categories = burn_categories.loc[
-            burn_categories.loc[:, "Release"] == args.release, :
+            burn_categories.loc[:, "Release"] == release, :
         ]
         creep_categories = creep_categories.loc[
-            creep_categories.loc[:, "Release"] == args.release, :
+            creep_categories.loc[:, "Release"] == release, :
         ]
     total_burn.drop("Release", axis=1, inplace=True)
     burn_categories.drop("Release", axis=1, inplace=True)
     creep_categories.drop("Release", axis=1, inplace=True)
 
+    # Aggregate the sprints
+    x_label = AGGREGATION_LABELS[aggregate]
+    if aggregate != "sprint":
+        buckets = get_buckets(sprint_tasks.get_sprint_start_dates(), aggregate)
+        total_burn = aggregate_total_burn(total_burn, buckets)
+        burn_categories = aggregate_categories(burn_categories, buckets)
+        creep_categories = aggregate_categories(creep_categories, buckets)
+
     # Make percentage data frames
     burn_categories_row_pct = 100 * burn_categories.div(
         burn_categories.sum(axis=1), axis=0
@@ -108,12 +157,87 @@ def main() -> None:
     )
 
     # Plot
-    plot_burn_trend(burn_categories, charts_dir, percentage=False)
-    plot_burn_trend(burn_categories_row_pct, charts_dir, percentage=True)
-    plot_creep_trend(creep_categories, charts_dir, percentage=False)
-    plot_creep_trend(creep_categories_row_pct, charts_dir, percentage=True)
-    plot_achievement_trend(total_burn, charts_dir)
-    plot_burn_per_person_day(total_burn, charts_dir)
+    plot_burn_trend(burn_categories, charts_dir, percentage=False, x_label=x_label)
+    plot_burn_trend(
+        burn_categories_row_pct, charts_dir, percentage=True, x_label=x_label
+    )
+    plot_creep_trend(creep_categories, charts_dir, percentage=False, x_label=x_label)
+    plot_creep_trend(
+        creep_categories_row_pct, charts_dir, percentage=True, x_label=x_label
+    )
+    plot_achievement_trend(total_burn, charts_dir, x_label=x_label)
+    plot_burn_per_person_day(total_burn, charts_dir, x_label=x_label)
+    if remaining_points is not None:
+        plot_release_forecast(
+            release_burnup_df, fan, completion, charts_dir, forecast_release
+        )
+
+
+def main() -> None:
+    """
+    Plot the total burn and creep together with the creep categories for a certain sprint.
+    """
+    parser = argparse.ArgumentParser(description="Plot the sprint trends.")
+    parser.add_argument(
+        "-r",
+        "--release",
+        type=str,
+        help="Release number (if none is given, the trends will be plotted over all releases)",
+    )
+    parser.add_argument(
+        "-a",
+        "--aggregate",
+        default="sprint",
+        choices=list(AGGREGATION_LABELS.keys()),
+        help="Whether to plot the trends per sprint, release or calendar quarter",
+    )
+    parser.add_argument(
+        "-p",
+        "--remaining_points",
+        type=float,
+        help="Points remaining of the forecasted release, including the work planned "
+        "for its future sprints (the release is only forecasted if given)",
+    )
+    parser.add_argument(
+        "-c",
+        "--capacity",
+        nargs="+",
+        type=float,
+        help="Planned person days of the future sprints, where the last one is "
+        "repeated (defaults to the mean of the last 5 sprints)",
+    )
+    parser.add_argument(
+        "-n",
+        "--n_trials",
+        type=int,
+        default=100_000,
+        help="Number of trials of the Monte Carlo forecast",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+        root_path = Path(__file__).parents[1].resolve()
+        charts_dir = root_path.joinpath("charts")
+        sheet_dir = root_path.joinpath("data")
+        sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        burndown_path = sheet_dir.joinpath("burndown.xlsx")
+
+        sprint_tasks = SprintTasks(
+            sprint_tasks_path=sprint_tasks_path, burndown_path=burndown_path
+        )
+
+        plot_sprint_trends(
+            sprint_tasks,
+            charts_dir,
+            args.release,
+            args.aggregate,
+            args.remaining_points,
+            args.capacity,
+            args.n_trials,
+        )
 
 
 if __name__ == "__main__":
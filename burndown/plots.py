@@ -1,15 +1,165 @@
 """Module containing burndown plots."""
 
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Iterable, Sequence, Union
 
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
+import numpy as np
 import pandas as pd
+from matplotlib.collections import PolyCollection
 
-from burndown.sprint_dates import SprintDates
+from burndown.cumulative_flow import FLOW_LABELS
+from burndown.profiling import profiled, span
+from burndown.sprint_dates import SprintDates, get_ranges_without_development
 
 
+def shade_days_without_development(
+    axis: plt.Axes, dates_without_development: Iterable
+) -> None:
+    """Shade the days without development as one collection.
+
+    Args:
+        axis (plt.Axes): The axis to shade
+        dates_without_development (Iterable): Days without development
+    """
+    ranges = get_ranges_without_development(dates_without_development)
+    if len(ranges) == 0:
+        return
+    x_ranges = mdates.date2num(np.array(ranges, dtype="datetime64[ns]"))
+    # The x-values are in data coordinates, whereas the y-values span the whole axis
+    vertices = [[(xmin, 0), (xmin, 1), (xmax, 1), (xmax, 0)] for xmin, xmax in x_ranges]
+    axis.add_collection(
+        PolyCollection(
+            vertices,
+            transform=axis.get_xaxis_transform(),
+            facecolor="gray",
+            edgecolor="none",
+            alpha=0.3,
+        )
+    )
+    # Make sure the shaded days are within the view
+    axis.update_datalim(
+        np.column_stack([x_ranges.ravel(), np.zeros(x_ranges.size)]),
+        updatex=True,
+        updatey=False,
+    )
+
+
+def set_date_ticks(
+    axis: plt.Axes, dates: pd.DatetimeIndex, max_ticks: int = 31
+) -> None:
+    """Set one tick per date, or let matplotlib choose the ticks for long periods.
+
+    Args:
+        axis (plt.Axes): The axis to set the ticks on
+        dates (pd.DatetimeIndex): The dates of the plot
+        max_ticks (int, optional): Maximum number of dates to tick individually.
+            Defaults to 31.
+    """
+    if len(dates) <= max_ticks:
+        axis.set_xticks(dates)
+    else:
+        locator = mdates.AutoDateLocator(maxticks=max_ticks)
+        axis.xaxis.set_major_locator(locator)
+        axis.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    for label in axis.get_xticklabels():
+        label.set_rotation(65)
+
+
+def set_decimated_ticks(
+    axis: plt.Axes, labels: Sequence[str], max_ticks: int = 30
+) -> None:
+    """Label the x-values 0, 1, ... with every n-th label so that at most max_ticks show.
+
+    Args:
+        axis (plt.Axes): The axis to set the ticks on
+        labels (Sequence[str]): The label of each x-value
+        max_ticks (int, optional): Maximum number of ticks to show. Defaults to 30.
+    """
+    step = max(1, int(np.ceil(len(labels) / max_ticks)))
+    # Count the steps from the end, so that the latest entry is always labeled
+    ticks = np.arange(len(labels))[::-1][::step][::-1]
+    axis.set_xticks(ticks)
+    axis.set_xticklabels([labels[tick] for tick in ticks], rotation=65)
+
+
+def get_stack_bottoms(values: np.ndarray) -> np.ndarray:
+    """Get the bottoms of a stack where positive and negative values are stacked apart.
+
+    Positive values are stacked upwards from 0 and negative values downwards from 0,
+    in the order of the columns.
+
+    Args:
+        values (np.ndarray): Matrix of shape (x-values, categories) to stack
+
+    Returns:
+        np.ndarray: The bottom of each value (same shape as values)
+    """
+    values = np.asarray(values, dtype=float)
+    pos_values = np.clip(values, a_min=0, a_max=None)
+    neg_values = np.clip(values, a_min=None, a_max=0)
+    pos_cumsum = np.cumsum(pos_values, axis=1)
+    neg_cumsum = np.cumsum(neg_values, axis=1)
+    # The bottom of a value is the cumulative sum of the preceding values. Zeros are
+    # put on top of the positive values, so the edges of the areas stay continuous
+    return np.where(values >= 0, pos_cumsum - pos_values, neg_cumsum - neg_values)
+
+
+def plot_stacked_bars(
+    axis: plt.Axes, x_values: Sequence, values: np.ndarray, labels: Sequence[str]
+) -> None:
+    """Plot bars where positive and negative values are stacked apart.
+
+    Args:
+        axis (plt.Axes): The axis to plot on
+        x_values (Sequence): The x-values of the bars
+        values (np.ndarray): Matrix of shape (x-values, categories) to stack
+        labels (Sequence[str]): The label of each category
+    """
+    if values.size == 0:
+        return
+    bottoms = get_stack_bottoms(values)
+    for index, label in enumerate(labels):
+        axis.bar(x_values, values[:, index], bottom=bottoms[:, index], label=label)
+
+
+def plot_stacked_areas(
+    axis: plt.Axes,
+    x_values: Sequence,
+    values: np.ndarray,
+    labels: Sequence[str],
+    alpha: float = 0.6,
+) -> None:
+    """Plot areas where positive and negative values are stacked apart.
+
+    Unlike axis.stackplot, negative values (like re-estimations) will not eat into the
+    areas of the positive values.
+
+    Args:
+        axis (plt.Axes): The axis to plot on
+        x_values (Sequence): The x-values of the areas
+        values (np.ndarray): Matrix of shape (x-values, categories) to stack
+        labels (Sequence[str]): The label of each category
+        alpha (float, optional): Transparency of the areas. Defaults to 0.6.
+    """
+    if values.size == 0:
+        return
+    values = np.asarray(values, dtype=float)
+    bottoms = get_stack_bottoms(values)
+    for index, label in enumerate(labels):
+        axis.fill_between(
+            x_values,
+            bottoms[:, index],
+            bottoms[:, index] + values[:, index],
+            alpha=alpha,
+            label=label,
+            linewidth=0,
+        )
+
+
+@profiled("plot")
 def plot_burndown(
     burndown_df: pd.DataFrame,
     sprint_dates: SprintDates,
@@ -28,10 +178,7 @@ def plot_burndown(
     _, axis = plt.subplots()
 
     # Shading
-    for date in sprint_dates.dates_without_development:
-        xmin = date - pd.DateOffset(1)
-        xmax = date
-        axis.axvspan(xmin=xmin, xmax=xmax, alpha=0.3, color="gray")
+    shade_days_without_development(axis, sprint_dates.dates_without_development)
 
     # Line plots
     (ideal,) = axis.plot(
@@ -53,9 +200,7 @@ def plot_burndown(
     axis.set_title(f"{sprint_name} burndown")
     axis.set_ylabel("Storypoints")
     axis.set_xlabel("Date")
-    axis.set_xticks(burndown_df.index)
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    set_date_ticks(axis, burndown_df.index)
 
     # Save
     plt.tight_layout()
@@ -63,9 +208,12 @@ def plot_burndown(
         f"{pd.to_datetime('today').date()}-burndown-{sprint_name.lower()}.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_double_burndown(
     sprint_burndown_df: pd.DataFrame,
     creep_burndown_df: pd.DataFrame,
@@ -91,10 +239,7 @@ def plot_double_burndown(
     fig.set_size_inches([6.4, 4.8 * 2])
 
     # Shading
-    for date in sprint_dates.dates_without_development:
-        xmin = date - pd.DateOffset(1)
-        xmax = date
-        ax1.axvspan(xmin=xmin, xmax=xmax, alpha=0.3, color="gray")
+    shade_days_without_development(ax1, sprint_dates.dates_without_development)
 
     # Line plots
     (ideal,) = ax1.plot(
@@ -119,29 +264,15 @@ def plot_double_burndown(
     )
 
     # Stacked bar plot
-    dates = daily_creep.pop("date")
-    # Initialize bottom values to 0
-    if len(daily_creep) != 0:
-        pos_values_cur_bottom = [0] * len(daily_creep[list(daily_creep.keys())[0]])
+    categories = [category for category in daily_creep.keys() if category != "date"]
+    if len(categories) != 0:
+        creep_matrix = np.column_stack(
+            [np.asarray(daily_creep[category], dtype=float) for category in categories]
+        )
     else:
-        # In case there ar no creeps
-        pos_values_cur_bottom = [0]
-    neg_values_cur_bottom = [0] * len(pos_values_cur_bottom)
-    bottom = [0] * len(neg_values_cur_bottom)
-    for category, values in daily_creep.items():
-        # Keep track of positive and negative values as two different stacks
-        for index, value in enumerate(values):
-            if value > 0:
-                bottom[index] = pos_values_cur_bottom[index]
-            else:
-                bottom[index] = neg_values_cur_bottom[index]
-        ax2.bar(dates, values, bottom=bottom, label=category)
-        # Update prev values
-        for index, value in enumerate(values):
-            if value > 0:
-                pos_values_cur_bottom[index] += value
-            else:
-                neg_values_cur_bottom[index] += value
+        # In case there are no creeps
+        creep_matrix = np.zeros((len(daily_creep["date"]), 0))
+    plot_stacked_bars(ax2, daily_creep["date"], creep_matrix, categories)
 
     # Prettifying ax1
     ax1.set_title(f"{sprint_name} burndown")
@@ -154,9 +285,7 @@ def plot_double_burndown(
     ax2.legend(loc="best", shadow=True)
     ax2.set_ylabel("Added creeps")
     ax2.set_xlabel("Date")
-    ax2.set_xticks(sprint_burndown_df.index)
-    for label in ax2.get_xticklabels():
-        label.set_rotation(65)
+    set_date_ticks(ax2, sprint_burndown_df.index)
     # Mark 0
     ax2.axhline(y=0, color="k", linestyle="dashed")
 
@@ -166,9 +295,12 @@ def plot_double_burndown(
         f"{pd.to_datetime('today').date()}-double_burndown-{sprint_name.lower()}.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_sprint_burn_and_creep(
     sprint_creep_df: pd.DataFrame,
     sprint_dates: SprintDates,
@@ -187,10 +319,7 @@ def plot_sprint_burn_and_creep(
     _, axis = plt.subplots()
 
     # Shading
-    for date in sprint_dates.dates_without_development:
-        xmin = date - pd.DateOffset(1)
-        xmax = date
-        axis.axvspan(xmin=xmin, xmax=xmax, alpha=0.3, color="gray")
+    shade_days_without_development(axis, sprint_dates.dates_without_development)
 
     # Line plots
     (total,) = axis.plot(
@@ -213,9 +342,7 @@ def plot_sprint_burn_and_creep(
     axis.set_title(f"{sprint_name} Burn and Creep")
     axis.set_ylabel("Storypoints")
     axis.set_xlabel("Date")
-    axis.set_xticks(sprint_creep_df.index)
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    set_date_ticks(axis, sprint_creep_df.index)
 
     # Save
     plt.tight_layout()
@@ -223,9 +350,139 @@ def plot_sprint_burn_and_creep(
         f"{pd.to_datetime('today').date()}-total_burn_and_creep-{sprint_name.lower()}.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_release_burnup(
+    release_burnup_df: pd.DataFrame,
+    sprint_dates: SprintDates,
+    save_dir: Path,
+    release: str,
+) -> None:
+    """Plot and save the burnup of a release.
+
+    Args:
+        release_burnup_df (pd.DataFrame): The data frame containing the scope and done
+            points of the release
+        sprint_dates (SprintDates): Sprint dates object spanning the release
+        save_dir (Path): Directory to store the plot to
+        release (str): Name of the release
+    """
+    plt.style.use("ggplot")
+    fig, axis = plt.subplots()
+    fig.set_size_inches([10, 4.8])
+
+    # Shading
+    shade_days_without_development(axis, sprint_dates.dates_without_development)
+
+    # Sprint boundaries
+    sprint_starts = release_burnup_df.index[
+        release_burnup_df.loc[:, "sprint"].ne(
+            release_burnup_df.loc[:, "sprint"].shift()
+        )
+    ]
+    axis.vlines(
+        sprint_starts,
+        ymin=0,
+        ymax=1,
+        transform=axis.get_xaxis_transform(),
+        color="gray",
+        linestyle="dotted",
+        linewidth=1,
+    )
+
+    # Line plots
+    (scope,) = axis.plot(
+        release_burnup_df.index,
+        release_burnup_df["scope"],
+        drawstyle="steps-post",
+        label="Scope",
+    )
+    (done,) = axis.plot(
+        release_burnup_df.index,
+        release_burnup_df["done"],
+        drawstyle="steps-post",
+        label="Done",
+    )
+
+    # Prettifying
+    axis.legend(handles=[scope, done], loc="best", shadow=True)
+    axis.set_title(f"{release} burnup")
+    axis.set_ylabel("Storypoints")
+    axis.set_xlabel("Date")
+    set_date_ticks(axis, release_burnup_df.index)
+
+    # Save
+    plt.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-release_burnup-{release.lower()}.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_cumulative_flow(
+    flow_df: pd.DataFrame,
+    sprint_dates: SprintDates,
+    save_dir: Path,
+    name: str,
+    points: bool = True,
+) -> None:
+    """Plot and save the cumulative flow diagram of a sprint or release.
+
+    Args:
+        flow_df (pd.DataFrame): The data frame containing the points (or tasks) in
+            each state on each day
+        sprint_dates (SprintDates): Sprint dates object spanning the days
+        save_dir (Path): Directory to store the plot to
+        name (str): Name of the sprint or release
+        points (bool, optional): Whether the values are points instead of tasks.
+            Defaults to True.
+    """
+    plt.style.use("ggplot")
+    fig, axis = plt.subplots()
+    fig.set_size_inches([10, 4.8])
+
+    # Shading
+    shade_days_without_development(axis, sprint_dates.dates_without_development)
+
+    # Stacked areas
+    plot_stacked_areas(
+        axis,
+        flow_df.index,
+        flow_df.to_numpy(),
+        [FLOW_LABELS.get(state, state) for state in flow_df.columns],
+        alpha=0.8,
+    )
+
+    # Prettifying
+    handles, labels = axis.get_legend_handles_labels()
+    # The top of the stack first
+    axis.legend(handles[::-1], labels[::-1], loc="upper left", shadow=True)
+    axis.set_title(f"{name} cumulative flow")
+    axis.set_ylabel("Storypoints" if points else "Tasks")
+    axis.set_xlabel("Date")
+    axis.set_xlim(flow_df.index[0], flow_df.index[-1])
+    set_date_ticks(axis, flow_df.index)
+
+    # Save
+    plt.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-cumulative_flow-{name.lower()}.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_sprint_creep_categories(
     sprint_creep_categories_df: pd.DataFrame, save_dir: Path, sprint_name: str
 ) -> None:
@@ -257,9 +514,12 @@ def plot_sprint_creep_categories(
         f"{pd.to_datetime('today').date()}-creep_categories-{sprint_name.lower()}.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_sprint_categories(
     sprint_categories_df: pd.DataFrame, save_dir: Path, sprint_name: str
 ) -> None:
@@ -294,11 +554,17 @@ def plot_sprint_categories(
         f"{pd.to_datetime('today').date()}-categories-{sprint_name.lower()}.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_burn_trend(
-    burn_trend_df: pd.DataFrame, save_dir: Path, percentage: bool
+    burn_trend_df: pd.DataFrame,
+    save_dir: Path,
+    percentage: bool,
+    x_label: str = "Sprint",
 ) -> None:
     """
     Plot and save the trend of burn categories.
@@ -307,7 +573,10 @@ def plot_burn_trend(
         creep_trend_df (pd.DataFrame): The data frame containing the creep trend
         save_dir (Path): Directory to store the plot to
         percentage (bool): Whether or not we're plotting a percentage
+        x_label (str, optional): What the entries of the data frame are.
+            Defaults to "Sprint".
     """
+    x_values = np.arange(len(burn_trend_df.index))
     plt.style.use("ggplot")
     fig, axis = plt.subplots()
     # NOTE: There are a bit too few colors in the cycle of ggplot, so we add some more
@@ -317,10 +586,11 @@ def plot_burn_trend(
     fig.set_size_inches([10, 4.8])
 
     # Stack plot
-    axis.stackplot(
-        burn_trend_df.index,
-        burn_trend_df.values.T,
-        labels=burn_trend_df.columns,
+    plot_stacked_areas(
+        axis,
+        x_values,
+        burn_trend_df.values,
+        burn_trend_df.columns,
         alpha=0.6,
     )
 
@@ -335,9 +605,8 @@ def plot_burn_trend(
     else:
         axis.set_ylabel("Percentage")
         axis.yaxis.set_major_formatter(mtick.PercentFormatter())
-    axis.set_xlabel("Sprint")
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    axis.set_xlabel(x_label)
+    set_decimated_ticks(axis, burn_trend_df.index)
 
     # Save
     plt.tight_layout()
@@ -350,11 +619,17 @@ def plot_burn_trend(
             f"{pd.to_datetime('today').date()}-category_trend_percentage.png"
         )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
+@profiled("plot")
 def plot_creep_trend(
-    creep_trend_df: pd.DataFrame, save_dir: Path, percentage: bool
+    creep_trend_df: pd.DataFrame,
+    save_dir: Path,
+    percentage: bool,
+    x_label: str = "Sprint",
 ) -> None:
     """
     Plot and save the trend of creep categories.
@@ -363,16 +638,20 @@ def plot_creep_trend(
         creep_trend_df (pd.DataFrame): The data frame containing the creep trend
         save_dir (Path): Directory to store the plot to
         percentage (bool): Whether or not we're plotting a percentage
+        x_label (str, optional): What the entries of the data frame are.
+            Defaults to "Sprint".
     """
+    x_values = np.arange(len(creep_trend_df.index))
     plt.style.use("ggplot")
     fig, axis = plt.subplots()
     fig.set_size_inches([10, 4.8])
 
     # Stack plot
-    axis.stackplot(
-        creep_trend_df.index,
-        creep_trend_df.values.T,
-        labels=creep_trend_df.columns,
+    plot_stacked_areas(
+        axis,
+        x_values,
+        creep_trend_df.values,
+        creep_trend_df.columns,
         alpha=0.6,
     )
 
@@ -387,9 +666,8 @@ def plot_creep_trend(
     else:
         axis.set_ylabel("Percentage")
         axis.yaxis.set_major_formatter(mtick.PercentFormatter())
-    axis.set_xlabel("Sprint")
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    axis.set_xlabel(x_label)
+    set_decimated_ticks(axis, creep_trend_df.index)
 
     # Save
     plt.tight_layout()
@@ -403,10 +681,15 @@ def plot_creep_trend(
         )
 
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
-def plot_burndown_trend(burndown_trend_df: pd.DataFrame, save_dir: Path) -> None:
+@profiled("plot")
+def plot_burndown_trend(
+    burndown_trend_df: pd.DataFrame, save_dir: Path, x_label: str = "Sprint"
+) -> None:
     """
     Plot and save the burndown trend.
 
@@ -414,20 +697,23 @@ def plot_burndown_trend(burndown_trend_df: pd.DataFrame, save_dir: Path) -> None
         burndown_trend_df (pd.DataFrame): The data frame containing the burndowns across
             sprints
         save_dir (Path): Directory to store the plot to
+        x_label (str, optional): What the entries of the data frame are.
+            Defaults to "Sprint".
     """
+    x_values = np.arange(len(burndown_trend_df.index))
     plt.style.use("ggplot")
     _, axis = plt.subplots()
 
     # Line plots
     (total,) = axis.plot(
-        burndown_trend_df.index,
+        x_values,
         burndown_trend_df["total_points"],
         marker=".",
         markersize=9,
         label="Total burnt points",
     )
     (sprint_burn,) = axis.plot(
-        burndown_trend_df.index,
+        x_values,
         burndown_trend_df["sprint_start_burned"],
         marker="X",
         markersize=9,
@@ -440,9 +726,8 @@ def plot_burndown_trend(burndown_trend_df: pd.DataFrame, save_dir: Path) -> None
     # Prettifying
     axis.set_title("Burndown Trend")
     axis.set_ylabel("Storypoints")
-    axis.set_xlabel("Sprint")
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    axis.set_xlabel(x_label)
+    set_decimated_ticks(axis, burndown_trend_df.index)
 
     # Save
     plt.tight_layout()
@@ -450,23 +735,31 @@ def plot_burndown_trend(burndown_trend_df: pd.DataFrame, save_dir: Path) -> None
         f"{pd.to_datetime('today').date()}-burndown_trend.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
-def plot_achievement_trend(achievement_df: pd.DataFrame, save_dir: Path) -> None:
+@profiled("plot")
+def plot_achievement_trend(
+    achievement_df: pd.DataFrame, save_dir: Path, x_label: str = "Sprint"
+) -> None:
     """
     Plot and save the achievement trend.
 
     Args:
         achievement_df (pd.DataFrame): The data frame containing the burndowns across sprints
         save_dir (Path): Directory to store the plot to
+        x_label (str, optional): What the entries of the data frame are.
+            Defaults to "Sprint".
     """
+    x_values = np.arange(len(achievement_df.index))
     plt.style.use("ggplot")
     _, axis = plt.subplots()
 
     # Line plots
     axis.plot(
-        achievement_df.index,
+        x_values,
         achievement_df["achievement"],
         marker=".",
         markersize=9,
@@ -474,10 +767,9 @@ def plot_achievement_trend(achievement_df: pd.DataFrame, save_dir: Path) -> None
 
     # Prettifying
     axis.set_title("Points from sprint planning burned")
-    axis.set_xlabel("Sprint")
+    axis.set_xlabel(x_label)
+    set_decimated_ticks(axis, achievement_df.index)
     axis.yaxis.set_major_formatter(mtick.PercentFormatter())
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
 
     # Save
     plt.tight_layout()
@@ -485,10 +777,15 @@ def plot_achievement_trend(achievement_df: pd.DataFrame, save_dir: Path) -> None
         f"{pd.to_datetime('today').date()}-achievement_trend.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
 
 
-def plot_burn_per_person_day(burndown_trend_df: pd.DataFrame, save_dir: Path) -> None:
+@profiled("plot")
+def plot_burn_per_person_day(
+    burndown_trend_df: pd.DataFrame, save_dir: Path, x_label: str = "Sprint"
+) -> None:
     """
     Plot and save the burn per person day trend.
 
@@ -496,23 +793,26 @@ def plot_burn_per_person_day(burndown_trend_df: pd.DataFrame, save_dir: Path) ->
         burndown_trend_df (pd.DataFrame): The data frame containing the burndowns across
             sprints
         save_dir (Path): Directory to store the plot to
+        x_label (str, optional): What the entries of the data frame are.
+            Defaults to "Sprint".
     """
+    x_values = np.arange(len(burndown_trend_df.index))
     plt.style.use("ggplot")
     _, axis = plt.subplots()
 
     # Line plots
     (adjusted,) = axis.plot(
-        burndown_trend_df.index,
+        x_values,
         burndown_trend_df["burn_per_person_day"],
         marker=".",
         markersize=9,
         label="Burn per person day",
     )
     (avg,) = axis.plot(
-        burndown_trend_df.index,
+        x_values,
         burndown_trend_df["rolling_average"],
         linestyle="dashed",
-        label="Rolling mean (5 sprints)",
+        label=f"Rolling mean (5 {x_label.lower()}s)",
     )
 
     # Prettifying
@@ -521,9 +821,8 @@ def plot_burn_per_person_day(burndown_trend_df: pd.DataFrame, save_dir: Path) ->
     # Prettifying
     axis.set_title("Burn per person day")
     axis.set_ylabel("Storypoints")
-    axis.set_xlabel("Sprint")
-    for label in axis.get_xticklabels():
-        label.set_rotation(65)
+    axis.set_xlabel(x_label)
+    set_decimated_ticks(axis, burndown_trend_df.index)
 
     # Save
     plt.tight_layout()
@@ -531,4 +830,243 @@ def plot_burn_per_person_day(burndown_trend_df: pd.DataFrame, save_dir: Path) ->
         f"{pd.to_datetime('today').date()}-burn_per_person_day_trend.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_release_forecast(
+    release_burnup_df: pd.DataFrame,
+    fan: pd.DataFrame,
+    completion: pd.DataFrame,
+    save_dir: Path,
+    release: str,
+) -> None:
+    """Plot and save the forecast of the remaining points of a release as a fan chart.
+
+    Args:
+        release_burnup_df (pd.DataFrame): The data frame containing the remaining
+            points of the release so far
+        fan (pd.DataFrame): The percentiles of the remaining points at the end of the
+            future sprints
+        completion (pd.DataFrame): The completion date of each percentile
+        save_dir (Path): Directory to store the plot to
+        release (str): Name of the release
+    """
+    plt.style.use("ggplot")
+    fig, axis = plt.subplots()
+    fig.set_size_inches([10, 4.8])
+
+    # History
+    (remaining,) = axis.plot(
+        release_burnup_df.index,
+        release_burnup_df["remaining"],
+        drawstyle="steps-post",
+        color="C0",
+        label="Remaining",
+    )
+
+    # Only show the fan until the upper percentile is completed
+    completed = fan.iloc[:, -1].to_numpy() <= 0
+    if completed.any():
+        fan = fan.iloc[: completed.argmax() + 1]
+
+    # Fan of the outer and inner percentiles around the median
+    percentiles = list(fan.columns)
+    handles = [remaining]
+    for (lower, upper), alpha in zip(
+        zip(percentiles[: len(percentiles) // 2], percentiles[::-1]), (0.2, 0.4)
+    ):
+        handles.append(
+            axis.fill_between(
+                fan.index,
+                fan.loc[:, lower],
+                fan.loc[:, upper],
+                color="C1",
+                alpha=alpha,
+                linewidth=0,
+                label=f"{lower}-{upper}th percentile",
+            )
+        )
+    median_percentile = percentiles[len(percentiles) // 2]
+    (median,) = axis.plot(
+        fan.index,
+        fan.loc[:, median_percentile],
+        color="C1",
+        linestyle="dashed",
+        label="Median forecast",
+    )
+    handles.append(median)
+
+    # Completion dates, where percentiles completed on the same date share a label
+    completion_dates = completion.loc[:, "date"].dropna()
+    for i, (date, date_percentiles) in enumerate(
+        completion_dates.groupby(completion_dates, sort=True)
+    ):
+        label = ", ".join(f"{percentile}%" for percentile in date_percentiles.index)
+        axis.axvline(date, color="gray", linestyle="dotted", linewidth=1)
+        axis.annotate(
+            f"{label}: {date.date()}",
+            xy=(mdates.date2num(date), 1),
+            xycoords=axis.get_xaxis_transform(),
+            xytext=(-2, -12 * (i + 1)),
+            textcoords="offset points",
+            horizontalalignment="right",
+            fontsize="small",
+            color="gray",
+        )
+
+    # Prettifying
+    axis.legend(handles=handles, loc="best", shadow=True)
+    axis.set_title(f"{release} forecast")
+    axis.set_ylabel("Storypoints")
+    axis.set_xlabel("Date")
+    axis.set_ylim(bottom=0)
+    axis.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    fig.autofmt_xdate()
+
+    # Save
+    plt.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-release_forecast-{release.lower()}.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_lead_time_histogram(
+    lead_times: pd.DataFrame,
+    save_dir: Path,
+    percentiles: Sequence[float] = (50, 85, 95),
+) -> None:
+    """Plot and save the histogram of the lead times stacked by category.
+
+    Args:
+        lead_times (pd.DataFrame): The lead times of the tasks
+        save_dir (Path): Directory to store the plot to
+        percentiles (Sequence[float], optional): The percentiles to mark.
+            Defaults to (50, 85, 95).
+    """
+    plt.style.use("ggplot")
+    _, axis = plt.subplots()
+
+    # Count the tasks of each category and day in one pass
+    lead_time = lead_times.loc[:, "lead_time"]
+    valid = lead_time.notna().to_numpy()
+    days = lead_time.to_numpy()[valid].astype(int)
+    categories = lead_times.loc[:, "category"].astype("category")
+    codes = categories.cat.codes.to_numpy()[valid].astype(np.int64)
+    n_days = days.max() + 1 if len(days) != 0 else 1
+    n_categories = len(categories.cat.categories)
+    counts = np.bincount(
+        codes * n_days + days, minlength=n_categories * n_days
+    ).reshape(n_categories, n_days)
+
+    x_values = np.arange(n_days)
+    bottoms = get_stack_bottoms(counts.T).T
+    for i, category in enumerate(categories.cat.categories):
+        axis.bar(x_values, counts[i], bottom=bottoms[i], width=1, label=category)
+
+    # Percentiles
+    values = np.percentile(days, percentiles) if len(days) != 0 else list()
+    for percentile, value in zip(percentiles, values):
+        axis.axvline(value, color="gray", linestyle="dashed", linewidth=1)
+        axis.annotate(
+            f"{percentile}%",
+            xy=(value, 1),
+            xycoords=axis.get_xaxis_transform(),
+            xytext=(2, -12),
+            textcoords="offset points",
+            fontsize="small",
+            color="gray",
+        )
+
+    # Prettifying
+    axis.legend(loc="best", shadow=True)
+    axis.set_title("Lead time")
+    axis.set_ylabel("Tasks")
+    axis.set_xlabel("Days of development from created to closed")
+
+    # Save
+    plt.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-lead_time_histogram.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_lead_time_control_chart(
+    lead_times: pd.DataFrame, control_limits: pd.Series, save_dir: Path
+) -> None:
+    """Plot and save the lead times of the tasks by the date they were closed.
+
+    Args:
+        lead_times (pd.DataFrame): The lead times of the tasks
+        control_limits (pd.Series): The mean, lower and upper limit of the lead time
+        save_dir (Path): Directory to store the plot to
+    """
+    plt.style.use("ggplot")
+    fig, axis = plt.subplots()
+    fig.set_size_inches([10, 4.8])
+
+    # Tasks outside the limits are special causes of variation
+    lead_time = lead_times.loc[:, "lead_time"]
+    outside = (lead_time > control_limits["upper"]) | (
+        lead_time < control_limits["lower"]
+    )
+    axis.scatter(
+        lead_times.loc[~outside, "Date Closed"],
+        lead_time.loc[~outside],
+        s=6,
+        alpha=0.5,
+        color="C1",
+        label="Task",
+    )
+    axis.scatter(
+        lead_times.loc[outside, "Date Closed"],
+        lead_time.loc[outside],
+        s=9,
+        color="C0",
+        label="Outside the limits",
+    )
+
+    # Limits
+    axis.axhline(control_limits["mean"], color="gray", linewidth=1, label="Mean")
+    axis.axhline(
+        control_limits["upper"],
+        color="gray",
+        linestyle="dashed",
+        linewidth=1,
+        label="Control limits",
+    )
+    if control_limits["lower"] > 0:
+        axis.axhline(
+            control_limits["lower"], color="gray", linestyle="dashed", linewidth=1
+        )
+
+    # Prettifying
+    axis.legend(loc="best", shadow=True)
+    axis.set_title("Lead time control chart")
+    axis.set_ylabel("Days of development")
+    axis.set_xlabel("Date closed")
+    axis.set_ylim(bottom=0)
+    axis.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    fig.autofmt_xdate()
+
+    # Save
+    plt.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-lead_time_control_chart.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
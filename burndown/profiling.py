@@ -0,0 +1,477 @@
+"""Module for profiling the stages of a run with named spans.
+
+Spans are only recorded while profiling is enabled (by the --profile flag of the
+scripts), otherwise they cost one check of a global. The recorded spans are saved in
+the Chrome trace format, which can be opened in chrome://tracing or Perfetto.
+
+The --profile_memory flag additionally traces the allocations with tracemalloc, which
+makes the run several times slower. Every span then records the peak memory above
+its start and the memory it retained, and the largest retained allocations and
+DataFrames are printed at the end of the run.
+"""
+
+import argparse
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+FunctionType = TypeVar("FunctionType", bound=Callable[..., Any])
+
+
+def format_bytes(size: float) -> str:
+    """Format a number of bytes with a binary unit.
+
+    Args:
+        size (float): The number of bytes
+
+    Returns:
+        str: The size, e.g. 1.5 MiB
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class Span(NamedTuple):
+    """A named stage of a run."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    self_duration: float
+    thread_id: int
+    args: Dict[str, Any]
+    # The peak and retained bytes above the start of the span, None if the memory
+    # is not traced
+    peak_memory: Optional[int] = None
+    retained_memory: Optional[int] = None
+
+
+class Profiler:
+    """Class which records the spans of a run."""
+
+    def __init__(self, memory: bool = False) -> None:
+        """Initialize the list of spans, and start tracing the memory.
+
+        Args:
+            memory (bool, optional): Whether to trace the memory of the spans. The
+                allocations of all threads are traced, so the memory of spans run
+                concurrently is mixed. Defaults to False.
+        """
+        self.spans: List[Span] = list()
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        # The durations of the children of the open spans of each thread
+        self.local = threading.local()
+
+        self.memory = memory
+        self.frames: Dict[str, weakref.ref] = dict()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.frame_memory: Dict[str, int] = dict()
+        self.started_tracing = memory and not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **args: Any) -> Iterator[None]:
+        """Record the time spent in a span.
+
+        Args:
+            name (str): Name of the span
+            category (str, optional): Category of the span (e.g. load or plot).
+                Defaults to "stage".
+            **args (Any): Details of the span shown in the trace
+
+        Yields:
+            Iterator[None]: Context where the span is run
+        """
+        child_durations = getattr(self.local, "child_durations", None)
+        if child_durations is None:
+            child_durations = self.local.child_durations = list()
+        child_durations.append(0.0)
+        if self.memory:
+            self._start_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self_duration = duration - child_durations.pop()
+            if len(child_durations) != 0:
+                child_durations[-1] += duration
+            peak_memory, retained_memory = (
+                self._stop_memory() if self.memory else (None, None)
+            )
+            with self.lock:
+                self.spans.append(
+                    Span(
+                        name=name,
+                        category=category,
+                        start=start - self.origin,
+                        duration=duration,
+                        self_duration=self_duration,
+                        thread_id=threading.get_ident(),
+                        args=args,
+                        peak_memory=peak_memory,
+                        retained_memory=retained_memory,
+                    )
+                )
+
+    def _start_memory(self) -> None:
+        """Start measuring the memory of a span.
+
+        tracemalloc has a single peak, so the peak of the enclosing span is saved
+        before the peak is reset for the new span.
+        """
+        # The memory at the start and the peak so far of the open spans of the thread
+        memory_stack = getattr(self.local, "memory_stack", None)
+        if memory_stack is None:
+            memory_stack = self.local.memory_stack = list()
+        current, peak = tracemalloc.get_traced_memory()
+        if len(memory_stack) != 0:
+            memory_stack[-1][1] = max(memory_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        memory_stack.append([current, current])
+
+    def _stop_memory(self) -> Tuple[int, int]:
+        """Stop measuring the memory of a span.
+
+        Returns:
+            Tuple[int, int]: The peak and retained bytes above the start of the span
+        """
+        memory_stack = self.local.memory_stack
+        current, peak = tracemalloc.get_traced_memory()
+        start, peak_so_far = memory_stack.pop()
+        peak = max(peak, peak_so_far)
+        if len(memory_stack) != 0:
+            memory_stack[-1][1] = max(memory_stack[-1][1], peak)
+        return peak - start, current - start
+
+    def track_frame(self, name: str, frame: Any) -> None:
+        """Track a DataFrame to report its size at the end of the run if still alive.
+
+        Args:
+            name (str): Name of the DataFrame, replacing any frame of the same name
+            frame (Any): The DataFrame or Series
+        """
+        with self.lock:
+            self.frames[name] = weakref.ref(frame)
+
+    def close(self) -> None:
+        """Take a snapshot of the retained allocations and stop tracing.
+
+        The deep memory of the tracked DataFrames which are still alive is measured
+        after tracing has stopped.
+        """
+        if not self.memory:
+            return
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+        if self.started_tracing:
+            tracemalloc.stop()
+        for name, frame_ref in self.frames.items():
+            frame = frame_ref()
+            if frame is not None:
+                usage = frame.memory_usage(deep=True)
+                # A DataFrame has the usage of each column, a Series a single value
+                self.frame_memory[name] = int(
+                    usage.sum() if hasattr(usage, "sum") else usage
+                )
+
+    def save_trace(self, path: Path) -> None:
+        """Save the spans in the Chrome trace format.
+
+        Args:
+            path (Path): Path to the JSON file
+        """
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": 1e6 * span.start,
+                "dur": 1e6 * span.duration,
+                "pid": os.getpid(),
+                "tid": span.thread_id,
+                "args": {
+                    **{key: str(value) for key, value in span.args.items()},
+                    **(
+                        {
+                            "peak (MiB)": span.peak_memory / 2**20,
+                            "retained (MiB)": span.retained_memory / 2**20,
+                        }
+                        if span.peak_memory is not None
+                        else {}
+                    ),
+                },
+            }
+            for span in self.spans
+        ]
+        print(f"Saving trace to: {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    def get_summary(self) -> List[Dict[str, Any]]:
+        """Aggregate the spans by name.
+
+        Returns:
+            List[Dict[str, Any]]: The calls, total, self and maximum time of each
+                span name, and the maximum peak and total retained bytes if the
+                memory is traced, sorted by the self time
+        """
+        summary: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {
+                "calls": 0,
+                "total": 0.0,
+                "self": 0.0,
+                "max": 0.0,
+                "peak": 0,
+                "retained": 0,
+            }
+        )
+        for span in self.spans:
+            entry = summary[span.name]
+            entry["calls"] += 1
+            entry["total"] += span.duration
+            entry["self"] += span.self_duration
+            entry["max"] = max(entry["max"], span.duration)
+            if span.peak_memory is not None:
+                entry["peak"] = max(entry["peak"], span.peak_memory)
+                entry["retained"] += span.retained_memory
+        return sorted(
+            ({"name": name, **entry} for name, entry in summary.items()),
+            key=lambda entry: entry["self"],
+            reverse=True,
+        )
+
+    def print_summary(self, n_spans: int = 20) -> None:
+        """Print the spans which took the most time.
+
+        Args:
+            n_spans (int, optional): The number of spans to print. Defaults to 20.
+        """
+        summary = self.get_summary()[:n_spans]
+        width = max([len(entry["name"]) for entry in summary] + [len("Span")])
+        print("Top spans by self time:")
+        header = (
+            f"{'Span':<{width}} {'Calls':>6} {'Self (s)':>9} {'Total (s)':>9} "
+            f"{'Max (s)':>9}"
+        )
+        print(header)
+        print("-" * len(header))
+        for entry in summary:
+            print(
+                f"{entry['name']:<{width}} {entry['calls']:>6} {entry['self']:>9.3f} "
+                f"{entry['total']:>9.3f} {entry['max']:>9.3f}"
+            )
+
+    def print_memory_summary(self, n_spans: int = 20) -> None:
+        """Print the spans, allocations and DataFrames which used the most memory.
+
+        Args:
+            n_spans (int, optional): The number of rows of each table to print.
+                Defaults to 20.
+        """
+        if not self.memory:
+            return
+        summary = sorted(
+            self.get_summary(), key=lambda entry: entry["peak"], reverse=True
+        )[:n_spans]
+        width = max([len(entry["name"]) for entry in summary] + [len("Span")])
+        print("\nTop spans by peak memory:")
+        header = (
+            f"{'Span':<{width}} {'Calls':>6} {'Peak (MiB)':>11} {'Retained (MiB)':>15}"
+        )
+        print(header)
+        print("-" * len(header))
+        for entry in summary:
+            print(
+                f"{entry['name']:<{width}} {entry['calls']:>6} "
+                f"{entry['peak'] / 2**20:>11.2f} {entry['retained'] / 2**20:>15.2f}"
+            )
+
+        if self.snapshot is not None:
+            print("\nLargest retained allocations:")
+            for statistic in self.snapshot.statistics("lineno")[:n_spans]:
+                frame = statistic.traceback[0]
+                print(
+                    f"{format_bytes(statistic.size):>10} {statistic.count:>8} blocks  "
+                    f"{frame.filename}:{frame.lineno}"
+                )
+
+        if len(self.frame_memory) != 0:
+            print("\nLargest retained DataFrames:")
+            frames = sorted(
+                self.frame_memory.items(), key=lambda item: item[1], reverse=True
+            )
+            for name, size in frames[:n_spans]:
+                print(f"{format_bytes(size):>10}  {name}")
+            total = sum(self.frame_memory.values())
+            print(f"{format_bytes(total):>10}  in {len(frames)} DataFrames")
+
+
+# The profiler of the run, None when profiling is disabled
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the profiler of the run.
+
+    Returns:
+        Optional[Profiler]: The profiler, None if profiling is disabled
+    """
+    return _profiler
+
+
+@contextmanager
+def span(name: str, category: str = "stage", **args: Any) -> Iterator[None]:
+    """Record a span if profiling is enabled.
+
+    Args:
+        name (str): Name of the span
+        category (str, optional): Category of the span. Defaults to "stage".
+        **args (Any): Details of the span shown in the trace
+
+    Yields:
+        Iterator[None]: Context where the span is run
+    """
+    if _profiler is None:
+        yield
+        return
+    with _profiler.span(name, category, **args):
+        yield
+
+
+def is_tracing_memory() -> bool:
+    """Return whether the memory of the run is traced.
+
+    Returns:
+        bool: True if profiling is enabled with memory tracing
+    """
+    return _profiler is not None and _profiler.memory
+
+
+def track_frame(name: str, frame: Any) -> None:
+    """Track a DataFrame to report its size at the end of the run, if the memory is
+    traced.
+
+    Args:
+        name (str): Name of the DataFrame
+        frame (Any): The DataFrame or Series
+    """
+    if _profiler is not None and _profiler.memory:
+        _profiler.track_frame(name, frame)
+
+
+def profiled(
+    category: str = "stage", name: Optional[str] = None
+) -> Callable[[FunctionType], FunctionType]:
+    """Record a span around every call of the decorated function.
+
+    Args:
+        category (str, optional): Category of the span. Defaults to "stage".
+        name (Optional[str], optional): Name of the span. Defaults to None (the
+            qualified name of the function).
+
+    Returns:
+        Callable[[FunctionType], FunctionType]: The decorator
+    """
+
+    def decorator(function: FunctionType) -> FunctionType:
+        span_name = name if name is not None else function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _profiler is None:
+                return function(*args, **kwargs)
+            with _profiler.span(span_name, category):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def profiling(
+    trace_path: Optional[Path], memory: bool = False, n_spans: int = 20
+) -> Iterator[None]:
+    """Enable profiling, and save the trace and print the summary afterwards.
+
+    Args:
+        trace_path (Optional[Path]): Path to save the trace to. No trace is saved
+            if None.
+        memory (bool, optional): Whether to trace the memory. Profiling is
+            disabled if False and trace_path is None. Defaults to False.
+        n_spans (int, optional): The number of spans to print. Defaults to 20.
+
+    Yields:
+        Iterator[None]: Context where the run is profiled
+    """
+    global _profiler
+    if trace_path is None and not memory:
+        yield
+        return
+    _profiler = profiler = Profiler(memory)
+    try:
+        with profiler.span("run", "run"):
+            yield
+    finally:
+        _profiler = None
+        profiler.close()
+        if trace_path is not None:
+            profiler.save_trace(trace_path)
+        profiler.print_summary(n_spans)
+        profiler.print_memory_summary(n_spans)
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --profile and --profile_memory flags to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser of the script
+    """
+    root_path = Path(__file__).parents[1].resolve()
+    default_path = root_path.joinpath("charts", "profile.json")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=default_path,
+        help="Profile the stages of the run, print the slowest stages and save a "
+        f"Chrome trace to the given path (defaults to {default_path})",
+    )
+    parser.add_argument(
+        "--profile_memory",
+        action="store_true",
+        help="Profile the stages with traced memory (slower), and print the stages "
+        "with the highest peak memory and the largest retained allocations and "
+        "DataFrames",
+    )
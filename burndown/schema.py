@@ -0,0 +1,170 @@
+"""Module containing the schemas of the spreadsheets and their validation."""
+
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+class Column(NamedTuple):
+    """The name and kind of a column of a spreadsheet.
+
+    The kind is one of
+    - "date": datetime64 normalized to the day
+    - "float": float64
+    - "category": categorical
+    """
+
+    name: str
+    kind: str
+
+
+BURNDOWN_SCHEMA = (
+    Column("date", "date"),
+    Column("ideal_burndown", "float"),
+    Column("remaining", "float"),
+)
+SPRINT_TASKS_SCHEMA = (
+    Column("burned", "float"),
+    Column("creep_date", "date"),
+    Column("creep", "float"),
+    Column("creep_category", "category"),
+    Column("category", "category"),
+    Column("Created", "date"),
+    Column("Date Closed", "date"),
+    Column("Original estimate", "float"),
+    Column("Points", "float"),
+)
+# The optional column identifying a task (the issue key of the tracker export)
+TASK_KEY_COLUMN = "Key"
+# The capacity is a single cell of the sheet of each sprint
+CAPACITY_SCHEMA = (Column("person_days", "float"),)
+CAPACITY_COLUMN = "F"
+CAPACITY_ROW = 11
+
+
+class SchemaError(ValueError):
+    """Error raised when a spreadsheet does not follow its schema."""
+
+    def __init__(
+        self,
+        message: str,
+        sheet_name: str,
+        row: Optional[int] = None,
+        column: Optional[str] = None,
+    ) -> None:
+        """Create the error message from the location of the error.
+
+        Args:
+            message (str): Description of the error
+            sheet_name (str): Name of the sheet containing the error
+            row (Optional[int], optional): Row of the spreadsheet containing the
+                error. Defaults to None.
+            column (Optional[str], optional): Column containing the error.
+                Defaults to None.
+        """
+        self.sheet_name = sheet_name
+        self.row = row
+        self.column = column
+        location = f"Sheet '{sheet_name}'"
+        if row is not None:
+            location += f", row {row}"
+        if column is not None:
+            location += f", column '{column}'"
+        super().__init__(f"{location}: {message}")
+
+
+def coerce_column(values: pd.Series, kind: str) -> Tuple[pd.Series, pd.Series]:
+    """Convert the values of a column to the dtype of its kind.
+
+    Args:
+        values (pd.Series): The values to convert
+        kind (str): The kind of the column (see Column)
+
+    Raises:
+        ValueError: If the kind is unknown
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: The converted values, and a mask of the values
+            which could not be converted
+    """
+    if kind == "date":
+        converted = pd.to_datetime(values, errors="coerce").dt.normalize()
+    elif kind == "float":
+        converted = pd.to_numeric(values, errors="coerce").astype("float64")
+    elif kind == "category":
+        return values.astype("category"), pd.Series(False, index=values.index)
+    else:
+        raise ValueError(f"Unknown kind of column '{kind}'")
+    return converted, converted.isna() & values.notna()
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    schema: Sequence[Column],
+    sheet_name: str,
+    first_row: int = 2,
+) -> pd.DataFrame:
+    """Convert the columns of a sheet to the dtypes of the schema.
+
+    Args:
+        df (pd.DataFrame): The sheet as read from the spreadsheet, indexed by the
+            position of the rows (rows may have been removed)
+        schema (Sequence[Column]): The columns of the sheet
+        sheet_name (str): Name of the sheet (used in the errors)
+        first_row (int, optional): Row of the spreadsheet of the row at position
+            0. Defaults to 2 (the row after the header).
+
+    Raises:
+        SchemaError: If a column is missing or a value cannot be converted
+
+    Returns:
+        pd.DataFrame: A copy of the sheet with converted columns
+    """
+    df = df.copy()
+    for column in schema:
+        if column.name not in df.columns:
+            raise SchemaError("The column is missing", sheet_name, column=column.name)
+        converted, invalid = coerce_column(df.loc[:, column.name], column.kind)
+        if invalid.any():
+            position = invalid.idxmax()
+            raise SchemaError(
+                f"Cannot convert {df.loc[position, column.name]!r} to {column.kind}",
+                sheet_name,
+                row=first_row + int(position),
+                column=column.name,
+            )
+        df[column.name] = converted
+    return df
+
+
+def apply_capacity_schema(
+    person_days: Dict[str, Any], spreadsheet_name: str, required: bool = False
+) -> pd.Series:
+    """Convert the capacity of each sprint to the dtype of CAPACITY_SCHEMA.
+
+    Args:
+        person_days (Dict[str, Any]): The capacity cell of each sprint
+        spreadsheet_name (str): Name of the capacity spreadsheet (used in the errors)
+        required (bool, optional): Whether a missing capacity is an error.
+            Defaults to False.
+
+    Raises:
+        SchemaError: If a capacity cannot be converted (or is missing if required)
+
+    Returns:
+        pd.Series: The person days of each sprint
+    """
+    (column,) = CAPACITY_SCHEMA
+    values = pd.Series(person_days, index=list(person_days.keys()), dtype=object)
+    converted, invalid = coerce_column(values, column.kind)
+    if required:
+        invalid |= converted.isna()
+    if invalid.any():
+        sprint_name = invalid.idxmax()
+        raise SchemaError(
+            f"Cannot convert {values.loc[sprint_name]!r} to {column.kind}",
+            f"{spreadsheet_name}/{sprint_name}",
+            row=CAPACITY_ROW,
+            column=CAPACITY_COLUMN,
+        )
+    return converted.rename(column.name)
@@ -0,0 +1,397 @@
+"""Module containing a local HTTP server for browsing the charts."""
+
+import html
+import json
+import tempfile
+import threading
+import time
+import traceback
+from collections import OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from pandas import Timestamp
+
+from burndown.options import SPRINT_TARGETS
+from burndown.targets import SharedData, render_target
+from burndown.watch import PARTIAL_WRITE_ERRORS, WorkbookWatcher, reload_changed
+
+SERVER_TARGETS = ("burndown", "sprint", "double", "trends", "release")
+
+
+class NotFoundError(LookupError):
+    """Error raised when a path does not match a target, sprint or chart."""
+
+
+class ChartCache:
+    """Least recently used cache of rendered charts."""
+
+    def __init__(self, max_size: int = 64) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size (int, optional): Maximum number of entries. Defaults to 64.
+        """
+        self.max_size = max_size
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # The cache is shared by the threads of the server
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return an entry and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the entry
+
+        Returns:
+            Optional[Any]: The entry, None if it is not cached
+        """
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add an entry, and evict the least recently used entry if full.
+
+        Args:
+            key (Hashable): The key of the entry
+            value (Any): The entry
+        """
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return the hit statistics of the cache.
+
+        Returns:
+            Dict[str, Any]: The size, hits, misses and hit ratio
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups != 0 else None,
+            }
+
+
+class DashboardState:
+    """Class which holds the data, the cache and the metrics of the server."""
+
+    def __init__(
+        self,
+        data: SharedData,
+        cache_size: int = 64,
+        days_off: Optional[List[Timestamp]] = None,
+    ) -> None:
+        """Load the data and start tracking the spreadsheets.
+
+        Args:
+            data (SharedData): The data to serve
+            cache_size (int, optional): Maximum number of cached renders.
+                Defaults to 64.
+            days_off (Optional[List[Timestamp]], optional):
+                List of days where there will be no sprint. Defaults to None.
+        """
+        self.data = data
+        self.days_off = days_off
+        self.cache = ChartCache(cache_size)
+        # The lock serializes data access and rendering (pyplot is not thread safe)
+        self.lock = threading.Lock()
+        self.data_version = 0
+        self.loaded_at = time.time()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.data.load()
+        self.watcher = WorkbookWatcher(
+            [data.burndown_path, data.sprint_tasks_path, data.capacity_path]
+        )
+
+    def reload_if_changed(self) -> bool:
+        """Reload the changed spreadsheets and bump the data version.
+
+        As when watching, a truncated spreadsheet is read again on the next request,
+        and one with invalid content once it is saved again.
+
+        Raises:
+            Exception: Any other error of reloading the spreadsheets, which is
+                raised again on the next requests until it is fixed
+
+        Returns:
+            bool: True if the data was reloaded
+        """
+        changed_paths = self.watcher.poll()
+        if len(changed_paths) == 0:
+            return False
+        with self.lock:
+            try:
+                reload_changed(self.data, changed_paths)
+            except PARTIAL_WRITE_ERRORS as error:
+                # The file may be read while it is being written, so try again later
+                print(f"Could not reload the spreadsheets ({error}), retrying")
+                for path in changed_paths:
+                    self.watcher.forget(path)
+                return False
+            except ValueError as error:
+                print(f"Could not reload the spreadsheets ({error}), waiting for a fix")
+                return False
+            except Exception:
+                for path in changed_paths:
+                    self.watcher.forget(path)
+                raise
+            self.data_version += 1
+            self.loaded_at = time.time()
+        print(f"Reloaded data (version {self.data_version})")
+        return True
+
+    def get_keys(self, target: str) -> List[str]:
+        """Return the sprints or releases a target can be rendered for.
+
+        Args:
+            target (str): One of SERVER_TARGETS
+
+        Returns:
+            List[str]: The sprints, the releases or ["all"] for trends
+        """
+        if target == "trends":
+            return ["all"]
+        sprint_names = list(self.data.sprint_tasks.get_sprint_start_dates().index)
+        if target in SPRINT_TARGETS:
+            return sprint_names
+        return list(dict.fromkeys(name.split("-")[0] for name in sprint_names))
+
+    def get_chart(self, target: str, key: str) -> List[bytes]:
+        """Return the rendered charts of a target, rendering them if not cached.
+
+        Args:
+            target (str): One of SERVER_TARGETS
+            key (str): The sprint or release of the target ("all" for trends)
+
+        Raises:
+            NotFoundError: If the target cannot be rendered for the key
+
+        Returns:
+            List[bytes]: The PNG images of the target
+        """
+        if key not in self.get_keys(target):
+            raise NotFoundError(f"No {target} chart for {key}")
+        cache_key = (target, key, self.data_version)
+        images = self.cache.get(cache_key)
+        if images is not None:
+            return images
+        with self.lock, tempfile.TemporaryDirectory() as tmp_dir:
+            charts_dir = Path(tmp_dir)
+            render_target(
+                target,
+                self.data,
+                charts_dir,
+                sprint_name=key if target in SPRINT_TARGETS else None,
+                release=None if key == "all" else key,
+                days_off=self.days_off,
+            )
+            images = [path.read_bytes() for path in sorted(charts_dir.glob("*.png"))]
+        self.cache.put(cache_key, images)
+        return images
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the metrics of all the sprints.
+
+        Returns:
+            Dict[str, Any]: The total burn and categories of each sprint
+        """
+        cache_key = ("metrics", "all", self.data_version)
+        metrics = self.cache.get(cache_key)
+        if metrics is not None:
+            return metrics
+        with self.lock:
+            sprint_tasks = self.data.sprint_tasks
+            frames = {
+                "total_burn": sprint_tasks.get_total_burn(),
+                "burn_categories": sprint_tasks.get_burn_categories(),
+                "creep_categories": sprint_tasks.get_creep_categories(),
+            }
+        metrics = {
+            "data_version": self.data_version,
+            **{
+                name: json.loads(frame.to_json(orient="index"))
+                for name, frame in frames.items()
+            },
+        }
+        self.cache.put(cache_key, metrics)
+        return metrics
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a request.
+
+        Args:
+            endpoint (str): The endpoint which was requested
+            seconds (float): The time spent on the request
+        """
+        latencies = self.latencies[endpoint]
+        latencies.append(seconds)
+        # Only keep the most recent requests
+        del latencies[:-1000]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return the status of the server.
+
+        Returns:
+            Dict[str, Any]: The data version, cache statistics and latencies
+        """
+        latencies = dict()
+        for endpoint, seconds in self.latencies.items():
+            milliseconds = 1000 * np.array(seconds)
+            latencies[endpoint] = {
+                "count": len(seconds),
+                "p50_ms": float(np.percentile(milliseconds, 50)),
+                "p95_ms": float(np.percentile(milliseconds, 95)),
+                "max_ms": float(milliseconds.max()),
+            }
+        return {
+            "data_version": self.data_version,
+            "loaded_at": pd.Timestamp(self.loaded_at, unit="s").isoformat(),
+            "sprints": len(self.data.sprint_tasks.sprint_tasks_sheets),
+            "cache": self.cache.get_status(),
+            "latency": latencies,
+        }
+
+    def get_index_html(self) -> str:
+        """Return the HTML page linking to all the charts.
+
+        Returns:
+            str: The HTML page
+        """
+        rows = [
+            f"<li><a href='/page/{target}/{html.escape(key)}'>{html.escape(key)}</a>"
+            f" {target}</li>"
+            for target in ("trends", "release", "double", "sprint", "burndown")
+            for key in self.get_keys(target)
+        ]
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            "<title>Burndown charts</title></head><body><h1>Burndown charts</h1>"
+            "<p><a href='/metrics.json'>metrics.json</a> | "
+            "<a href='/status'>status</a></p>"
+            f"<ul>{''.join(rows)}</ul></body></html>"
+        )
+
+
+def get_handler(state: DashboardState) -> type:
+    """Return a request handler class serving from the state.
+
+    Args:
+        state (DashboardState): The state of the server
+
+    Returns:
+        type: The request handler class
+    """
+
+    class DashboardHandler(BaseHTTPRequestHandler):
+        """Handler of the requests to the dashboard."""
+
+        def do_GET(self) -> None:  # noqa: N802 (name given by BaseHTTPRequestHandler)
+            """Serve a GET request."""
+            start = time.perf_counter()
+            parts = [part for part in self.path.split("?")[0].split("/") if part]
+            endpoint = parts[0] if len(parts) != 0 else "index"
+            try:
+                status, content_type, body = self.route(parts)
+            except NotFoundError as error:
+                status, content_type, body = 404, "text/plain", f"{error}".encode()
+            except Exception as error:
+                traceback.print_exc()
+                status, content_type, body = 500, "text/plain", f"{error}".encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            state.record_latency(endpoint, time.perf_counter() - start)
+
+        def route(self, parts: List[str]) -> Tuple[int, str, bytes]:
+            """Return the response of a path.
+
+            Args:
+                parts (List[str]): The parts of the requested path
+
+            Raises:
+                NotFoundError: If the path does not match a target, sprint or chart
+
+            Returns:
+                Tuple[int, str, bytes]: The status, the content type and the body
+            """
+            state.reload_if_changed()
+            if len(parts) == 0:
+                return 200, "text/html", state.get_index_html().encode()
+            if parts == ["status"]:
+                return 200, "application/json", json.dumps(state.get_status()).encode()
+            if parts == ["metrics.json"]:
+                return 200, "application/json", json.dumps(state.get_metrics()).encode()
+            if len(parts) == 3 and parts[0] == "page" and parts[1] in SERVER_TARGETS:
+                n_images = len(state.get_chart(parts[1], parts[2]))
+                images = "".join(
+                    f"<img src='/chart/{parts[1]}/{parts[2]}/{index}.png' width='800'>"
+                    for index in range(n_images)
+                )
+                page = (
+                    "<!DOCTYPE html><html><head><meta charset='utf-8'></head><body>"
+                    f"<p><a href='/'>Back</a></p>{images}</body></html>"
+                )
+                return 200, "text/html", page.encode()
+            if len(parts) == 4 and parts[0] == "chart" and parts[1] in SERVER_TARGETS:
+                images = state.get_chart(parts[1], parts[2])
+                names = [f"{index}.png" for index in range(len(images))]
+                if parts[3] not in names:
+                    raise NotFoundError(
+                        f"No chart {parts[3]} for {parts[1]} {parts[2]}"
+                    )
+                return 200, "image/png", images[names.index(parts[3])]
+            raise NotFoundError(f"Not found: /{'/'.join(parts)}")
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Log the requests without the client address."""
+            print(f"{self.command} {self.path} {args[1] if len(args) > 1 else ''}")
+
+    return DashboardHandler
+
+
+def serve(
+    data: SharedData,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    cache_size: int = 64,
+    days_off: Optional[List[Timestamp]] = None,
+) -> None:
+    """Serve the charts and metrics until interrupted.
+
+    Args:
+        data (SharedData): The data to serve
+        host (str, optional): The host to bind to. Defaults to "127.0.0.1".
+        port (int, optional): The port to bind to. Defaults to 8000.
+        cache_size (int, optional): Maximum number of cached renders. Defaults to 64.
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+    """
+    # The charts are rendered off the main thread, so no GUI backend may be used
+    plt.switch_backend("Agg")
+    state = DashboardState(data, cache_size=cache_size, days_off=days_off)
+    server = ThreadingHTTPServer((host, port), get_handler(state))
+    print(f"Serving on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
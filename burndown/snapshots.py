@@ -0,0 +1,451 @@
+"""Module for archiving snapshots of the sprint tasks as row deltas.
+
+The sprint tasks spreadsheet is edited in place, so re-estimations and creep are
+lost once the cells are overwritten. Each snapshot only stores the rows which
+changed since the previous snapshot, as one NumPy array per column in a compressed
+.npz file. Rows are identified by their sprint and task key (see get_row_keys), so
+inserting or removing a task does not store the rows after it again; only the order
+of the keys of the sprint is stored. Every KEYFRAME_INTERVAL snapshots, a keyframe
+stores all the rows, so that a past state is reconstructed by applying the deltas
+since the last keyframe before it.
+"""
+
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import Timestamp
+
+from burndown.profiling import span
+from burndown.schema import SPRINT_TASKS_SCHEMA, TASK_KEY_COLUMN, coerce_column
+
+SNAPSHOT_DIR_NAME = "snapshots"
+# The number of snapshots from a keyframe to the next
+KEYFRAME_INTERVAL = 16
+_SNAPSHOT_FORMAT = "%Y%m%dT%H%M%S%f"
+_KEYFRAME_SUFFIX = "-keyframe"
+
+# The columns of a sprint, where categories are stored as objects (str or None)
+SprintColumns = Dict[str, np.ndarray]
+
+
+class SprintState(NamedTuple):
+    """The key and the values of the rows of a sprint at a snapshot."""
+
+    keys: np.ndarray
+    columns: SprintColumns
+
+
+def encode_categories(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Store each distinct string once, and the position of each value.
+
+    Args:
+        values (np.ndarray): Strings or None
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The code of each value (-1 if missing) and
+            the strings of the codes
+    """
+    missing = pd.isna(values)
+    categories, codes = np.unique(values[~missing].astype(str), return_inverse=True)
+    all_codes = np.full(len(values), -1, dtype=np.int32)
+    all_codes[~missing] = codes
+    return all_codes, categories
+
+
+def decode_categories(codes: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """Convert the codes of encode_categories back to strings.
+
+    Args:
+        codes (np.ndarray): The code of each value (-1 if missing)
+        categories (np.ndarray): The strings of the codes
+
+    Returns:
+        np.ndarray: Strings or None
+    """
+    values = np.full(len(codes), None, dtype=object)
+    values[codes >= 0] = categories.astype(object)[codes[codes >= 0]]
+    return values
+
+
+def encode_sheet(sheet: pd.DataFrame) -> SprintColumns:
+    """Convert a raw sprint tasks sheet to one array per column of the schema.
+
+    Values which cannot be converted to the kind of their column are stored as
+    missing.
+
+    Args:
+        sheet (pd.DataFrame): The raw sprint tasks sheet
+
+    Returns:
+        SprintColumns: The values of each column
+    """
+    columns = dict()
+    for column in SPRINT_TASKS_SCHEMA:
+        values = sheet.loc[:, column.name]
+        if column.kind == "category":
+            columns[column.name] = np.array(
+                [None if pd.isna(value) else str(value) for value in values],
+                dtype=object,
+            )
+        else:
+            converted, _ = coerce_column(values, column.kind)
+            columns[column.name] = converted.to_numpy(
+                dtype="M8[ns]" if column.kind == "date" else "float64"
+            )
+    return columns
+
+
+def decode_sheet(columns: SprintColumns) -> pd.DataFrame:
+    """Convert the arrays of the columns back to a sprint tasks sheet.
+
+    Args:
+        columns (SprintColumns): The values of each column
+
+    Returns:
+        pd.DataFrame: The sprint tasks sheet
+    """
+    return pd.DataFrame({name: values.copy() for name, values in columns.items()})
+
+
+def get_row_keys(sheet: pd.DataFrame) -> np.ndarray:
+    """Identify the rows of a sprint tasks sheet.
+
+    A row is identified by its TASK_KEY_COLUMN and how many rows before it have
+    the same key, so that keys are unique within a sprint. Rows without a key (or
+    sheets without the column) are identified by their position among them.
+
+    Args:
+        sheet (pd.DataFrame): The raw sprint tasks sheet
+
+    Returns:
+        np.ndarray: The key of each row
+    """
+    if TASK_KEY_COLUMN in sheet.columns:
+        keys = pd.Series(
+            ["" if pd.isna(key) else str(key) for key in sheet[TASK_KEY_COLUMN]]
+        )
+    else:
+        keys = pd.Series("", index=range(len(sheet)))
+    occurrences = keys.groupby(keys).cumcount()
+    return (keys + "#" + occurrences.astype(str)).to_numpy(dtype=str)
+
+
+def get_changed_rows(old: Optional[SprintState], new: SprintState) -> np.ndarray:
+    """Get the rows of a sprint which changed or were added.
+
+    Args:
+        old (Optional[SprintState]): The previous state (None if the sprint is new)
+        new (SprintState): The current state
+
+    Returns:
+        np.ndarray: The positions of the changed rows in the current state
+    """
+    if old is None:
+        return np.arange(len(new.keys))
+    old_positions = pd.Index(old.keys).get_indexer(new.keys)
+    matched = old_positions >= 0
+    changed = ~matched
+    changed_matched = np.zeros(matched.sum(), dtype=bool)
+    for name, values in new.columns.items():
+        old_values = old.columns[name][old_positions[matched]]
+        new_values = values[matched]
+        if values.dtype == object:
+            changed_matched |= pd.isna(old_values) != pd.isna(new_values)
+            changed_matched |= pd.notna(new_values) & (old_values != new_values)
+        else:
+            # NaN and NaT are equal to themselves here
+            changed_matched |= ~(
+                (old_values == new_values) | (old_values != old_values)
+            )
+            changed_matched |= (old_values != old_values) != (new_values != new_values)
+    changed[matched] = changed_matched
+    return np.flatnonzero(changed)
+
+
+class SnapshotArchive:
+    """Class which stores and reconstructs snapshots of the sprint tasks."""
+
+    def __init__(self, archive_dir: Path) -> None:
+        """Set the directory of the archive.
+
+        Args:
+            archive_dir (Path): Directory containing the snapshots
+        """
+        self.archive_dir = archive_dir
+        # The state of the last snapshot, reconstructed on first use
+        self._state: Optional[Dict[str, SprintState]] = None
+
+    @property
+    def snapshot_paths(self) -> List[Path]:
+        """Return the snapshots from the oldest to the newest.
+
+        Returns:
+            List[Path]: The paths of the snapshots
+        """
+        if not self.archive_dir.is_dir():
+            return list()
+        return sorted(self.archive_dir.glob("*.npz"))
+
+    @staticmethod
+    def get_taken_at(snapshot_path: Path) -> Timestamp:
+        """Return the time a snapshot was taken.
+
+        Args:
+            snapshot_path (Path): Path of the snapshot
+
+        Returns:
+            Timestamp: The time of the snapshot
+        """
+        return pd.to_datetime(
+            snapshot_path.stem.replace(_KEYFRAME_SUFFIX, ""), format=_SNAPSHOT_FORMAT
+        )
+
+    @staticmethod
+    def is_keyframe(snapshot_path: Path) -> bool:
+        """Return whether a snapshot stores all the rows.
+
+        Args:
+            snapshot_path (Path): Path of the snapshot
+
+        Returns:
+            bool: True if the snapshot is a keyframe
+        """
+        return snapshot_path.stem.endswith(_KEYFRAME_SUFFIX)
+
+    def capture(
+        self,
+        sprint_tasks_sheets: Dict[str, pd.DataFrame],
+        taken_at: Optional[Timestamp] = None,
+    ) -> Optional[Path]:
+        """Store the changes of the sprint tasks since the last snapshot.
+
+        Args:
+            sprint_tasks_sheets (Dict[str, pd.DataFrame]): The raw sprint tasks
+                sheets, with the TASK_KEY_COLUMN if they have one
+            taken_at (Optional[Timestamp], optional): The time of the snapshot.
+                Defaults to None (now).
+
+        Raises:
+            ValueError: If the snapshot is not newer than the last snapshot
+
+        Returns:
+            Optional[Path]: The path of the snapshot, None if nothing changed
+        """
+        taken_at = pd.Timestamp.now() if taken_at is None else pd.Timestamp(taken_at)
+        snapshot_paths = self.snapshot_paths
+        if len(snapshot_paths) > 0 and taken_at <= self.get_taken_at(
+            snapshot_paths[-1]
+        ):
+            raise ValueError(
+                f"The snapshot at {taken_at} is not newer than {snapshot_paths[-1]}"
+            )
+        old_state = self._state if self._state is not None else self.reconstruct()
+
+        with span("encode snapshot", "snapshot"):
+            state = {
+                sprint_name: SprintState(get_row_keys(sheet), encode_sheet(sheet))
+                for sprint_name, sheet in sprint_tasks_sheets.items()
+            }
+            changed_rows = {
+                sprint_name: get_changed_rows(old_state.get(sprint_name), sprint)
+                for sprint_name, sprint in state.items()
+            }
+            # The order of the keys is only stored for the sprints where it changed
+            reordered = [
+                sprint_name not in old_state
+                or not np.array_equal(sprint.keys, old_state[sprint_name].keys)
+                for sprint_name, sprint in state.items()
+            ]
+        sprint_names = list(state.keys())
+        if (
+            sprint_names == list(old_state.keys())
+            and not any(reordered)
+            and all(len(rows) == 0 for rows in changed_rows.values())
+        ):
+            return None
+
+        # The snapshots after the last keyframe, including the new one
+        n_deltas = next(
+            (
+                index
+                for index, path in enumerate(reversed(snapshot_paths))
+                if self.is_keyframe(path)
+            ),
+            None,
+        )
+        is_keyframe = n_deltas is None or n_deltas + 1 >= KEYFRAME_INTERVAL
+        if is_keyframe:
+            changed_rows = {
+                sprint_name: np.arange(len(sprint.keys))
+                for sprint_name, sprint in state.items()
+            }
+            reordered = [True] * len(sprint_names)
+
+        keyed_sprints = np.flatnonzero(reordered).astype(np.int32)
+        arrays = {
+            "sprints": np.array(sprint_names, dtype=str),
+            "n_rows": np.array(
+                [len(sprint.keys) for sprint in state.values()], dtype=np.int64
+            ),
+            "keyed_sprints": keyed_sprints,
+            "keys": np.concatenate(
+                [np.zeros(0, dtype=str)]
+                + [state[sprint_names[index]].keys for index in keyed_sprints]
+            ),
+            "row_sprints": np.repeat(
+                np.arange(len(sprint_names), dtype=np.int32),
+                [len(rows) for rows in changed_rows.values()],
+            ),
+            "rows": np.concatenate(
+                [np.zeros(0, dtype=np.int64)] + list(changed_rows.values())
+            ).astype(np.int64),
+        }
+        for column in SPRINT_TASKS_SCHEMA:
+            values = np.concatenate(
+                [
+                    state[sprint_name].columns[column.name][rows]
+                    for sprint_name, rows in changed_rows.items()
+                ]
+                or [np.zeros(0, dtype=object if column.kind == "category" else float)]
+            )
+            if column.kind == "category":
+                codes, categories = encode_categories(values)
+                arrays[f"{column.name}.categories"] = categories
+                arrays[f"{column.name}.codes"] = codes
+            else:
+                arrays[column.name] = values
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        suffix = _KEYFRAME_SUFFIX if is_keyframe else ""
+        snapshot_path = self.archive_dir.joinpath(
+            f"{taken_at.strftime(_SNAPSHOT_FORMAT)}{suffix}.npz"
+        )
+        with span(f"save {snapshot_path.name}", "snapshot"):
+            np.savez_compressed(snapshot_path, **arrays)
+        self._state = state
+        return snapshot_path
+
+    def reconstruct(self, as_of: Optional[Timestamp] = None) -> Dict[str, SprintState]:
+        """Reconstruct the rows of the sprints from the last keyframe and deltas.
+
+        Args:
+            as_of (Optional[Timestamp], optional): The time to reconstruct the
+                sprint tasks at. Defaults to None (the last snapshot).
+
+        Returns:
+            Dict[str, SprintState]: The rows of each sprint at the last snapshot
+                taken at or before the time (empty if there is none)
+        """
+        snapshot_paths = [
+            snapshot_path
+            for snapshot_path in self.snapshot_paths
+            if as_of is None or self.get_taken_at(snapshot_path) <= as_of
+        ]
+        keyframes = [
+            index
+            for index, snapshot_path in enumerate(snapshot_paths)
+            if self.is_keyframe(snapshot_path)
+        ]
+        state: Dict[str, SprintState] = dict()
+        for snapshot_path in snapshot_paths[keyframes[-1] if keyframes else 0 :]:
+            with span(f"apply {snapshot_path.name}", "snapshot"), np.load(
+                snapshot_path, allow_pickle=False
+            ) as snapshot:
+                state = self._apply(state, snapshot)
+        if as_of is None:
+            self._state = state
+        return state
+
+    @staticmethod
+    def _apply(
+        state: Dict[str, SprintState], snapshot: "np.lib.npyio.NpzFile"
+    ) -> Dict[str, SprintState]:
+        """Apply the delta of a snapshot to the previous state.
+
+        Only the sprints with changed rows or keys are copied, the others are
+        shared with the previous state.
+
+        Args:
+            state (Dict[str, SprintState]): The state of the previous snapshot
+            snapshot (np.lib.npyio.NpzFile): The loaded snapshot
+
+        Returns:
+            Dict[str, SprintState]: The state of the snapshot
+        """
+        sprint_names = snapshot["sprints"].tolist()
+        keyed_sprints = snapshot["keyed_sprints"]
+        key_bounds = np.concatenate([[0], np.cumsum(snapshot["n_rows"][keyed_sprints])])
+        keys = {
+            index: snapshot["keys"][key_bounds[position] : key_bounds[position + 1]]
+            for position, index in enumerate(keyed_sprints.tolist())
+        }
+        row_sprints = snapshot["row_sprints"]
+        rows = snapshot["rows"]
+        # The deltas of a sprint are contiguous, in the order of the sprints
+        bounds = np.searchsorted(row_sprints, np.arange(len(sprint_names) + 1))
+        values: Optional[SprintColumns] = None
+
+        new_state = dict()
+        for index, sprint_name in enumerate(sprint_names):
+            old = state.get(sprint_name)
+            start, end = bounds[index], bounds[index + 1]
+            if old is not None and index not in keys and start == end:
+                new_state[sprint_name] = old
+                continue
+            if values is None:
+                values = dict()
+                for column in SPRINT_TASKS_SCHEMA:
+                    if column.kind == "category":
+                        values[column.name] = decode_categories(
+                            snapshot[f"{column.name}.codes"],
+                            snapshot[f"{column.name}.categories"],
+                        )
+                    else:
+                        values[column.name] = snapshot[column.name]
+
+            sprint_keys = keys[index] if index in keys else old.keys
+            # The position of each row in the previous state (-1 if new)
+            if old is None:
+                old_positions = np.full(len(sprint_keys), -1)
+            elif index in keys:
+                old_positions = pd.Index(old.keys).get_indexer(sprint_keys)
+            else:
+                old_positions = np.arange(len(sprint_keys))
+            kept = old_positions >= 0
+            columns = dict()
+            for name, column_values in values.items():
+                new_values = np.empty(len(sprint_keys), dtype=column_values.dtype)
+                if old is not None:
+                    new_values[kept] = old.columns[name][old_positions[kept]]
+                new_values[rows[start:end]] = column_values[start:end]
+                columns[name] = new_values
+            new_state[sprint_name] = SprintState(sprint_keys, columns)
+        return new_state
+
+    def load(self, as_of: Optional[Timestamp] = None) -> Dict[str, pd.DataFrame]:
+        """Load the sprint tasks sheets as they were at a time.
+
+        Args:
+            as_of (Optional[Timestamp], optional): The time to load the sprint
+                tasks at. Defaults to None (the last snapshot).
+
+        Raises:
+            FileNotFoundError: If there is no snapshot taken at or before the time
+
+        Returns:
+            Dict[str, pd.DataFrame]: The sprint tasks sheets
+        """
+        snapshot_paths = self.snapshot_paths
+        if len(snapshot_paths) == 0 or (
+            as_of is not None and self.get_taken_at(snapshot_paths[0]) > as_of
+        ):
+            raise FileNotFoundError(
+                f"No snapshot of the sprint tasks in {self.archive_dir} "
+                f"taken before {as_of}"
+            )
+        return {
+            sprint_name: decode_sheet(sprint.columns)
+            for sprint_name, sprint in self.reconstruct(as_of).items()
+        }
@@ -0,0 +1,222 @@
+"""Module for archiving closed sprints in a compact binary format.
+
+Closed sprints never change, so instead of parsing their sheets from the
+spreadsheets on every run, their burndown, sprint tasks and capacity are stored once
+in a directory per sprint with one .npy file per column. The files are memory-mapped
+when read, so loading an archived sprint does not parse anything.
+"""
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas import Timestamp
+
+from burndown.profiling import span
+from burndown.schema import (
+    BURNDOWN_SCHEMA,
+    SPRINT_TASKS_SCHEMA,
+    Column,
+    apply_capacity_schema,
+    apply_schema,
+)
+from burndown.snapshots import decode_categories, encode_categories, encode_sheet
+
+if TYPE_CHECKING:
+    from burndown.sprint_tasks import SprintTasks
+
+ARCHIVE_DIR_NAME = "archive"
+
+
+class ArchivedSprints(NamedTuple):
+    """The sheets and capacity of the archived sprints, by the name of the sprint.
+
+    Attributes:
+        burndown_sheets (Dict[str, pd.DataFrame]): The raw burndown sheets
+        sprint_tasks_sheets (Dict[str, pd.DataFrame]): The raw sprint tasks sheets
+        person_days (Dict[str, float]): The capacity of each sprint
+    """
+
+    burndown_sheets: Dict[str, pd.DataFrame]
+    sprint_tasks_sheets: Dict[str, pd.DataFrame]
+    person_days: Dict[str, float]
+
+
+def _save_columns(
+    sprint_dir: Path, prefix: str, columns: Dict[str, np.ndarray]
+) -> None:
+    """Save each column to its own .npy file, where strings are stored as codes.
+
+    Args:
+        sprint_dir (Path): Directory of the sprint
+        prefix (str): Prefix of the files (the name of the sheet)
+        columns (Dict[str, np.ndarray]): The values of each column
+    """
+    for name, values in columns.items():
+        if values.dtype == object:
+            codes, categories = encode_categories(values)
+            np.save(sprint_dir.joinpath(f"{prefix}.{name}.codes.npy"), codes)
+            np.save(sprint_dir.joinpath(f"{prefix}.{name}.categories.npy"), categories)
+        else:
+            np.save(sprint_dir.joinpath(f"{prefix}.{name}.npy"), values)
+
+
+def _load_columns(
+    sprint_dir: Path, prefix: str, schema: Sequence[Column]
+) -> pd.DataFrame:
+    """Load the columns of a sheet from their memory-mapped .npy files.
+
+    Args:
+        sprint_dir (Path): Directory of the sprint
+        prefix (str): Prefix of the files (the name of the sheet)
+        schema (Sequence[Column]): The columns of the sheet
+
+    Returns:
+        pd.DataFrame: The sheet
+    """
+    columns = dict()
+    for column in schema:
+        path = sprint_dir.joinpath(f"{prefix}.{column.name}")
+        if column.kind == "category":
+            columns[column.name] = decode_categories(
+                np.load(f"{path}.codes.npy", mmap_mode="r", allow_pickle=False),
+                np.load(f"{path}.categories.npy", allow_pickle=False),
+            )
+        else:
+            columns[column.name] = np.load(
+                f"{path}.npy", mmap_mode="r", allow_pickle=False
+            )
+    return pd.DataFrame(columns)
+
+
+class SprintArchive:
+    """Class which stores closed sprints and reads them back."""
+
+    def __init__(self, archive_dir: Path) -> None:
+        """Set the directory of the archive.
+
+        Args:
+            archive_dir (Path): Directory containing a directory per archived sprint
+        """
+        self.archive_dir = archive_dir
+
+    @property
+    def sprint_names(self) -> List[str]:
+        """Return the archived sprints in the order of their start.
+
+        Returns:
+            List[str]: The names of the archived sprints
+        """
+        if not self.archive_dir.is_dir():
+            return list()
+        starts = {
+            path.name: np.load(
+                path.joinpath("burndown.date.npy"), mmap_mode="r", allow_pickle=False
+            ).min()
+            for path in self.archive_dir.iterdir()
+            # Sprints being written are hidden until they are complete
+            if not path.name.startswith(".") and path.joinpath("capacity.npy").exists()
+        }
+        return sorted(starts, key=lambda name: (starts[name], name))
+
+    def read_sprints(self) -> ArchivedSprints:
+        """Read all the archived sprints.
+
+        Returns:
+            ArchivedSprints: The sheets and capacity of the archived sprints
+        """
+        archived = ArchivedSprints(dict(), dict(), dict())
+        for sprint_name in self.sprint_names:
+            sprint_dir = self.archive_dir.joinpath(sprint_name)
+            with span("read archive", "load", sprint=sprint_name):
+                archived.burndown_sheets[sprint_name] = _load_columns(
+                    sprint_dir, "burndown", BURNDOWN_SCHEMA
+                )
+                archived.sprint_tasks_sheets[sprint_name] = _load_columns(
+                    sprint_dir, "tasks", SPRINT_TASKS_SCHEMA
+                )
+                archived.person_days[sprint_name] = float(
+                    np.load(sprint_dir.joinpath("capacity.npy"), allow_pickle=False)
+                )
+        return archived
+
+    def close_sprint(
+        self,
+        sprint_tasks: "SprintTasks",
+        sprint_name: str,
+        today: Optional[Timestamp] = None,
+    ) -> Path:
+        """Validate a finished sprint and store it in the archive.
+
+        The sprint is written to a temporary directory which is renamed when
+        complete, so a sprint is either fully archived or not at all.
+
+        Args:
+            sprint_tasks (SprintTasks): The loaded sprint tasks
+            sprint_name (str): Name of the sprint to close
+            today (Optional[Timestamp], optional): The current date. Defaults to
+                None (today).
+
+        Raises:
+            ValueError: If the sprint is unknown, not finished or already archived
+            SchemaError: If the capacity of the sprint is not a number
+
+        Returns:
+            Path: The directory of the archived sprint
+        """
+        today = pd.to_datetime("today") if today is None else pd.Timestamp(today)
+        sprint_dir = self.archive_dir.joinpath(sprint_name)
+        if sprint_dir.exists():
+            raise ValueError(f"The sprint {sprint_name} is already archived")
+        if (
+            sprint_name not in sprint_tasks.burndown_sheets
+            or sprint_name not in sprint_tasks.sprint_tasks_sheets
+        ):
+            raise ValueError(
+                f"The sprint {sprint_name} needs both a burndown and sprint tasks"
+            )
+        last_day = sprint_tasks.burndown_sheets[sprint_name].index.max()
+        if last_day >= today.normalize():
+            raise ValueError(
+                f"The sprint {sprint_name} is not finished before {last_day.date()}"
+            )
+
+        person_days = apply_capacity_schema(
+            {sprint_name: sprint_tasks.get_person_days(sprint_name)},
+            "capacity.xlsx",
+            required=True,
+        )
+        # The raw sheets were validated against their schema when loaded
+        burndown_sheet = apply_schema(
+            sprint_tasks.raw_burndown_sheets[sprint_name],
+            BURNDOWN_SCHEMA,
+            sheet_name=f"{sprint_tasks.burndown_path.name}/{sprint_name}",
+        )
+
+        tmp_dir = self.archive_dir.joinpath(f".{sprint_name}.tmp")
+        if tmp_dir.exists():
+            # Left over from an interrupted close
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+        with span("write archive", "save", sprint=sprint_name):
+            _save_columns(
+                tmp_dir,
+                "burndown",
+                {
+                    column.name: burndown_sheet.loc[:, column.name].to_numpy(
+                        dtype="M8[ns]" if column.kind == "date" else "float64"
+                    )
+                    for column in BURNDOWN_SCHEMA
+                },
+            )
+            _save_columns(
+                tmp_dir,
+                "tasks",
+                encode_sheet(sprint_tasks.raw_sprint_tasks_sheets[sprint_name]),
+            )
+            np.save(tmp_dir.joinpath("capacity.npy"), np.float64(person_days.iloc[0]))
+        tmp_dir.rename(sprint_dir)
+        print(f"Saving archive of sprint {sprint_name} to: {sprint_dir}")
+        return sprint_dir
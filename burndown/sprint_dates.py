@@ -1,7 +1,8 @@
 """Module containing the SprintDates class."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas import Timestamp
 
@@ -63,3 +64,63 @@ class SprintDates:
             sprint_length (int): Length of the spring
         """
         self.days_of_development = sprint_length - len(self.dates_without_development)
+
+
+def get_ranges_without_development(
+    dates_without_development: Iterable,
+) -> List[Tuple[Timestamp, Timestamp]]:
+    """Merge days without development into contiguous date ranges.
+
+    A day without development spans from the day before until the day itself, so
+    consecutive days (like a week-end) are merged into one range.
+
+    Args:
+        dates_without_development (Iterable): Days without development
+
+    Returns:
+        List[Tuple[Timestamp, Timestamp]]: Start and end of the ranges
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(list(dates_without_development)))
+    if len(dates) == 0:
+        return list()
+    dates = dates.normalize().unique().sort_values()
+    # A new range starts whenever a day does not follow the previous day
+    new_range = dates[1:] - dates[:-1] > pd.Timedelta(days=1)
+    starts = dates[[True, *new_range]]
+    ends = dates[[*new_range, True]]
+    return [(start - pd.DateOffset(1), end) for start, end in zip(starts, ends)]
+
+
+def count_business_days(
+    start_dates: pd.Series,
+    end_dates: pd.Series,
+    days_off: Optional[Iterable[Timestamp]] = None,
+) -> pd.Series:
+    """Count the days of development between pairs of dates.
+
+    As in SprintDates, week-ends and the days off are without development. The start
+    date is counted and the end date is not, so a task closed the day it was created
+    took 0 days.
+
+    Args:
+        start_dates (pd.Series): The start dates
+        end_dates (pd.Series): The end dates
+        days_off (Optional[Iterable[Timestamp]], optional):
+            Days without development. Defaults to None.
+
+    Returns:
+        pd.Series: The number of days, NaN where a date is missing
+    """
+    valid = (start_dates.notna() & end_dates.notna()).to_numpy()
+    holidays = (
+        pd.DatetimeIndex(pd.to_datetime(list(days_off))).values.astype("datetime64[D]")
+        if days_off is not None
+        else []
+    )
+    counts = np.full(len(valid), np.nan)
+    counts[valid] = np.busday_count(
+        start_dates.to_numpy()[valid].astype("datetime64[D]"),
+        end_dates.to_numpy()[valid].astype("datetime64[D]"),
+        holidays=holidays,
+    )
+    return pd.Series(counts, index=start_dates.index)
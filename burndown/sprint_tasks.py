@@ -1,157 +1,384 @@
 """Module containing the SprintTask class."""
 
+import warnings
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 from pandas import Timestamp
 
+from burndown.csv_io import read_sprint_tasks_csv, read_sprint_tasks_csv_dir
+from burndown.cumulative_flow import get_cumulative_flow
 from burndown.excel_io import read_cell, read_sheet
+from burndown.metric_cube import MetricCube, get_metric_cube
+from burndown.profiling import is_tracing_memory, profiled, span, track_frame
+from burndown.schema import (
+    BURNDOWN_SCHEMA,
+    CAPACITY_COLUMN,
+    CAPACITY_ROW,
+    SPRINT_TASKS_SCHEMA,
+    TASK_KEY_COLUMN,
+    apply_capacity_schema,
+    apply_schema,
+)
+from burndown.snapshots import SNAPSHOT_DIR_NAME, SnapshotArchive
+from burndown.sprint_archive import ARCHIVE_DIR_NAME, SprintArchive
+from burndown.sprint_dates import count_business_days
+
+BURNDOWN_COLUMNS = ["date", "ideal_burndown", "remaining"]
+SPRINT_TASKS_COLUMNS = [
+    "burned",
+    "creep_date",
+    "creep",
+    "creep_category",
+    "category",
+    "Created",
+    "Date Closed",
+    "Original estimate",
+    "Points",
+]
+
+
+def find_sprint_tasks_path(sheet_dir: Path) -> Path:
+    """Find the sprint tasks in a directory.
+
+    The spreadsheet sprint_tasks.xlsx is preferred over the CSV export
+    sprint_tasks.csv, which is preferred over the directory sprint_tasks with one CSV
+    per sprint.
+
+    Args:
+        sheet_dir (Path): Directory containing the data
+
+    Returns:
+        Path: Path to the sprint tasks (sprint_tasks.xlsx if none exist)
+    """
+    candidates = [
+        sheet_dir.joinpath(name)
+        for name in ("sprint_tasks.xlsx", "sprint_tasks.csv", "sprint_tasks")
+    ]
+    return next((path for path in candidates if path.exists()), candidates[0])
+
+
+def read_burndown_sheets(burndown_path: Path) -> Dict[str, pd.DataFrame]:
+    """Read all the sheets of the burndown spreadsheet.
+
+    Args:
+        burndown_path (Path): Path to the spreadsheet containing the burndown
+
+    Returns:
+        Dict[str, pd.DataFrame]: The raw burndown sheets
+    """
+    return read_sheet(
+        burndown_path, sheet_name=None, index_col=None, usecols=BURNDOWN_COLUMNS
+    )
+
+
+def read_sprint_tasks_sheets(
+    sprint_tasks_path: Path, with_key: bool = False
+) -> Dict[str, pd.DataFrame]:
+    """Read all the sheets of the sprint tasks.
+
+    The sprint tasks are read from CSV exports if the path is a directory (one CSV
+    per sprint) or a CSV file (with a sprint column), otherwise from a spreadsheet.
+
+    Args:
+        sprint_tasks_path (Path): Path to the spreadsheet, CSV file or directory
+            containing the creeps
+        with_key (bool, optional): Also read the TASK_KEY_COLUMN of the sheets which
+            have it. Defaults to False.
+
+    Raises:
+        ValueError: If a sheet is missing one of SPRINT_TASKS_COLUMNS
+
+    Returns:
+        Dict[str, pd.DataFrame]: The raw sprint tasks sheets
+    """
+    optional_columns = [TASK_KEY_COLUMN] if with_key else []
+    if sprint_tasks_path.is_dir():
+        return read_sprint_tasks_csv_dir(
+            sprint_tasks_path, SPRINT_TASKS_COLUMNS, optional_columns=optional_columns
+        )
+    if sprint_tasks_path.suffix == ".csv":
+        return read_sprint_tasks_csv(
+            sprint_tasks_path, SPRINT_TASKS_COLUMNS, optional_columns=optional_columns
+        )
+    if not with_key:
+        return read_sheet(
+            sprint_tasks_path,
+            sheet_name=None,
+            index_col=None,
+            usecols=SPRINT_TASKS_COLUMNS,
+        )
+
+    # A callable does not require the optional columns, so the others are checked
+    columns = [*SPRINT_TASKS_COLUMNS, *optional_columns]
+    sheets = read_sheet(
+        sprint_tasks_path,
+        sheet_name=None,
+        index_col=None,
+        usecols=lambda column: column in columns,
+    )
+    for sheet_name, sheet in sheets.items():
+        missing = [column for column in SPRINT_TASKS_COLUMNS if column not in sheet]
+        if len(missing) != 0:
+            raise ValueError(
+                f"The sheet {sheet_name} of {sprint_tasks_path.name} is missing the "
+                f"columns {missing}"
+            )
+    return sheets
 
 
 class SprintTasks:
     """Class for data analysis of the sprint tasks data."""
 
-    def __init__(self, sprint_tasks_path: Path, burndown_path: Path) -> None:
+    # The attributes holding a DataFrame per sprint
+    SPRINT_ATTRIBUTES = (
+        "raw_burndown_sheets",
+        "burndown_sheets",
+        "raw_sprint_tasks_sheets",
+        "sprint_tasks_sheets",
+        "sprint_planning_dfs",
+        "creep_dfs",
+        "category_dfs",
+    )
+
+    def __init__(
+        self,
+        sprint_tasks_path: Path,
+        burndown_path: Path,
+        as_of: Optional[Timestamp] = None,
+    ) -> None:
         """
         Load the data to the object.
 
         Args:
             sprint_tasks_path (Path): Path to the spreadsheet containing the creeps
             burndown_path (Path): Path to the spreadsheet containing the burndown
+            as_of (Optional[Timestamp], optional): Load the sprint tasks as they
+                were at this time from the snapshot archive next to the sprint
+                tasks (see burndown.snapshots). Defaults to None (the current
+                sprint tasks).
         """
         self.sheet_dir = sprint_tasks_path.parent
+        self.sprint_tasks_path = sprint_tasks_path
+        self.burndown_path = burndown_path
+
+        self.raw_burndown_sheets: Dict[str, pd.DataFrame] = dict()
+        self.burndown_sheets: Dict[str, pd.DataFrame] = dict()
+        self.raw_sprint_tasks_sheets: Dict[str, pd.DataFrame] = dict()
+        self.sprint_tasks_sheets: Dict[str, pd.DataFrame] = dict()
+        self.sprint_planning_dfs: Dict[str, pd.DataFrame] = dict()
+        self.creep_dfs: Dict[str, pd.DataFrame] = dict()
+        self.category_dfs: Dict[str, pd.DataFrame] = dict()
+
+        # Closed sprints are read from the archive instead of the spreadsheets
+        archived = SprintArchive(
+            self.sheet_dir.joinpath(ARCHIVE_DIR_NAME)
+        ).read_sprints()
+        self.archived_person_days = archived.person_days
+
         # Read all the sheets in burndown in order to obtain the dates
-        self.burndown_sheets = read_sheet(
-            burndown_path,
-            sheet_name=None,
-            index_col=None,
-            usecols=["date", "ideal_burndown"],
+        burndown_sheets = read_burndown_sheets(burndown_path)
+        # Read all the sheets in sprint_tasks
+        if as_of is not None:
+            archive = SnapshotArchive(self.sheet_dir.joinpath(SNAPSHOT_DIR_NAME))
+            sprint_tasks_sheets = archive.load(as_of)
+        else:
+            sprint_tasks_sheets = read_sprint_tasks_sheets(sprint_tasks_path)
+        self.update_sprints(
+            {
+                **archived.burndown_sheets,
+                **self.without_archived(burndown_sheets),
+            },
+            {
+                **archived.sprint_tasks_sheets,
+                **self.without_archived(sprint_tasks_sheets),
+            },
         )
 
-        # Set the index
-        for sprint_name in self.burndown_sheets.keys():
-            if self.burndown_sheets[sprint_name].loc[:, "date"].isna().all():
-                self.burndown_sheets[sprint_name].loc[:, "date"] = pd.to_datetime(
-                    self.burndown_sheets[sprint_name].loc[:, "date"]
-                )
-            self.burndown_sheets[sprint_name].set_index("date", inplace=True)
+    def without_archived(
+        self, sheets: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Remove the sheets of the archived sprints.
 
-        # Read all the sheets in sprint_tasks
-        date_cols = ("creep_date", "Date Closed")
-        self.sprint_tasks_sheets = read_sheet(
-            sprint_tasks_path,
-            sheet_name=None,
-            index_col=None,
-            usecols=[
-                "burned",
-                "creep_date",
-                "creep",
-                "creep_category",
-                "category",
-                "Date Closed",
-                "Original estimate",
-                "Points",
-            ],
+        The archive is preferred if a closed sprint is still in the spreadsheets.
+
+        Args:
+            sheets (Dict[str, pd.DataFrame]): Sheets by the name of the sprint
+
+        Returns:
+            Dict[str, pd.DataFrame]: The sheets of the sprints which are not archived
+        """
+        return {
+            sprint_name: sheet
+            for sprint_name, sheet in sheets.items()
+            if sprint_name not in self.archived_person_days
+        }
+
+    def get_person_days(self, sprint_name: str) -> Any:
+        """
+        Get the capacity of a sprint, from the archive if the sprint is closed.
+
+        Args:
+            sprint_name (str): Name of the sprint
+
+        Returns:
+            Any: The person days of the sprint (as written in capacity.xlsx)
+        """
+        if sprint_name in self.archived_person_days:
+            return self.archived_person_days[sprint_name]
+        return read_cell(
+            path=self.sheet_dir.joinpath("capacity.xlsx"),
+            sheet_name=sprint_name,
+            column=CAPACITY_COLUMN,
+            row=CAPACITY_ROW,
         )
 
-        for sprint_name in self.sprint_tasks_sheets.keys():
-            # Remove bad rows and set the dates to date
-            # Drop any row where "category" is NaN (for example the sum row)
-            cur_sprint = self.sprint_tasks_sheets[sprint_name].copy()
-            cur_sprint = cur_sprint[cur_sprint["category"].notna()]
-            # Drop rows task duplicates
-            cur_sprint = cur_sprint[~cur_sprint.category.str.contains("Duplicate")]
-            # Keep only the date part of the datetime
-            for date_col in date_cols:
-                if cur_sprint.loc[:, date_col].isna().all():
-                    # Convert to datetime in order to use the dt accessor
-                    cur_sprint.loc[:, date_col] = pd.to_datetime(
-                        cur_sprint.loc[:, date_col]
-                    )
-                cur_sprint.loc[:, date_col] = pd.to_datetime(
-                    cur_sprint.loc[:, date_col].dt.date
-                )
+    def update_sprints(
+        self,
+        burndown_sheets: Dict[str, pd.DataFrame],
+        sprint_tasks_sheets: Dict[str, pd.DataFrame],
+    ) -> None:
+        """
+        Replace the raw sheets of some sprints and derive their DataFrames again.
+
+        Only the sprints present in one of the arguments are recomputed.
 
-            # Keep only close date which belongs to the sprint
-            cur_sprint = cur_sprint.loc[
-                cur_sprint.loc[:, "Date Closed"].isna()
-                | (
-                    cur_sprint.loc[:, "Date Closed"]
-                    <= pd.to_datetime(self.burndown_sheets[sprint_name].index.max())
+        Args:
+            burndown_sheets (Dict[str, pd.DataFrame]): Raw burndown sheets to replace
+            sprint_tasks_sheets (Dict[str, pd.DataFrame]): Raw sprint tasks sheets
+                to replace
+        """
+        self.raw_burndown_sheets.update(burndown_sheets)
+        for sprint_name, burndown_sheet in burndown_sheets.items():
+            with span("clean burndown", "clean", sprint=sprint_name):
+                burndown_sheet = apply_schema(
+                    burndown_sheet,
+                    BURNDOWN_SCHEMA,
+                    sheet_name=f"{self.burndown_path.name}/{sprint_name}",
                 )
-                & (
-                    cur_sprint.loc[:, "Date Closed"]
-                    >= pd.to_datetime(self.burndown_sheets[sprint_name].index.min())
-                ),
-                :,
-            ]
+                # Set the index
+                burndown_sheet.set_index("date", inplace=True)
+                self.burndown_sheets[sprint_name] = burndown_sheet
 
-            # Add release to the sprint
-            cur_sprint["Release"] = sprint_name.split("-")[0]
-            self.sprint_tasks_sheets[sprint_name] = cur_sprint
+        self.raw_sprint_tasks_sheets.update(sprint_tasks_sheets)
 
-        # Create sprint planning DataFrames (contains what was agreed upon during sprint planning)
-        self.sprint_planning_dfs = dict()
-        for sprint_name in self.sprint_tasks_sheets.keys():
-            sprint_df = self.sprint_tasks_sheets[sprint_name].copy()
-            # In the case of re-estimation, we will split points between sprint planning and creep
-            # To facilitate this we set the creep of this column to zero ....
-            sprint_df.loc[
-                sprint_df.loc[:, "creep_category"] == "Re-estimation", "creep"
-            ] = 0
-            # ...and set the burn to the original points
-            sprint_df.loc[
-                (sprint_df.loc[:, "creep_category"] == "Re-estimation")
-                & ~(np.isclose(sprint_df.loc[:, "burned"], 0)),
-                "burned",
-            ] = sprint_df.loc[
-                (sprint_df.loc[:, "creep_category"] == "Re-estimation")
-                & ~(np.isclose(sprint_df.loc[:, "burned"], 0)),
-                "Original estimate",
-            ]
+        changed_sprints = set(burndown_sheets.keys()) | set(sprint_tasks_sheets.keys())
+        for sprint_name in self.raw_sprint_tasks_sheets.keys():
+            if sprint_name in changed_sprints:
+                with span("clean sprint tasks", "clean", sprint=sprint_name):
+                    self._derive_sprint(sprint_name)
 
-            sprint_df = sprint_df.loc[
-                (np.isclose(sprint_df.loc[:, "creep"], 0))
-                | (sprint_df.loc[:, "creep"].isna())
-            ]
-            sprint_df.drop(
-                columns=["creep", "creep_category", "creep_date"], inplace=True
+        if is_tracing_memory():
+            for attribute in self.SPRINT_ATTRIBUTES:
+                sprint_dict = getattr(self, attribute)
+                for sprint_name in changed_sprints & sprint_dict.keys():
+                    track_frame(f"{attribute}[{sprint_name}]", sprint_dict[sprint_name])
+
+    def remove_sprints(self, sprint_names: Iterable[str]) -> None:
+        """
+        Remove sprints and their derived DataFrames.
+
+        Args:
+            sprint_names (Iterable[str]): Name of the sprints to remove
+        """
+        for sprint_name in sprint_names:
+            for attribute in self.SPRINT_ATTRIBUTES:
+                getattr(self, attribute).pop(sprint_name, None)
+
+    def _derive_sprint(self, sprint_name: str) -> None:
+        """
+        Clean the sprint tasks of a sprint and create the derived DataFrames.
+
+        Args:
+            sprint_name (str): Name of the sprint
+        """
+        raw_sprint = self.raw_sprint_tasks_sheets[sprint_name]
+        # Drop any row where "category" is NaN (for example the sum row), before the
+        # conversion so that free text in these rows is ignored
+        if "category" in raw_sprint.columns:
+            raw_sprint = raw_sprint[raw_sprint["category"].notna()]
+        # Convert the columns, where the dates are normalized to the day
+        cur_sprint = apply_schema(
+            raw_sprint,
+            SPRINT_TASKS_SCHEMA,
+            sheet_name=f"{self.sprint_tasks_path.name}/{sprint_name}",
+        )
+        # Remove bad rows
+        # Drop rows task duplicates
+        cur_sprint = cur_sprint[~cur_sprint.category.str.contains("Duplicate")]
+
+        # Keep only close date which belongs to the sprint
+        cur_sprint = cur_sprint.loc[
+            cur_sprint.loc[:, "Date Closed"].isna()
+            | (
+                cur_sprint.loc[:, "Date Closed"]
+                <= pd.to_datetime(self.burndown_sheets[sprint_name].index.max())
             )
-            self.sprint_planning_dfs[sprint_name] = sprint_df
+            & (
+                cur_sprint.loc[:, "Date Closed"]
+                >= pd.to_datetime(self.burndown_sheets[sprint_name].index.min())
+            ),
+            :,
+        ]
 
-        # Create creep DataFrames
-        self.creep_dfs = dict()
-        for sprint_name in self.sprint_tasks_sheets.keys():
-            creep_df = self.sprint_tasks_sheets[sprint_name].copy()
-            # In the case of re-estimation, we will split points between sprint planning and creep
-            # To facilitate this we set the burn to the creep
-            creep_df.loc[
-                (creep_df.loc[:, "creep_category"] == "Re-estimation")
-                & ~(np.isclose(creep_df.loc[:, "burned"], 0)),
-                "burned",
-            ] = creep_df.loc[
-                (creep_df.loc[:, "creep_category"] == "Re-estimation")
-                & ~(np.isclose(creep_df.loc[:, "burned"], 0)),
-                "creep",
-            ]
+        # Add release to the sprint
+        cur_sprint["Release"] = sprint_name.split("-")[0]
+        self.sprint_tasks_sheets[sprint_name] = cur_sprint
+
+        # Create sprint planning DataFrame (contains what was agreed upon during sprint planning)
+        sprint_df = cur_sprint.copy()
+        # In the case of re-estimation, we will split points between sprint planning and creep
+        # To facilitate this we set the creep of this column to zero ....
+        sprint_df.loc[
+            sprint_df.loc[:, "creep_category"] == "Re-estimation", "creep"
+        ] = 0
+        # ...and set the burn to the original points
+        sprint_df.loc[
+            (sprint_df.loc[:, "creep_category"] == "Re-estimation")
+            & ~(np.isclose(sprint_df.loc[:, "burned"], 0)),
+            "burned",
+        ] = sprint_df.loc[
+            (sprint_df.loc[:, "creep_category"] == "Re-estimation")
+            & ~(np.isclose(sprint_df.loc[:, "burned"], 0)),
+            "Original estimate",
+        ]
 
-            creep_df = creep_df.loc[
-                ~np.isclose(creep_df.loc[:, "creep"], 0)
-                & ~(creep_df.loc[:, "creep"].isna())
-            ]
-            creep_df.loc[:, "date"] = creep_df.loc[:, "creep_date"]
-            creep_df.drop(columns="creep_date", inplace=True)
-            self.creep_dfs[sprint_name] = creep_df
+        sprint_df = sprint_df.loc[
+            (np.isclose(sprint_df.loc[:, "creep"], 0))
+            | (sprint_df.loc[:, "creep"].isna())
+        ]
+        sprint_df.drop(columns=["creep", "creep_category", "creep_date"], inplace=True)
+        self.sprint_planning_dfs[sprint_name] = sprint_df
+
+        # Create creep DataFrame
+        creep_df = cur_sprint.copy()
+        # In the case of re-estimation, we will split points between sprint planning and creep
+        # To facilitate this we set the burn to the creep
+        creep_df.loc[
+            (creep_df.loc[:, "creep_category"] == "Re-estimation")
+            & ~(np.isclose(creep_df.loc[:, "burned"], 0)),
+            "burned",
+        ] = creep_df.loc[
+            (creep_df.loc[:, "creep_category"] == "Re-estimation")
+            & ~(np.isclose(creep_df.loc[:, "burned"], 0)),
+            "creep",
+        ]
 
-        # Create category DataFrames
-        self.category_dfs = dict()
-        for sprint_name in self.sprint_tasks_sheets.keys():
-            self.category_dfs[sprint_name] = self.sprint_tasks_sheets[
-                sprint_name
-            ].copy()
+        creep_df = creep_df.loc[
+            ~np.isclose(creep_df.loc[:, "creep"], 0)
+            & ~(creep_df.loc[:, "creep"].isna())
+        ]
+        creep_df.loc[:, "date"] = creep_df.loc[:, "creep_date"]
+        creep_df.drop(columns="creep_date", inplace=True)
+        self.creep_dfs[sprint_name] = creep_df
 
+        # Create category DataFrame
+        self.category_dfs[sprint_name] = cur_sprint.copy()
+
+    @profiled("derive")
     def get_total_sprint_creep_and_burn(self) -> Dict[str, pd.DataFrame]:
         """
         Get the DataFrames containing the total creep and burn of the sprint.
@@ -206,6 +433,204 @@ class SprintTasks:
 
         return total_sprint_burn_dfs
 
+    @profiled("derive")
+    def get_sprint_start_dates(self) -> pd.Series:
+        """
+        Get the start date of the sprints.
+
+        Returns:
+            pd.Series: The start dates indexed by the sprint names
+        """
+        return pd.Series(
+            {
+                sprint_name: self.burndown_sheets[sprint_name].index.min()
+                for sprint_name in self.sprint_tasks_sheets.keys()
+            },
+            name="start_date",
+            dtype="datetime64[ns]",
+        )
+
+    @profiled("derive")
+    def get_release_burnup(self, release: str) -> pd.DataFrame:
+        """
+        Get the DataFrame containing the burnup of a release.
+
+        The sprints of the release are stitched together on one date index.
+        The scope of a day is what was burned before the sprint started, plus what
+        was planned during the sprint planning, plus the creep of the sprint until
+        that day. The done points and creep agree with
+        get_total_sprint_creep_and_burn, except that the creep before the first and
+        after the last closed task of a sprint is counted as well.
+
+        Args:
+            release (str): The release to get the burnup of
+
+        Returns:
+            pd.DataFrame: The DataFrame containing the sprint, scope, done and
+                remaining points of each day
+        """
+        sprint_names = sorted(
+            (
+                sprint_name
+                for sprint_name in self.sprint_tasks_sheets.keys()
+                if sprint_name.split("-")[0] == release
+            ),
+            key=lambda sprint_name: self.burndown_sheets[sprint_name].index.min(),
+        )
+        if len(sprint_names) == 0:
+            raise KeyError(f"No sprints found for release {release}")
+        sprint_starts = pd.DatetimeIndex(
+            [self.burndown_sheets[name].index.min() for name in sprint_names]
+        )
+        sprint_ends = pd.DatetimeIndex(
+            [self.burndown_sheets[name].index.max() for name in sprint_names]
+        )
+        dates = pd.date_range(sprint_starts.min(), sprint_ends.max(), freq="D")
+
+        def get_daily_sum(event_dates: pd.Series, points: pd.Series) -> np.ndarray:
+            """Sum the points onto the date index."""
+            positions = dates.get_indexer(pd.DatetimeIndex(event_dates))
+            valid = (positions >= 0) & points.notna().values
+            return np.bincount(
+                positions[valid], weights=points.values[valid], minlength=len(dates)
+            )
+
+        tasks_df = pd.concat([self.sprint_tasks_sheets[name] for name in sprint_names])
+        creep_df = pd.concat([self.creep_dfs[name] for name in sprint_names])
+        planned = np.array(
+            [
+                self.sprint_planning_dfs[name].loc[:, "Original estimate"].sum()
+                for name in sprint_names
+            ]
+        )
+
+        # Prefix sums over the whole release
+        done = np.cumsum(get_daily_sum(tasks_df["Date Closed"], tasks_df["burned"]))
+        accum_creep = np.cumsum(get_daily_sum(creep_df["date"], creep_df["creep"]))
+
+        # The sprint a day belongs to (the latest sprint started on or before the day)
+        sprint_index = sprint_starts.searchsorted(dates, side="right") - 1
+        start_positions = dates.get_indexer(sprint_starts)
+        done_before_sprint = np.concatenate([[0], done])[start_positions]
+        creep_before_sprint = np.concatenate([[0], accum_creep])[start_positions]
+        scope = (
+            done_before_sprint[sprint_index]
+            + planned[sprint_index]
+            + accum_creep
+            - creep_before_sprint[sprint_index]
+        )
+
+        release_burnup_df = pd.DataFrame(
+            {
+                "sprint": np.array(sprint_names)[sprint_index],
+                "scope": scope,
+                "done": done,
+                "remaining": scope - done,
+            },
+            index=pd.Index(dates, name="date"),
+        )
+        return release_burnup_df
+
+    @profiled("derive")
+    def get_cumulative_flow(
+        self, sprint_names: Iterable[str], points: bool = True
+    ) -> pd.DataFrame:
+        """
+        Get the cumulative flow of the tasks of some sprints.
+
+        Planned tasks (and re-estimations) enter the sprint at its start, other
+        creep enters at its creep date.
+
+        Args:
+            sprint_names (Iterable[str]): Name of the sprints
+            points (bool, optional): Whether to sum the points of the tasks instead
+                of counting the tasks. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The closed, creep, in_sprint and backlog points (or
+                tasks) at the end of each day of the sprints
+        """
+        sprint_names = list(sprint_names)
+        if len(sprint_names) == 0:
+            raise KeyError("No sprints to get the cumulative flow of")
+        tasks_df = pd.concat(
+            [self.sprint_tasks_sheets[name] for name in sprint_names],
+            keys=sprint_names,
+            names=["sprint", None],
+        ).reset_index(level="sprint")
+        sprint_starts = pd.Series(
+            {name: self.burndown_sheets[name].index.min() for name in sprint_names}
+        )
+        sprint_ends = pd.Series(
+            {name: self.burndown_sheets[name].index.max() for name in sprint_names}
+        )
+
+        creep_category = tasks_df.loc[:, "creep_category"].astype(object)
+        is_creep = creep_category.notna() & (creep_category != "Re-estimation")
+        entered = tasks_df.loc[:, "creep_date"].where(
+            is_creep & tasks_df.loc[:, "creep_date"].notna(),
+            sprint_starts.reindex(tasks_df.loc[:, "sprint"]).to_numpy(),
+        )
+        return get_cumulative_flow(
+            created=tasks_df.loc[:, "Created"],
+            entered=entered,
+            closed=tasks_df.loc[:, "Date Closed"],
+            is_creep=is_creep,
+            values=(
+                tasks_df.loc[:, "Points"].fillna(0)
+                if points
+                else pd.Series(1.0, index=tasks_df.index)
+            ),
+            dates=pd.date_range(sprint_starts.min(), sprint_ends.max(), freq="D"),
+        )
+
+    @profiled("derive")
+    def get_lead_times(
+        self, days_off: Optional[List[Timestamp]] = None
+    ) -> pd.DataFrame:
+        """
+        Get the lead time of the closed tasks of all the sprints.
+
+        The lead time is the number of days of development from the task was
+        created until it was closed. Tasks closed before they were created are
+        dropped with a warning.
+
+        Args:
+            days_off (Optional[List[Timestamp]], optional):
+                Days without development besides the week-ends. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The sprint, Release, category, Created, Date Closed and
+                lead_time of each closed task
+        """
+        columns = ["Release", "category", "Created", "Date Closed"]
+        tasks_df = pd.concat(
+            [
+                self.sprint_tasks_sheets[sprint_name].loc[:, columns]
+                for sprint_name in self.sprint_tasks_sheets.keys()
+            ],
+            keys=list(self.sprint_tasks_sheets.keys()),
+            names=["sprint", None],
+        )
+        tasks_df = tasks_df.loc[tasks_df.loc[:, "Date Closed"].notna()]
+        tasks_df = tasks_df.reset_index(level="sprint").reset_index(drop=True)
+        # Categories may differ between the sprints
+        tasks_df["category"] = tasks_df.loc[:, "category"].astype("category")
+        tasks_df["lead_time"] = count_business_days(
+            tasks_df.loc[:, "Created"], tasks_df.loc[:, "Date Closed"], days_off
+        )
+        closed_before_created = (
+            tasks_df.loc[:, "Date Closed"] < tasks_df.loc[:, "Created"]
+        )
+        if closed_before_created.any():
+            warnings.warn(
+                f"Dropping {closed_before_created.sum()} tasks closed before they "
+                "were created (in sprints "
+                f"{', '.join(tasks_df.loc[closed_before_created, 'sprint'].unique())})"
+            )
+            tasks_df = tasks_df.loc[~closed_before_created].reset_index(drop=True)
+        return tasks_df
+
     def _get_categories(self, group_by: str, col: str) -> pd.DataFrame:
         """
         Get the DataFrame containing aggregated categories.
@@ -218,9 +643,14 @@ class SprintTasks:
         """
         categories = dict()
         for sprint_name in self.sprint_tasks_sheets.keys():
-            categories[sprint_name] = (
-                self.sprint_tasks_sheets[sprint_name].groupby(group_by)[[col]].sum().T
+            category_sums = (
+                self.sprint_tasks_sheets[sprint_name]
+                .groupby(group_by, observed=True)[[col]]
+                .sum()
             )
+            # The categories differ between the sprints, so use plain labels
+            category_sums.index = category_sums.index.astype(str)
+            categories[sprint_name] = category_sums.T
             categories[sprint_name]["Release"] = sprint_name.split("-")[0]
             categories[sprint_name]["Sprint"] = sprint_name
             categories[sprint_name].set_index("Sprint", inplace=True)
@@ -232,6 +662,7 @@ class SprintTasks:
         categories_df.fillna(0, inplace=True)
         return categories_df
 
+    @profiled("derive")
     def get_creep_categories(self) -> pd.DataFrame:
         """
         Get the DataFrame containing the creep categories.
@@ -246,6 +677,7 @@ class SprintTasks:
         creep_categories.sort_index(inplace=True)
         return creep_categories
 
+    @profiled("derive")
     def get_burn_categories(self) -> pd.DataFrame:
         """
         Get the DataFrame containing the burn categories.
@@ -260,6 +692,7 @@ class SprintTasks:
         category_df.sort_index(inplace=True)
         return category_df
 
+    @profiled("derive")
     def get_sprint_planning_burn(
         self, sprint_name: str, until_date: Optional[Timestamp] = None
     ) -> pd.DataFrame:
@@ -311,6 +744,7 @@ class SprintTasks:
         sprint_planning_burn_df.set_index("date", inplace=True)
         return sprint_planning_burn_df
 
+    @profiled("derive")
     def get_creep_burn(
         self, sprint_name: str, until_date: Optional[Timestamp] = None
     ) -> pd.DataFrame:
@@ -364,6 +798,7 @@ class SprintTasks:
         creep_burn_df.set_index("date", inplace=True)
         return creep_burn_df
 
+    @profiled("derive")
     def get_daily_creep(
         self, sprint_name: str, until_date: Optional[Timestamp] = None
     ) -> Dict[str, Union[pd.core.indexes.datetimes.DatetimeIndex, str, float]]:
@@ -396,7 +831,7 @@ class SprintTasks:
         for date in daily_creep_dict["date"]:
             creeps_cur_date = (
                 creep_df.loc[creep_df.loc[:, "date"] == date]
-                .groupby("creep_category")[["creep"]]
+                .groupby("creep_category", observed=True)[["creep"]]
                 .sum()
             )
             for category in creep_categories:
@@ -410,6 +845,36 @@ class SprintTasks:
 
         return daily_creep_dict
 
+    @profiled("derive")
+    def get_metric_cube(
+        self, sprint_names: Optional[Iterable[str]] = None
+    ) -> MetricCube:
+        """
+        Get the remaining points and daily creep of every day of the sprints.
+
+        The metrics of a sprint until a date are a slice of the cube, equal to
+        get_sprint_planning_burn, get_creep_burn and get_daily_creep with until_date.
+
+        Args:
+            sprint_names (Optional[Iterable[str]], optional): Name of the sprints.
+                Defaults to None (all sprints).
+
+        Returns:
+            MetricCube: The metrics of every sprint and day
+        """
+        sprint_names = list(
+            self.sprint_tasks_sheets.keys() if sprint_names is None else sprint_names
+        )
+        if len(sprint_names) == 0:
+            raise KeyError("No sprints to get the metric cube of")
+        return get_metric_cube(
+            sprint_names,
+            [self.burndown_sheets[name].index for name in sprint_names],
+            self.sprint_planning_dfs,
+            self.creep_dfs,
+        )
+
+    @profiled("derive")
     def get_total_burn(self) -> pd.DataFrame:
         """
         Get the DataFrame containing the total burndown across several sprints.
@@ -418,6 +883,7 @@ class SprintTasks:
         The columns consist of
         - Total points burned
         - Total points burned which were present at the sprint planning
+        - Total points present at the sprint planning
         - Percentage of points from the sprint planning which were burned
 
         Returns:
@@ -441,6 +907,9 @@ class SprintTasks:
             burndown_dict["sprint_start_burned"] = sprint_start_points.loc[
                 :, "burned"
             ].sum()
+            burndown_dict["sprint_start_points"] = sprint_start_points.loc[
+                :, "Points"
+            ].sum()
 
             burndown_dict["achievement"] = (
                 100
@@ -458,16 +927,12 @@ class SprintTasks:
 
         # Get the capacity numbers
         capacity_path = self.sheet_dir.joinpath("capacity.xlsx")
-        capacity_dict = {"person_days": list(), "index": list()}
-        for sprint in burndown.index:
-            capacity_dict["index"].append(sprint)
-            capacity_dict["person_days"].append(
-                read_cell(path=capacity_path, sheet_name=sprint, column="F", row=11)
+        with span("read capacity", "load"):
+            person_days = apply_capacity_schema(
+                {sprint: self.get_person_days(sprint) for sprint in burndown.index},
+                capacity_path.name,
             )
-
-        capacity_df = pd.DataFrame(capacity_dict)
-        capacity_df.set_index("index", inplace=True)
-        burndown = pd.concat([burndown, capacity_df], axis=1)
+        burndown = pd.concat([burndown, person_days], axis=1)
         burndown["burn_per_person_day"] = (
             burndown["total_points"] / burndown["person_days"]
         )
@@ -0,0 +1,211 @@
+"""Module for rendering the charts of the package from data loaded once."""
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+from pandas import Timestamp
+
+from burndown.excel_io import read_sheet
+from burndown.options import PLOT_TARGETS
+from burndown.profiling import span
+from burndown.sprint_tasks import SprintTasks, find_sprint_tasks_path
+
+
+class StageTimer:
+    """Class which keeps track of the time spent in the stages of a run."""
+
+    def __init__(self) -> None:
+        """Initialize the list of timings."""
+        self.timings: List[Tuple[str, float]] = list()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the stage, and record it as a span when profiling.
+
+        Args:
+            name (str): Name of the stage
+
+        Yields:
+            Iterator[None]: Context where the stage is run
+        """
+        start = time.perf_counter()
+        try:
+            with span(name, "stage"):
+                yield
+        finally:
+            self.timings.append((name, time.perf_counter() - start))
+
+    def print_summary(self) -> None:
+        """Print the time spent in each stage."""
+        width = max([len(name) for name, _ in self.timings] + [len("Total")])
+        print("Timing:")
+        print("-" * (width + 12))
+        for name, seconds in self.timings:
+            print(f"{name:<{width}} {seconds:>9.3f} s")
+        print("-" * (width + 12))
+        total = sum(seconds for _, seconds in self.timings)
+        print(f"{'Total':<{width}} {total:>9.3f} s")
+
+
+class SharedData:
+    """Class which loads the data once and shares it between the targets."""
+
+    def __init__(
+        self,
+        sheet_dir: Path,
+        timer: Optional[StageTimer] = None,
+        as_of: Optional[Timestamp] = None,
+    ) -> None:
+        """Set the paths of the data.
+
+        Args:
+            sheet_dir (Path): Directory containing the spreadsheets
+            timer (Optional[StageTimer], optional): Timer which records the time
+                spent on loading. Defaults to None.
+            as_of (Optional[Timestamp], optional): Load the sprint tasks as they
+                were at this time from the snapshot archive. Defaults to None (the
+                current sprint tasks).
+        """
+        self.sheet_dir = sheet_dir
+        self.sprint_tasks_path = find_sprint_tasks_path(sheet_dir)
+        self.burndown_path = sheet_dir.joinpath("burndown.xlsx")
+        self.capacity_path = sheet_dir.joinpath("capacity.xlsx")
+        self.timer = timer if timer is not None else StageTimer()
+        self.as_of = as_of
+        self._sprint_tasks: Optional[SprintTasks] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return whether the sprint tasks have been loaded.
+
+        Returns:
+            bool: True if the sprint tasks are loaded
+        """
+        return self._sprint_tasks is not None
+
+    @property
+    def sprint_tasks(self) -> SprintTasks:
+        """Return the sprint tasks, and load them on first use.
+
+        Returns:
+            SprintTasks: The loaded sprint tasks
+        """
+        if self._sprint_tasks is None:
+            with self.timer.stage("load"):
+                self._sprint_tasks = SprintTasks(
+                    sprint_tasks_path=self.sprint_tasks_path,
+                    burndown_path=self.burndown_path,
+                    as_of=self.as_of,
+                )
+        return self._sprint_tasks
+
+    def load(self) -> SprintTasks:
+        """Load the sprint tasks now instead of on first use.
+
+        Returns:
+            SprintTasks: The loaded sprint tasks
+        """
+        return self.sprint_tasks
+
+    def get_burndown_df(self, sprint_name: str) -> pd.DataFrame:
+        """Return the burndown sheet of a sprint.
+
+        The sheet is taken from the sprint tasks if they are loaded, otherwise only
+        the sheet itself is read.
+
+        Args:
+            sprint_name (str): Name of the sprint
+
+        Returns:
+            pd.DataFrame: The burndown sheet
+        """
+        if self._sprint_tasks is not None:
+            return self._sprint_tasks.burndown_sheets[sprint_name]
+        with self.timer.stage("load burndown"):
+            return read_sheet(self.burndown_path, sprint_name, index_col="date")
+
+
+def render_target(
+    target: str,
+    data: SharedData,
+    charts_dir: Path,
+    sprint_name: Optional[str] = None,
+    release: Optional[str] = None,
+    days_off: Optional[List[Timestamp]] = None,
+    until_day: Optional[Timestamp] = None,
+    aggregate: str = "sprint",
+) -> None:
+    """Render one of the targets.
+
+    Args:
+        target (str): One of PLOT_TARGETS
+        data (SharedData): The data shared between the targets
+        charts_dir (Path): Directory to store the charts to
+        sprint_name (Optional[str], optional): Name of the sprint (required by
+            SPRINT_TARGETS, and optional for cumulative_flow). Defaults to None.
+        release (Optional[str], optional): The release (required by
+            RELEASE_TARGETS). Defaults to None.
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+        until_day (Optional[Timestamp], optional): Until what day to get the double
+            burndown to. Defaults to None (today).
+        aggregate (str, optional): Whether to plot the trends per sprint, release
+            or quarter. Defaults to "sprint".
+    """
+    # The charting modules import matplotlib, so they are only imported when needed
+    if target == "burndown":
+        from burndown.plot_sprint_burndown import plot_sprint_burndown
+
+        burndown_df = data.get_burndown_df(sprint_name)
+        with data.timer.stage(f"{target} {sprint_name}"):
+            plot_sprint_burndown(burndown_df, sprint_name, charts_dir, days_off)
+        return
+
+    sprint_tasks = data.sprint_tasks
+    if target == "sprint":
+        from burndown.plot_sprint import plot_sprint
+
+        with data.timer.stage(f"{target} {sprint_name}"):
+            plot_sprint(sprint_tasks, sprint_name, charts_dir, days_off)
+    elif target == "double":
+        from burndown.plot_sprint_double_burndown import plot_sprint_double_burndown
+
+        with data.timer.stage(f"{target} {sprint_name}"):
+            plot_sprint_double_burndown(
+                sprint_tasks,
+                sprint_name,
+                charts_dir,
+                until_day=until_day,
+                days_off=days_off,
+            )
+    elif target == "trends":
+        from burndown.plot_sprint_trends import plot_sprint_trends
+
+        with data.timer.stage(target):
+            plot_sprint_trends(sprint_tasks, charts_dir, release, aggregate)
+    elif target == "release":
+        from burndown.plot_release_burnup import plot_release
+
+        with data.timer.stage(f"{target} {release}"):
+            plot_release(sprint_tasks, release, charts_dir, days_off)
+    elif target == "cumulative_flow":
+        from burndown.plot_cumulative_flow import plot_flow
+
+        sprint_number = None if sprint_name is None else sprint_name.split("-")[1]
+        with data.timer.stage(f"{target} {sprint_name or release}"):
+            plot_flow(sprint_tasks, release, charts_dir, sprint_number, days_off)
+    elif target == "lead_time":
+        from burndown.plot_lead_time import plot_lead_time
+
+        with data.timer.stage(target):
+            plot_lead_time(sprint_tasks, charts_dir, release, days_off)
+    elif target == "dashboard":
+        from burndown.dashboard import save_dashboard
+
+        with data.timer.stage(target):
+            save_dashboard(sprint_tasks, charts_dir.joinpath("dashboard.html"))
+    else:
+        raise ValueError(f"Unknown target '{target}', choose from {PLOT_TARGETS}")
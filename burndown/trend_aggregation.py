@@ -0,0 +1,92 @@
+"""Module for aggregating the sprint trends into releases or quarters."""
+
+import numpy as np
+import pandas as pd
+
+from burndown.options import AGGREGATION_LABELS
+
+
+def get_buckets(sprint_start_dates: pd.Series, aggregate_by: str) -> pd.Series:
+    """Get the bucket each sprint belongs to.
+
+    Args:
+        sprint_start_dates (pd.Series): The start dates indexed by the sprint names
+        aggregate_by (str): What to aggregate by (sprint, release or quarter)
+
+    Returns:
+        pd.Series: The bucket of each sprint indexed by the sprint names
+    """
+    if aggregate_by == "sprint":
+        buckets = sprint_start_dates.index.to_series()
+    elif aggregate_by == "release":
+        buckets = sprint_start_dates.index.to_series().str.split("-").str[0]
+    elif aggregate_by == "quarter":
+        buckets = sprint_start_dates.dt.to_period("Q").astype(str)
+    else:
+        raise ValueError(
+            f"Cannot aggregate by '{aggregate_by}', "
+            f"choose from {list(AGGREGATION_LABELS.keys())}"
+        )
+    buckets.name = AGGREGATION_LABELS[aggregate_by]
+    return buckets
+
+
+def aggregate_categories(
+    categories_df: pd.DataFrame, buckets: pd.Series
+) -> pd.DataFrame:
+    """Sum the categories of the sprints into their buckets.
+
+    Args:
+        categories_df (pd.DataFrame): The categories with the sprints as entries
+        buckets (pd.Series): The bucket of each sprint indexed by the sprint names
+
+    Returns:
+        pd.DataFrame: The categories with the buckets as entries
+    """
+    categories_df = categories_df.drop(columns="Release", errors="ignore")
+    return categories_df.groupby(buckets.reindex(categories_df.index)).sum()
+
+
+def aggregate_total_burn(
+    total_burn_df: pd.DataFrame, buckets: pd.Series, window_size: int = 5
+) -> pd.DataFrame:
+    """Aggregate the total burn of the sprints into their buckets.
+
+    The points and person days are summed, whereas the achievement and the burn per
+    person day are recalculated from the sums.
+
+    Args:
+        total_burn_df (pd.DataFrame): The total burn with the sprints as entries
+        buckets (pd.Series): The bucket of each sprint indexed by the sprint names
+        window_size (int, optional): Number of buckets in the rolling average.
+            Defaults to 5.
+
+    Returns:
+        pd.DataFrame: The total burn with the buckets as entries
+    """
+    sum_columns = [
+        "total_points",
+        "sprint_start_burned",
+        "sprint_start_points",
+        "person_days",
+    ]
+    aggregated_df = (
+        total_burn_df.loc[:, sum_columns]
+        .groupby(buckets.reindex(total_burn_df.index))
+        .sum()
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        aggregated_df["achievement"] = (
+            100
+            * aggregated_df["sprint_start_burned"]
+            / aggregated_df["sprint_start_points"]
+        )
+        aggregated_df["burn_per_person_day"] = (
+            aggregated_df["total_points"] / aggregated_df["person_days"]
+        )
+    aggregated_df["rolling_average"] = (
+        aggregated_df.loc[:, "burn_per_person_day"]
+        .rolling(window=window_size, min_periods=1)
+        .mean()
+    )
+    return aggregated_df
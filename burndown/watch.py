@@ -0,0 +1,257 @@
+"""Module for re-rendering the charts whenever the spreadsheets change."""
+
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+from pandas import Timestamp
+
+from burndown.options import RELEASE_TARGETS, SPRINT_TARGETS, WATCH_TARGETS
+from burndown.sprint_tasks import read_burndown_sheets, read_sprint_tasks_sheets
+from burndown.targets import SharedData, render_target
+
+# The errors of reading a spreadsheet which is truncated because it is being written
+PARTIAL_WRITE_ERRORS = (zipfile.BadZipFile, EOFError)
+
+
+class WorkbookWatcher:
+    """Class which detects changes of files by polling their modification times."""
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        """Record the current state of the files.
+
+        Args:
+            paths (Iterable[Path]): The files to watch
+        """
+        self.states: Dict[Path, Optional[Tuple[int, int]]] = {
+            path: self._get_state(path) for path in paths
+        }
+
+    @staticmethod
+    def _get_state(path: Path) -> Optional[Tuple[int, int]]:
+        """Return the modification time and size of a file.
+
+        Args:
+            path (Path): The file
+
+        Returns:
+            Optional[Tuple[int, int]]: The modification time in ns and the size,
+                None if the file does not exist
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self) -> List[Path]:
+        """Return the files which changed since the last poll.
+
+        Returns:
+            List[Path]: The changed files
+        """
+        changed = list()
+        for path, state in self.states.items():
+            new_state = self._get_state(path)
+            if new_state != state:
+                self.states[path] = new_state
+                changed.append(path)
+        return changed
+
+    def forget(self, path: Path) -> None:
+        """Forget the state of a file, so that it is reported on the next poll.
+
+        Args:
+            path (Path): The file to forget
+        """
+        self.states[path] = (-1, -1)
+
+
+def get_changed_sheets(
+    old_sheets: Dict[str, pd.DataFrame], new_sheets: Dict[str, pd.DataFrame]
+) -> Tuple[Set[str], Set[str]]:
+    """Compare the sheets of two versions of a spreadsheet.
+
+    Args:
+        old_sheets (Dict[str, pd.DataFrame]): The previous sheets
+        new_sheets (Dict[str, pd.DataFrame]): The current sheets
+
+    Returns:
+        Tuple[Set[str], Set[str]]: The name of the changed or added sheets, and the
+            name of the removed sheets
+    """
+    changed = {
+        sheet_name
+        for sheet_name, sheet in new_sheets.items()
+        if sheet_name not in old_sheets or not sheet.equals(old_sheets[sheet_name])
+    }
+    removed = set(old_sheets.keys()) - set(new_sheets.keys())
+    return changed, removed
+
+
+def reload_changed(data: SharedData, changed_paths: Iterable[Path]) -> Set[str]:
+    """Reload the changed spreadsheets and update only the changed sprints.
+
+    The archived sprints are not read from the spreadsheets, so they never change.
+
+    Args:
+        data (SharedData): The loaded data
+        changed_paths (Iterable[Path]): The changed spreadsheets
+
+    Returns:
+        Set[str]: The name of the sprints which changed
+    """
+    sprint_tasks = data.sprint_tasks
+    changed_burndown: Dict[str, pd.DataFrame] = dict()
+    changed_tasks: Dict[str, pd.DataFrame] = dict()
+    removed: Set[str] = set()
+    for path in changed_paths:
+        if path == data.burndown_path:
+            with data.timer.stage("reload burndown"):
+                new_sheets = read_burndown_sheets(path)
+            changed, removed_sheets = get_changed_sheets(
+                sprint_tasks.without_archived(sprint_tasks.raw_burndown_sheets),
+                sprint_tasks.without_archived(new_sheets),
+            )
+            changed_burndown = {name: new_sheets[name] for name in changed}
+            removed |= removed_sheets
+        elif path == data.sprint_tasks_path:
+            with data.timer.stage("reload sprint tasks"):
+                new_sheets = read_sprint_tasks_sheets(path)
+            changed, removed_sheets = get_changed_sheets(
+                sprint_tasks.without_archived(sprint_tasks.raw_sprint_tasks_sheets),
+                sprint_tasks.without_archived(new_sheets),
+            )
+            changed_tasks = {name: new_sheets[name] for name in changed}
+            removed |= removed_sheets
+
+    sprint_tasks.remove_sprints(removed)
+    with data.timer.stage("update sprints"):
+        sprint_tasks.update_sprints(changed_burndown, changed_tasks)
+    return set(changed_burndown.keys()) | set(changed_tasks.keys())
+
+
+def get_dependent_targets(
+    changed_sprints: Iterable[str],
+    sprint_names: Iterable[str],
+    targets: Iterable[str],
+) -> List[Tuple[str, Optional[str]]]:
+    """Return the targets which depend on the changed sprints.
+
+    Args:
+        changed_sprints (Iterable[str]): The sprints which changed
+        sprint_names (Iterable[str]): The sprints with sprint tasks
+        targets (Iterable[str]): The targets to keep up to date
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: The targets to render, and the sprint or
+            release they should be rendered for
+    """
+    sprint_names = set(sprint_names)
+    dependent = list()
+    for target in targets:
+        if target == "burndown":
+            dependent += [(target, sprint) for sprint in sorted(changed_sprints)]
+        elif target in SPRINT_TARGETS:
+            dependent += [
+                (target, sprint)
+                for sprint in sorted(changed_sprints)
+                if sprint in sprint_names
+            ]
+        elif target in RELEASE_TARGETS:
+            releases = {sprint.split("-")[0] for sprint in changed_sprints}
+            dependent += [(target, release) for release in sorted(releases)]
+        else:
+            # The trends and the dashboard depend on all the sprints
+            dependent.append((target, None))
+    return dependent
+
+
+def watch(
+    data: SharedData,
+    charts_dir: Path,
+    targets: Iterable[str] = WATCH_TARGETS,
+    interval: float = 2.0,
+    days_off: Optional[List[Timestamp]] = None,
+    aggregate: str = "sprint",
+    max_events: Optional[int] = None,
+) -> None:
+    """Watch the spreadsheets and re-render the charts affected by a change.
+
+    The parsed data is kept in memory between the changes, and only the changed
+    sprints are derived again. A spreadsheet which is truncated because it is being
+    written is read again on the next poll, and one with invalid content (such as a
+    missing column or a value not following its schema) once it is saved again. Any
+    other error stops the watch.
+
+    Args:
+        data (SharedData): The data to keep up to date
+        charts_dir (Path): Directory to store the charts to
+        targets (Iterable[str], optional): The targets to keep up to date.
+            Defaults to WATCH_TARGETS.
+        interval (float, optional): Seconds between the polls. Defaults to 2.0.
+        days_off (Optional[List[Timestamp]], optional):
+            List of days where there will be no sprint. Defaults to None.
+        aggregate (str, optional): Whether to plot the trends per sprint, release
+            or quarter. Defaults to "sprint".
+        max_events (Optional[int], optional): Number of changes to handle before
+            returning. Defaults to None (watch forever).
+    """
+    targets = list(dict.fromkeys(targets))
+    charts_dir.mkdir(parents=True, exist_ok=True)
+    data.load()
+    watcher = WorkbookWatcher(
+        [data.burndown_path, data.sprint_tasks_path, data.capacity_path]
+    )
+    print(f"Watching {', '.join(str(path) for path in watcher.states.keys())}")
+
+    n_events = 0
+    while max_events is None or n_events < max_events:
+        time.sleep(interval)
+        changed_paths = watcher.poll()
+        if len(changed_paths) == 0:
+            continue
+        n_events += 1
+        print(f"Changed: {', '.join(path.name for path in changed_paths)}")
+
+        try:
+            changed_sprints = reload_changed(data, changed_paths)
+        except PARTIAL_WRITE_ERRORS as error:
+            # The file may be read while it is being written, so try again later
+            print(f"Could not reload the spreadsheets ({error}), retrying")
+            for path in changed_paths:
+                watcher.forget(path)
+            continue
+        except ValueError as error:
+            # Reading the same content again fails the same way (SchemaError is a
+            # ValueError)
+            print(f"Could not reload the spreadsheets ({error}), waiting for a fix")
+            continue
+
+        if data.capacity_path in changed_paths:
+            dependent_targets = [
+                (target, None)
+                for target in targets
+                if target in ("trends", "dashboard")
+            ]
+        else:
+            dependent_targets = list()
+        for target in get_dependent_targets(
+            changed_sprints, data.sprint_tasks.sprint_tasks_sheets.keys(), targets
+        ):
+            if target not in dependent_targets:
+                dependent_targets.append(target)
+
+        for target, key in dependent_targets:
+            render_target(
+                target,
+                data,
+                charts_dir,
+                sprint_name=key if target in SPRINT_TARGETS else None,
+                release=key,
+                days_off=days_off,
+                aggregate=aggregate,
+            )
+        print(f"Rendered {len(dependent_targets)} chart(s)")
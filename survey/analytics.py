@@ -0,0 +1,98 @@
+"""Module containing the analytics of the agile maturity survey."""
+
+import numpy as np
+import pandas as pd
+
+
+def get_dimension_means(level_matrix: pd.DataFrame) -> pd.DataFrame:
+    """Return the mean level of each dimension for each survey round.
+
+    Args:
+        level_matrix (pd.DataFrame): The levels from get_level_matrix
+
+    Returns:
+        pd.DataFrame: The mean levels indexed by the sprint (in survey order), with
+            one column per dimension
+    """
+    return level_matrix.groupby(level="Sprint", sort=False).mean()
+
+
+def get_round_deltas(dimension_means: pd.DataFrame) -> pd.DataFrame:
+    """Return the change of the mean levels since the previous survey round.
+
+    Args:
+        dimension_means (pd.DataFrame): The mean levels from get_dimension_means
+
+    Returns:
+        pd.DataFrame: The deltas indexed by the sprint (NaN for the first round)
+    """
+    return dimension_means.diff()
+
+
+def get_dimension_trends(dimension_means: pd.DataFrame) -> pd.DataFrame:
+    """Return the linear trend of the mean level of each dimension.
+
+    The trends of all the dimensions are fitted at once with the closed form of
+    the least squares line over the survey rounds. Rounds without answers to a
+    dimension are left out of its fit.
+
+    Args:
+        dimension_means (pd.DataFrame): The mean levels from get_dimension_means
+
+    Returns:
+        pd.DataFrame: The slope (level per round), the first and last fitted level,
+            and the number of rounds of the fit, indexed by the dimension
+    """
+    values = dimension_means.to_numpy(dtype=float)
+    observed = ~np.isnan(values)
+    rounds = np.arange(values.shape[0], dtype=float)[:, np.newaxis]
+    n_rounds = observed.sum(axis=0)
+
+    # Closed form least squares of every column, ignoring the missing rounds
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.where(observed, rounds, 0).sum(axis=0) / n_rounds
+        y_mean = np.where(observed, values, 0).sum(axis=0) / n_rounds
+        x_centered = np.where(observed, rounds - x_mean, 0)
+        y_centered = np.where(observed, values - y_mean, 0)
+        slope = (x_centered * y_centered).sum(axis=0) / (x_centered**2).sum(axis=0)
+    intercept = y_mean - slope * x_mean
+
+    return pd.DataFrame(
+        {
+            "slope": slope,
+            "first": intercept,
+            "last": intercept + slope * (values.shape[0] - 1),
+            "rounds": n_rounds,
+        },
+        index=dimension_means.columns,
+    )
+
+
+def get_level_distribution(
+    level_matrix: pd.DataFrame, normalize: bool = True
+) -> pd.DataFrame:
+    """Return the distribution of the answered levels of the respondents.
+
+    Args:
+        level_matrix (pd.DataFrame): The levels from get_level_matrix
+        normalize (bool, optional): Whether to return the share of the respondents
+            instead of their number. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The number or share of respondents at each level, indexed by
+            the sprint (in survey order) and the dimension, with one column per
+            level
+    """
+    levels = level_matrix.stack().astype(int).rename("Level")
+    distribution = (
+        levels.groupby(level=["Sprint", "Dimension"], sort=False)
+        .value_counts(normalize=normalize)
+        .unstack(fill_value=0)
+        .sort_index(axis=1)
+    )
+    # Rounds and dimensions without any answers are kept as empty rows
+    full_index = pd.MultiIndex.from_product(
+        [level_matrix.index.unique(level="Sprint"), level_matrix.columns],
+        names=["Sprint", "Dimension"],
+    )
+    return distribution.reindex(full_index, fill_value=0)
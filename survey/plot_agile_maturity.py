@@ -1,48 +1,29 @@
 """Script for plotting agile maturity."""
 
 import argparse
-import re
 from pathlib import Path
-
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Iterable
 
 from burndown.excel_io import read_sheet
-from survey.plots import plot_agile_maturity
-
+from burndown.profiling import add_profile_argument, profiled, profiling
 
-def extract_float_from_level_str(string: str) -> float:
-    r"""Extract float from strings on the form LEVEL \d.*.
-
-    Args:
-        string (str): String to extract float from
+if TYPE_CHECKING:
+    import pandas as pd
 
-    Returns:
-        np.float: Float returned
-    """
-    search_obj = re.search(r"LEVEL (\d)", string)
-    if search_obj is not None:
-        result = float(search_obj.group(1))
-    else:
-        result = np.nan
-    return result
 
+def get_columns_map(columns: Iterable[str]) -> Dict[str, str]:
+    """Map the columns of the survey to the dimensions they assess.
 
-def get_agile_maturity(sheet_path: Path) -> pd.DataFrame:
-    """Return the agile maturity data frame
+    The dimension of a column is given by its upper case words.
 
     Args:
-        sheet_path (Path): Path to the sheet containing the agile maturity
+        columns (Iterable[str]): The columns of the survey
 
     Returns:
-        pd.DataFrame: The agile maturity data frame
+        Dict[str, str]: The dimension of each column which assesses a dimension
     """
-    raw_dfs = read_sheet(sheet_path)
-
-    # Get the columns of the first df
-    all_columns = raw_dfs[list(raw_dfs.keys())[0]].columns
     columns_map = {}
-    for original_column in all_columns:
+    for original_column in columns:
         column = original_column.replace(":", "")
         words = column.split(" ")
         dimension = []
@@ -54,23 +35,59 @@ def get_agile_maturity(sheet_path: Path) -> pd.DataFrame:
 
         if len(dimension) != 0:
             columns_map[original_column] = " ".join(dimension).capitalize()
+    return columns_map
 
-    # Initialize the dict to create the df from
-    agile_dict = {"Sprint": []}
-    for _, dimension in columns_map.items():
-        agile_dict[dimension] = []
-
-    # Populate the agile_dict
-    for sprint_name, raw_df in raw_dfs.items():
-        agile_dict["Sprint"].append(sprint_name)
-        for original_column, dimension in columns_map.items():
-            raw_df.loc[:, original_column] = raw_df.loc[:, original_column].apply(
-                extract_float_from_level_str
-            )
-            agile_dict[dimension].append(raw_df.loc[:, original_column].mean())
 
-    agile_maturity_df = pd.DataFrame(agile_dict)
-    agile_maturity_df.set_index("Sprint", inplace=True)
+@profiled("derive")
+def get_level_matrix(raw_dfs: Dict[str, "pd.DataFrame"]) -> "pd.DataFrame":
+    """Return the levels answered by every respondent of every survey round.
+
+    The sheets are concatenated, and the levels of all the answers are extracted
+    in one pass.
+
+    Args:
+        raw_dfs (Dict[str, pd.DataFrame]): The sheets of the survey by sprint
+
+    Returns:
+        pd.DataFrame: The levels indexed by the sprint and respondent, with one
+            column per dimension
+    """
+    import pandas as pd
+
+    # The columns of the first sheet define the dimensions of all the sheets
+    columns_map = get_columns_map(raw_dfs[list(raw_dfs.keys())[0]].columns)
+    answers = pd.concat(
+        [raw_df.loc[:, list(columns_map.keys())] for raw_df in raw_dfs.values()],
+        keys=list(raw_dfs.keys()),
+        names=["Sprint", "Respondent"],
+    )
+    levels = (
+        answers.stack(dropna=False)
+        .astype(str)
+        .str.extract(r"LEVEL (\d)", expand=False)
+        .astype(float)
+        .unstack()
+    )
+    # Keep the order of the respondents and columns (unstack sorts them)
+    levels = levels.reindex(index=answers.index, columns=list(columns_map.keys()))
+    levels.columns = pd.Index(list(columns_map.values()), name="Dimension")
+    return levels
+
+
+def get_agile_maturity(sheet_path: Path) -> "pd.DataFrame":
+    """Return the agile maturity data frame
+
+    Args:
+        sheet_path (Path): Path to the sheet containing the agile maturity
+
+    Returns:
+        pd.DataFrame: The agile maturity data frame
+    """
+    from survey.analytics import get_dimension_means
+
+    level_matrix = get_level_matrix(read_sheet(sheet_path))
+    agile_maturity_df = get_dimension_means(level_matrix)
+    agile_maturity_df.columns.name = None
     return agile_maturity_df
 
 
@@ -82,12 +99,31 @@ def main() -> None:
 
     charts_dir.mkdir(parents=True, exist_ok=True)
 
-    argparse.ArgumentParser(description="Plot the agile maturity.")
-
-    sheet_path = sheet_dir.joinpath("agile_maturity.xlsx")
-    agile_maturity_df = get_agile_maturity(sheet_path=sheet_path)
-
-    plot_agile_maturity(agile_maturity_df=agile_maturity_df, save_dir=charts_dir)
+    parser = argparse.ArgumentParser(description="Plot the agile maturity.")
+    parser.add_argument(
+        "-o",
+        "--overlay",
+        action="store_true",
+        help="Overlay all the survey rounds on one radar instead of one radar per "
+        "round and the trends of the dimensions",
+    )
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiling(args.profile, args.profile_memory):
+        from survey.plots import plot_agile_maturity, plot_agile_maturity_trends
+
+        sheet_path = sheet_dir.joinpath("agile_maturity.xlsx")
+        agile_maturity_df = get_agile_maturity(sheet_path=sheet_path)
+
+        if args.overlay:
+            plot_agile_maturity(
+                agile_maturity_df=agile_maturity_df, save_dir=charts_dir
+            )
+        else:
+            plot_agile_maturity_trends(
+                dimension_means=agile_maturity_df, save_dir=charts_dir
+            )
 
 
 if __name__ == "__main__":
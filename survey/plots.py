@@ -1,12 +1,17 @@
 """Module containing survey plots."""
 
+import math
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from burndown.profiling import profiled, span
+from survey.analytics import get_dimension_trends
 
+
+@profiled("plot")
 def plot_agile_maturity(
     agile_maturity_df: pd.DataFrame,
     save_dir: Path,
@@ -57,4 +62,85 @@ def plot_agile_maturity(
         f"{pd.to_datetime('today').date()}-agile_assessment.png"
     )
     print(f"Saving image to: {save_path}")
-    plt.savefig(str(save_path), dpi=300, transparent=False)
+    with span("save", "save", path=save_path.name):
+        plt.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close()
+
+
+@profiled("plot")
+def plot_agile_maturity_trends(
+    dimension_means: pd.DataFrame,
+    save_dir: Path,
+    n_columns: int = 4,
+) -> None:
+    """Plot and save one radar per survey round and the trend of each dimension.
+
+    Each radar shows the previous round dashed for comparison, and the line chart
+    below the radars shows the mean level of each dimension over the rounds.
+
+    Args:
+        dimension_means (pd.DataFrame): The mean levels from get_dimension_means
+        save_dir (Path): Directory to store the plot to
+        n_columns (int, optional): Maximum number of radars per row. Defaults to 4.
+    """
+    plt.style.use("ggplot")
+
+    dimensions = list(dimension_means.columns)
+    sprint_names = list(dimension_means.index)
+    n_columns = max(1, min(n_columns, len(sprint_names)))
+    n_rows = math.ceil(len(sprint_names) / n_columns)
+
+    # The angles are shared by all the radars, with the first repeated to close them
+    angles = np.linspace(0, 2 * np.pi, len(dimensions), endpoint=False)
+    angles = np.append(angles, angles[0])
+    values = dimension_means.to_numpy(dtype=float)
+    values = np.concatenate([values, values[:, :1]], axis=1)
+
+    fig = plt.figure(figsize=(3 * n_columns, 3 * n_rows + 4))
+    grid = fig.add_gridspec(n_rows + 1, n_columns, height_ratios=[3] * n_rows + [4])
+    for index, sprint_name in enumerate(sprint_names):
+        axis = fig.add_subplot(
+            grid[index // n_columns, index % n_columns], projection="polar"
+        )
+        if index != 0:
+            axis.plot(
+                angles,
+                values[index - 1],
+                color="grey",
+                linewidth=1,
+                linestyle="dashed",
+            )
+        axis.plot(angles, values[index], color="C0", linewidth=1, linestyle="solid")
+        axis.fill(angles, values[index], color="C0", alpha=0.1)
+        axis.set_ylim(0, 5)
+        axis.set_yticks(list(range(6)))
+        axis.set_yticklabels([])
+        axis.set_xticks(angles[:-1])
+        axis.set_xticklabels(dimensions, fontsize="x-small")
+        axis.set_title(sprint_name, fontsize="small")
+
+    trends = get_dimension_trends(dimension_means)
+    trend_axis = fig.add_subplot(grid[n_rows, :])
+    for dimension in dimensions:
+        trend_axis.plot(
+            range(len(sprint_names)),
+            dimension_means.loc[:, dimension],
+            marker="o",
+            label=f"{dimension} ({trends.loc[dimension, 'slope']:+.2f} per round)",
+        )
+    trend_axis.set_xticks(range(len(sprint_names)))
+    trend_axis.set_xticklabels(sprint_names, rotation=45, ha="right")
+    trend_axis.set_ylim(0, 5)
+    trend_axis.set_ylabel("Mean level")
+    trend_axis.legend(loc="lower left", fontsize="small")
+    fig.suptitle("Agile maturity assessment")
+
+    # Save
+    fig.tight_layout()
+    save_path = save_dir.joinpath(
+        f"{pd.to_datetime('today').date()}-agile_assessment_trends.png"
+    )
+    print(f"Saving image to: {save_path}")
+    with span("save", "save", path=save_path.name):
+        fig.savefig(str(save_path), dpi=300, transparent=False)
+    plt.close(fig)
@@ -0,0 +1,51 @@
+"""Fixtures shared by the tests"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmark.generate import FixtureConfig, generate_fixtures
+from burndown.sprint_tasks import SprintTasks
+
+
+@pytest.fixture
+def fixture_config() -> FixtureConfig:
+    """Return the configuration of the generated spreadsheets.
+
+    Tests override it with pytest.mark.parametrize("fixture_config", [...]).
+
+    Returns:
+        FixtureConfig: The configuration of the fixtures
+    """
+    # The rolling average of the total burn requires five sprints
+    return FixtureConfig(n_releases=1, n_sprints=5, n_tasks=20)
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, fixture_config: FixtureConfig) -> Path:
+    """Generate the spreadsheets in a temporary directory.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+        fixture_config (FixtureConfig): The configuration of the fixtures
+
+    Returns:
+        Path: The directory containing the spreadsheets
+    """
+    generate_fixtures(tmp_path, fixture_config)
+    return tmp_path
+
+
+@pytest.fixture
+def sprint_tasks(data_dir: Path) -> SprintTasks:
+    """Load the generated spreadsheets.
+
+    Args:
+        data_dir (Path): The directory containing the spreadsheets
+
+    Returns:
+        SprintTasks: The sprint tasks of the spreadsheets
+    """
+    return SprintTasks(
+        data_dir.joinpath("sprint_tasks.xlsx"), data_dir.joinpath("burndown.xlsx")
+    )
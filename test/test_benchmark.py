@@ -0,0 +1,210 @@
+"""Test the synthetic spreadsheets and the benchmarks"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmark.generate import FIXTURE_SIZES, FixtureConfig, get_sprint_names
+from benchmark.regression import (
+    STARTUP_BUDGETS,
+    Thresholds,
+    compare,
+    format_comparisons,
+    load_baseline,
+    save_baseline,
+)
+from benchmark.suite import (
+    Benchmark,
+    Measurement,
+    get_benchmarks,
+    get_startup_benchmarks,
+    measure,
+    run_benchmarks,
+)
+from burndown.sprint_tasks import SprintTasks
+from survey.plot_agile_maturity import get_agile_maturity
+
+
+@pytest.mark.parametrize(
+    "fixture_config",
+    [FixtureConfig(n_releases=2, n_sprints=3, n_tasks=30, n_categories=10)],
+)
+def test_generate_fixtures(
+    data_dir: Path, fixture_config: FixtureConfig, sprint_tasks: SprintTasks
+) -> None:
+    """Test that the generated spreadsheets can be loaded.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        fixture_config (FixtureConfig): The configuration of the spreadsheets
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    config = fixture_config
+    sprint_names = get_sprint_names(config)
+    assert list(sprint_tasks.sprint_tasks_sheets.keys()) == sprint_names
+    # The sum row is dropped
+    assert all(
+        len(sheet) == config.n_tasks
+        for sheet in sprint_tasks.sprint_tasks_sheets.values()
+    )
+    assert sprint_tasks.get_burn_categories().shape[1] <= config.n_categories + 1
+    total_burn = sprint_tasks.get_total_burn()
+    assert (total_burn.loc[:, "person_days"] > 0).all()
+    # The sprints follow each other
+    start_dates = sprint_tasks.get_sprint_start_dates()
+    assert start_dates.is_monotonic_increasing
+
+    agile_maturity = get_agile_maturity(data_dir.joinpath("agile_maturity.xlsx"))
+    assert list(agile_maturity.index) == sprint_names
+    assert agile_maturity.shape[1] == config.n_dimensions
+
+
+def test_measure() -> None:
+    """Test that the timings and peak memory of a benchmark are measured."""
+    benchmark = Benchmark("allocate", lambda: bytearray(2**22), 4, "MiB")
+    measurement = measure(benchmark, "tiny", repeats=2)
+
+    assert len(measurement.timings) == 2
+    assert measurement.peak_memory >= 2**22
+    assert measurement.throughput == 4 / measurement.best
+
+
+def test_run_benchmarks(
+    tmp_path: Path, data_dir: Path, fixture_config: FixtureConfig
+) -> None:
+    """Test that the benchmarks are run on generated spreadsheets.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+        data_dir (Path): Directory containing generated spreadsheets
+        fixture_config (FixtureConfig): The configuration of the spreadsheets
+    """
+    measurements = run_benchmarks(
+        ["tiny"],
+        repeats=1,
+        name_filters=["SprintTasks.get_"],
+        configs={"tiny": fixture_config},
+    )
+
+    expected_names = [
+        benchmark.name
+        for benchmark in get_benchmarks(data_dir, tmp_path)
+        if "SprintTasks.get_" in benchmark.name
+    ]
+    assert len(expected_names) > 0
+    assert [measurement.name for measurement in measurements] == expected_names
+    assert all(measurement.size == "tiny" for measurement in measurements)
+    assert all(len(measurement.timings) == 1 for measurement in measurements)
+
+
+def test_startup_benchmarks(data_dir: Path) -> None:
+    """Test that the startup benchmarks run and all have a budget.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+    """
+    benchmarks = get_startup_benchmarks(data_dir)
+
+    assert [benchmark.name for benchmark in benchmarks] == list(STARTUP_BUDGETS.keys())
+    for benchmark in benchmarks:
+        assert len(measure(benchmark, "tiny", repeats=1).timings) == 1
+
+
+def create_measurement(
+    name: str, timings: tuple, peak_memory: int = 2**20
+) -> Measurement:
+    """Create a measurement of the small size.
+
+    Args:
+        name (str): Name of the benchmark
+        timings (tuple): The timings in seconds
+        peak_memory (int, optional): The peak memory in bytes. Defaults to 2**20.
+
+    Returns:
+        Measurement: The measurement
+    """
+    return Measurement("small", name, 10, "tasks", timings, peak_memory)
+
+
+def test_compare() -> None:
+    """Test that only changes beyond the noise and tolerances are flagged."""
+    baseline = [
+        create_measurement("stable", (1.0, 1.01, 0.99)),
+        create_measurement("slower", (1.0, 1.01, 0.99)),
+        create_measurement("noisy", (1.0, 1.5, 0.6)),
+        create_measurement("outlier", (1.0, 1.01, 0.99)),
+        create_measurement("memory", (1.0, 1.01, 0.99), peak_memory=10 * 2**20),
+        create_measurement("faster", (1.0, 1.01, 0.99)),
+        create_measurement("removed", (1.0,)),
+    ]
+    current = [
+        create_measurement("stable", (1.05, 1.04, 1.06)),
+        create_measurement("slower", (1.3, 1.31, 1.29)),
+        create_measurement("noisy", (1.3, 1.8, 0.9)),
+        # Two slow runs do not count when the best run is as fast as before
+        create_measurement("outlier", (1.0, 1.5, 1.6)),
+        create_measurement("memory", (1.0, 1.01, 0.99), peak_memory=12 * 2**20),
+        create_measurement("faster", (0.5, 0.51, 0.49)),
+        create_measurement("added", (1.0,)),
+    ]
+    comparisons = compare(baseline, current, Thresholds())
+    statuses = {comparison.name: comparison.status for comparison in comparisons}
+
+    assert statuses == {
+        "stable": "ok",
+        "slower": "slower",
+        "noisy": "ok",
+        "outlier": "ok",
+        "memory": "more memory",
+        "faster": "faster",
+        "added": "new",
+        "removed": "missing",
+    }
+    regressions = [
+        comparison.name for comparison in comparisons if comparison.is_regression
+    ]
+    assert regressions == ["slower", "memory"]
+    table = format_comparisons(comparisons)
+    assert "SLOWER" in table and "+30.0%" in table
+
+
+def test_compare_budgets() -> None:
+    """Test that a benchmark over its budget regresses even without a change."""
+    baseline = [
+        create_measurement("startup", (0.6, 0.61)),
+        create_measurement("within", (0.2, 0.21)),
+    ]
+    current = [
+        create_measurement("startup", (0.6, 0.61)),
+        create_measurement("within", (0.2, 0.21)),
+        create_measurement("new startup", (0.6, 0.61)),
+    ]
+    budgets = {"startup": 0.5, "within": 0.5, "new startup": 0.5}
+    comparisons = compare(baseline, current, budgets=budgets)
+    statuses = {comparison.name: comparison.status for comparison in comparisons}
+
+    assert statuses == {
+        "startup": "over budget",
+        "within": "ok",
+        "new startup": "over budget",
+    }
+    regressions = [
+        comparison.name for comparison in comparisons if comparison.is_regression
+    ]
+    assert regressions == ["startup", "new startup"]
+
+
+def test_baseline(tmp_path: Path) -> None:
+    """Test that the baseline is saved, loaded and checked for its version."""
+    measurements = [create_measurement("stable", (1.0, 1.01, 0.99))]
+    path = tmp_path.joinpath("baseline.json")
+    save_baseline(measurements, path)
+
+    baseline = load_baseline(path)
+    assert baseline["measurements"] == measurements
+    assert baseline["configs"]["small"] == FIXTURE_SIZES["small"]._asdict()
+
+    path.write_text(json.dumps({**json.loads(path.read_text()), "version": 0}))
+    with pytest.raises(ValueError, match="version"):
+        load_baseline(path)
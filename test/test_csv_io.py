@@ -0,0 +1,90 @@
+"""Test the loading of the sprint tasks from CSV exports"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from burndown.csv_io import read_sprint_tasks_csv
+from burndown.sprint_tasks import (
+    SPRINT_TASKS_COLUMNS,
+    find_sprint_tasks_path,
+    read_sprint_tasks_sheets,
+)
+
+CSV_HEADER = (
+    "sprint,Date Closed,Original estimate,Points,Created,category,burned,creep,"
+    "creep_category,creep_date\n"
+)
+CSV_ROWS = [
+    "2.0-1,2022-01-04 13:10,3,3,2021-12-20,Feature,3,,,\n",
+    "2.0-1,,2,2,2021-12-21,Bug,0,2,Unplanned,2022-01-05 08:00\n",
+    "2.0-2,2022-01-18,5,5,2022-01-10,Support,5,,,\n",
+    "2.0-1,,1,1,2021-12-22,Tech debt,0,,,\n",
+]
+
+
+def test_read_sprint_tasks_csv(tmp_path: Path) -> None:
+    """Test that one CSV is split into sprints with the dtypes of the spreadsheets.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    csv_path = tmp_path.joinpath("sprint_tasks.csv")
+    csv_path.write_text(CSV_HEADER + "".join(CSV_ROWS))
+
+    sheets = read_sprint_tasks_sheets(csv_path)
+
+    assert list(sheets.keys()) == ["2.0-1", "2.0-2"]
+    sprint_df = sheets["2.0-1"]
+    assert set(sprint_df.columns) == set(SPRINT_TASKS_COLUMNS)
+    assert len(sprint_df) == 3
+    assert sprint_df.loc[:, "Date Closed"].dtype == "datetime64[ns]"
+    assert sprint_df.loc[:, "creep_date"].dtype == "datetime64[ns]"
+    assert sprint_df.loc[:, "Points"].dtype == "float64"
+    assert sprint_df.loc[1, "creep_date"] == pd.Timestamp("2022-01-05 08:00")
+
+    # Chunks without any dates must not change the dtypes
+    chunked_sheets = read_sprint_tasks_csv(csv_path, SPRINT_TASKS_COLUMNS, chunksize=1)
+    for sprint_name, sprint_df in sheets.items():
+        pd.testing.assert_frame_equal(chunked_sheets[sprint_name], sprint_df)
+
+
+def test_read_sprint_tasks_csv_dir(tmp_path: Path) -> None:
+    """Test that a directory with one CSV per sprint gives the same sheets.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    csv_path = tmp_path.joinpath("sprint_tasks.csv")
+    csv_path.write_text(CSV_HEADER + "".join(CSV_ROWS))
+    csv_dir = tmp_path.joinpath("sprint_tasks")
+    csv_dir.mkdir()
+    for sprint_name in ("2.0-1", "2.0-2"):
+        csv_dir.joinpath(f"{sprint_name}.csv").write_text(
+            CSV_HEADER.split(",", 1)[1]
+            + "".join(
+                row.split(",", 1)[1] for row in CSV_ROWS if row.startswith(sprint_name)
+            )
+        )
+
+    sheets = read_sprint_tasks_sheets(csv_path)
+    dir_sheets = read_sprint_tasks_sheets(csv_dir)
+
+    assert dir_sheets.keys() == sheets.keys()
+    for sprint_name, sprint_df in sheets.items():
+        pd.testing.assert_frame_equal(dir_sheets[sprint_name], sprint_df)
+
+
+def test_find_sprint_tasks_path(tmp_path: Path) -> None:
+    """Test that the spreadsheet is preferred over the CSV exports.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    assert find_sprint_tasks_path(tmp_path) == tmp_path.joinpath("sprint_tasks.xlsx")
+    tmp_path.joinpath("sprint_tasks").mkdir()
+    assert find_sprint_tasks_path(tmp_path) == tmp_path.joinpath("sprint_tasks")
+    tmp_path.joinpath("sprint_tasks.csv").write_text(CSV_HEADER)
+    assert find_sprint_tasks_path(tmp_path) == tmp_path.joinpath("sprint_tasks.csv")
+    tmp_path.joinpath("sprint_tasks.xlsx").touch()
+    assert find_sprint_tasks_path(tmp_path) == tmp_path.joinpath("sprint_tasks.xlsx")
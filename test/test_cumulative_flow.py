@@ -0,0 +1,81 @@
+"""Test the cumulative flow of the tasks"""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.cumulative_flow import FLOW_STATES, get_cumulative_flow
+from burndown.plots import plot_cumulative_flow
+from burndown.sprint_dates import SprintDates
+from burndown.sprint_tasks import SprintTasks
+
+
+def test_get_cumulative_flow() -> None:
+    """Test the states of hand made tasks on each day."""
+    dates = pd.date_range("2023-01-02", "2023-01-06")
+    created = pd.to_datetime(
+        pd.Series(["2022-12-20", "2023-01-03", None, "2023-01-02"])
+    )
+    entered = pd.to_datetime(
+        pd.Series(["2023-01-02", "2023-01-04", "2023-01-05", "2023-01-02"])
+    )
+    # The last task was closed before it entered and the third after the last day
+    closed = pd.to_datetime(pd.Series(["2023-01-03", None, "2023-01-09", "2023-01-01"]))
+    is_creep = pd.Series([False, True, True, False])
+    values = pd.Series([1.0, 2.0, 4.0, 8.0])
+
+    flow_df = get_cumulative_flow(created, entered, closed, is_creep, values, dates)
+    assert list(flow_df.columns) == list(FLOW_STATES)
+    expected = np.array(
+        [
+            # closed, creep, in_sprint, backlog
+            [8, 0, 1, 0],
+            [9, 0, 0, 2],
+            [9, 2, 0, 0],
+            [9, 6, 0, 0],
+            [9, 6, 0, 0],
+        ]
+    )
+    np.testing.assert_allclose(flow_df.to_numpy(), expected)
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=2, n_tasks=20)]
+)
+def test_sprint_tasks_cumulative_flow(
+    tmp_path: Path, sprint_tasks: SprintTasks
+) -> None:
+    """Test the cumulative flow of generated spreadsheets and its plot.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    sprint_names = list(sprint_tasks.sprint_tasks_sheets.keys())
+    flow_df = sprint_tasks.get_cumulative_flow(sprint_names)
+
+    sprint_tasks_df = pd.concat(sprint_tasks.sprint_tasks_sheets.values())
+    assert flow_df.index[0] == sprint_tasks.burndown_sheets[sprint_names[0]].index[0]
+    assert (flow_df.to_numpy() >= 0).all()
+    # Every task is counted in one of the states once it is created
+    total_points = sprint_tasks_df.loc[:, "Points"].fillna(0).sum()
+    assert np.isclose(flow_df.iloc[-1].sum(), total_points)
+    assert (flow_df.sum(axis=1).diff().dropna() >= 0).all()
+    closed_points = sprint_tasks_df.loc[
+        sprint_tasks_df.loc[:, "Date Closed"] <= flow_df.index[-1], "Points"
+    ].sum()
+    assert np.isclose(flow_df.iloc[-1].loc["closed"], closed_points)
+
+    n_tasks = sprint_tasks.get_cumulative_flow(sprint_names[:1], points=False)
+    assert n_tasks.iloc[-1].sum() == len(
+        sprint_tasks.sprint_tasks_sheets[sprint_names[0]]
+    )
+
+    sprint_dates = SprintDates(flow_df.index[0], len(flow_df.index))
+    plot_cumulative_flow(flow_df, sprint_dates, tmp_path, "2.0")
+    assert len(list(tmp_path.glob("*-cumulative_flow-2.0.png"))) == 1
+    assert plt.get_fignums() == []
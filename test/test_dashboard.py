@@ -0,0 +1,60 @@
+"""Test the HTML dashboard"""
+
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from burndown.dashboard import get_dashboard_data, render_dashboard
+from burndown.sprint_tasks import SprintTasks
+
+
+def test_dashboard(sprint_tasks: SprintTasks) -> None:
+    """Test that the embedded data indexes the shared dates and categories.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    # The data cannot close the script tag it is embedded in
+    sprint_name = list(sprint_tasks.sprint_tasks_sheets.keys())[0]
+    sprint_tasks.sprint_tasks_sheets[sprint_name]["category"] = "</script>"
+    html = render_dashboard(get_dashboard_data(sprint_tasks))
+    match = re.search(
+        r'<script type="application/json" id="dashboard-data">(.*?)</script>',
+        html,
+        re.DOTALL,
+    )
+    assert match is not None
+    data = json.loads(match.group(1))
+    assert "</script>" in data["burn_categories"]
+
+    dates = pd.date_range(data["first_date"], periods=data["n_dates"])
+    assert [sprint["name"] for sprint in data["sprints"]] == list(
+        sprint_tasks.get_sprint_start_dates().sort_values().index
+    )
+    burn_categories = sprint_tasks.get_burn_categories()
+    creep_categories = sprint_tasks.get_creep_categories()
+    for sprint in data["sprints"]:
+        burndown_df = sprint_tasks.burndown_sheets[sprint["name"]]
+        sprint_dates = dates[sprint["start"] : sprint["start"] + len(sprint["ideal"])]
+        assert (sprint_dates == burndown_df.index).all()
+        # The values are rounded to two decimals
+        np.testing.assert_allclose(
+            sprint["ideal"], burndown_df.loc[:, "ideal_burndown"], atol=0.005
+        )
+        assert len(sprint["remaining"]) == len(sprint_dates)
+
+        for categories, names, key in (
+            (burn_categories, data["burn_categories"], "burn_categories"),
+            (creep_categories, data["creep_categories"], "creep_categories"),
+        ):
+            np.testing.assert_allclose(
+                sprint[key],
+                categories.loc[sprint["name"], names].astype(float),
+                atol=0.005,
+            )
+        daily_creep = sprint_tasks.get_daily_creep(sprint["name"])
+        for index, values in sprint["daily_creep"].items():
+            category = data["creep_categories"][int(index)]
+            np.testing.assert_allclose(values, daily_creep[category], atol=0.005)
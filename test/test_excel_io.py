@@ -0,0 +1,78 @@
+"""Test the bulk update of the burndown sheets"""
+
+import io
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from burndown.burndown import read_remaining_records
+from burndown.excel_io import save_indexed_values
+
+
+def test_read_remaining_records() -> None:
+    """Test that the records are grouped by sheet, and the last record is kept."""
+    records_file = io.StringIO(
+        "sprint,date,remaining\n"
+        "2.0-1,2022-01-04,20\n"
+        ",2022-01-04,7.5\n"
+        "2.0-1,2022-01-04,18\n"
+        "2.0-2,2022-01-17,30\n"
+    )
+    sheet_records = read_remaining_records(records_file, default_sheet_name="2.0-3")
+
+    assert sheet_records == {
+        "2.0-1": {datetime(2022, 1, 4): 18.0},
+        "2.0-3": {datetime(2022, 1, 4): 7.5},
+        "2.0-2": {datetime(2022, 1, 17): 30.0},
+    }
+
+    with pytest.raises(ValueError, match="Line 2"):
+        read_remaining_records(io.StringIO("date,remaining\n2022-13-01,1\n"))
+
+
+def test_save_indexed_values(tmp_path: Path) -> None:
+    """Test that the values are stored to several sheets with one write.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    sheet_path = tmp_path.joinpath("burndown.xlsx")
+    workbook = openpyxl.Workbook()
+    for sheet_index, sheet_name in enumerate(("2.0-1", "2.0-2")):
+        sheet = (
+            workbook.active if sheet_index == 0 else workbook.create_sheet(sheet_name)
+        )
+        sheet.title = sheet_name
+        sheet.append(["date", "ideal_burndown", "remaining"])
+        sheet.append([datetime(2022, 1, 3 + 14 * sheet_index), 30, 30])
+    workbook.save(sheet_path)
+
+    # Nothing is written when one of the sheets is missing
+    with pytest.raises(ValueError, match="2.0-3"):
+        save_indexed_values(
+            sheet_path, "remaining", {"2.0-1": {datetime(2022, 1, 3): 1}, "2.0-3": {}}
+        )
+    assert openpyxl.load_workbook(sheet_path)["2.0-1"]["C2"].value == 30
+
+    sheet_names = save_indexed_values(
+        sheet_path,
+        "remaining",
+        {
+            "2.0-2": {datetime(2022, 1, 17): 25, datetime(2022, 1, 18): 20},
+            None: {datetime(2022, 1, 4): 28},
+        },
+    )
+
+    assert sheet_names == ["2.0-2", "2.0-1"]
+    workbook = openpyxl.load_workbook(sheet_path)
+    assert list(workbook["2.0-1"].iter_rows(min_row=2, values_only=True)) == [
+        (datetime(2022, 1, 3), 30, 30),
+        (datetime(2022, 1, 4), None, 28),
+    ]
+    assert [row[2] for row in workbook["2.0-2"].iter_rows(values_only=True)] == [
+        "remaining",
+        25,
+        20,
+    ]
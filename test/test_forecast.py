@@ -0,0 +1,116 @@
+"""Test the Monte Carlo forecast of a release"""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.forecast import (
+    forecast_release,
+    forecast_sprint_tasks,
+    get_completion_percentiles,
+    get_completion_sprints,
+    simulate_remaining,
+)
+from burndown.plots import plot_release_forecast
+from burndown.sprint_tasks import SprintTasks
+
+
+def test_simulate_remaining() -> None:
+    """Test the remaining points and completion of the trials."""
+    # Without variation every trial burns 10 points net per sprint
+    remaining = simulate_remaining(
+        35, np.array([1.0, 1.0]), np.array([2.0, 2.0]), np.full(5, 12.0), 100
+    )
+    assert remaining.shape == (100, 5)
+    np.testing.assert_allclose(remaining[0], [25, 15, 5, -5, -15])
+    completion_sprints = get_completion_sprints(remaining)
+    assert (completion_sprints == 4).all()
+    assert list(get_completion_percentiles(completion_sprints, 5)) == [4, 4, 4]
+
+    # Trials not completed within the simulated sprints are counted after them
+    remaining = simulate_remaining(100, np.array([1.0]), np.array([0.0]), [1.0] * 3)
+    assert (get_completion_sprints(remaining) == 4).all()
+
+
+def test_forecast_release() -> None:
+    """Test the percentiles of a forecast with two kinds of sprints."""
+    history = pd.DataFrame(
+        {
+            "burn_per_person_day": [1.0, 2.0],
+            "person_days": [10.0, 10.0],
+            "creep": [0.0, 0.0],
+        }
+    )
+    fan, completion = forecast_release(
+        history, 40, pd.Timestamp("2023-01-02"), 14, n_trials=10_000, seed=0
+    )
+    # The mean capacity of 10 person days burns 10 or 20 points a sprint
+    assert fan.index[1] == pd.Timestamp("2023-01-16")
+    assert fan.iloc[0].tolist() == [40] * 5
+    assert fan.iloc[1].tolist() == [20, 20, 20, 30, 30]
+    assert (fan.diff(axis=1).iloc[:, 1:] >= 0).all(axis=None)
+    # The release is not completed in 3 sprints only if all of them burn 10 points
+    # (1 / 8 of the trials)
+    assert completion.loc[:, "sprints"].tolist() == [3, 3, 4]
+    assert completion.loc[50, "date"] == pd.Timestamp("2023-02-13")
+
+    _, completion = forecast_release(
+        history, 1000, pd.Timestamp("2023-01-02"), 14, n_sprints=4, n_trials=100
+    )
+    assert completion.loc[:, "date"].isna().all()
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=5, n_tasks=10)]
+)
+def test_forecast_sprint_tasks(tmp_path: Path, sprint_tasks: SprintTasks) -> None:
+    """Test the forecast of generated spreadsheets and its fan chart.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    release_burnup_df, fan, completion = forecast_sprint_tasks(
+        sprint_tasks,
+        sprint_tasks.get_total_burn(),
+        sprint_tasks.get_creep_categories(),
+        remaining_points=100,
+        n_trials=1_000,
+        seed=0,
+    )
+    assert release_burnup_df.loc[:, "sprint"].iloc[-1] == "2.0-5"
+    # The forecast starts at the end of the last sprint, one sprint length apart
+    assert fan.index[0] == release_burnup_df.index[-1]
+    assert (fan.index[1:] - fan.index[:-1] == pd.Timedelta(days=14)).all()
+    assert fan.iloc[0, 0] == 100
+
+    plot_release_forecast(release_burnup_df, fan, completion, tmp_path, "2.0")
+    assert len(list(tmp_path.glob("*-release_forecast-2.0.png"))) == 1
+    assert plt.get_fignums() == []
+
+
+def test_forecast_single_sprint(sprint_tasks: SprintTasks) -> None:
+    """Test that the sprint length of a single sprint includes its last day.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    # The total burn requires five sprints, so the history is taken before the
+    # other sprints are removed
+    total_burn = sprint_tasks.get_total_burn()
+    creep_categories = sprint_tasks.get_creep_categories()
+    sprint_tasks.remove_sprints({"2.0-2", "2.0-3", "2.0-4", "2.0-5"})
+    _, fan, _ = forecast_sprint_tasks(
+        sprint_tasks,
+        total_burn,
+        creep_categories,
+        remaining_points=100,
+        n_trials=100,
+        seed=0,
+    )
+    n_days = len(sprint_tasks.burndown_sheets["2.0-1"])
+    assert fan.index[1] - fan.index[0] == pd.Timedelta(days=n_days)
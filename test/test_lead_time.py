@@ -0,0 +1,109 @@
+"""Test the lead times of the tasks"""
+
+import warnings
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.lead_time import get_control_limits, get_lead_time_percentiles
+from burndown.plots import plot_lead_time_control_chart, plot_lead_time_histogram
+from burndown.sprint_dates import count_business_days
+from burndown.sprint_tasks import SprintTasks
+
+
+def test_count_business_days() -> None:
+    """Test that week-ends and days off are not counted."""
+    # 2022-01-03 is a Monday
+    created = pd.Series(
+        pd.to_datetime(["2022-01-03", "2022-01-07", "2022-01-03", None])
+    )
+    closed = pd.Series(pd.to_datetime(["2022-01-03", "2022-01-10", "2022-01-17", None]))
+    lead_time = count_business_days(created, closed)
+    assert lead_time.iloc[:3].tolist() == [0, 1, 10]
+    assert np.isnan(lead_time.iloc[3])
+
+    lead_time = count_business_days(
+        created, closed, days_off=[pd.Timestamp("2022-01-05")]
+    )
+    assert lead_time.iloc[:3].tolist() == [0, 1, 9]
+
+
+def test_lead_time_statistics() -> None:
+    """Test the percentiles and the control limits of the lead times."""
+    lead_times = pd.DataFrame(
+        {
+            "sprint": ["2.0-1", "2.0-1", "2.0-2", "2.0-2"],
+            "category": pd.Categorical(["Bug", "Feature", "Bug", "Bug"]),
+            "Date Closed": pd.to_datetime(
+                ["2022-01-04", "2022-01-03", "2022-01-17", "2022-01-18"]
+            ),
+            "lead_time": [4.0, 2.0, 6.0, 8.0],
+        }
+    )
+    percentiles = get_lead_time_percentiles(lead_times, "category", (50, 100))
+    assert percentiles.loc["Bug"].tolist() == [3, 6, 6, 8]
+    assert percentiles.loc["Feature", "tasks"] == 1
+
+    # The moving ranges of the closed order 2, 4, 6, 8 are all 2
+    limits = get_control_limits(lead_times)
+    assert limits["mean"] == 5
+    assert limits["upper"] == 5 + 2.66 * 2
+    assert limits["lower"] == 0
+
+    # Without closed tasks there are no limits
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        limits = get_control_limits(lead_times.iloc[:0])
+    assert limits.isna().all()
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=2, n_tasks=20)]
+)
+def test_get_lead_times(tmp_path: Path, sprint_tasks: SprintTasks) -> None:
+    """Test the lead times of generated spreadsheets and their plots.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    lead_times = sprint_tasks.get_lead_times()
+
+    n_closed = sum(
+        sheet.loc[:, "Date Closed"].notna().sum()
+        for sheet in sprint_tasks.sprint_tasks_sheets.values()
+    )
+    assert len(lead_times) == n_closed
+    assert set(lead_times.loc[:, "sprint"]) == {"2.0-1", "2.0-2"}
+    assert (lead_times.loc[:, "lead_time"] >= 0).all()
+
+    plot_lead_time_histogram(lead_times, tmp_path)
+    plot_lead_time_control_chart(lead_times, get_control_limits(lead_times), tmp_path)
+    assert len(list(tmp_path.glob("*-lead_time_*.png"))) == 2
+    assert plt.get_fignums() == []
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=2, n_tasks=20)]
+)
+def test_closed_before_created(sprint_tasks: SprintTasks) -> None:
+    """Test that tasks closed before they were created are dropped.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    n_lead_times = len(sprint_tasks.get_lead_times())
+    sprint_tasks_sheet = sprint_tasks.sprint_tasks_sheets["2.0-2"]
+    closed = sprint_tasks_sheet.loc[:, "Date Closed"].notna()
+    sprint_tasks_sheet.loc[closed.idxmax(), "Created"] = sprint_tasks_sheet.loc[
+        :, "Date Closed"
+    ].max() + pd.Timedelta(days=7)
+
+    with pytest.warns(UserWarning, match="Dropping 1 tasks .* 2.0-2"):
+        lead_times = sprint_tasks.get_lead_times()
+    assert len(lead_times) == n_lead_times - 1
+    assert (lead_times.loc[:, "lead_time"] >= 0).all()
@@ -0,0 +1,86 @@
+"""Test the python -m burndown entry point"""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pytest
+
+from burndown.__main__ import main
+from burndown.targets import SharedData, render_target
+
+
+def test_plot_targets(data_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Test that chained targets are plotted from one loaded dataset.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        tmp_path_factory (pytest.TempPathFactory): Factory of temporary directories
+    """
+    charts_dir = tmp_path_factory.mktemp("charts")
+    plt.switch_backend("Agg")
+    main(
+        [
+            "--data_dir",
+            str(data_dir),
+            "--charts_dir",
+            str(charts_dir),
+            "plot",
+            "sprint",
+            "burndown",
+            "double",
+            "release",
+            "sprint",
+            "cumulative_flow",
+            "-r",
+            "2.0",
+            "-s",
+            "2",
+        ]
+    )
+    chart_names = sorted(path.name.split("-", 3)[-1] for path in charts_dir.iterdir())
+    assert chart_names == [
+        "burndown-2.0-2.png",
+        "categories-2.0-2.png",
+        "creep_categories-2.0-2.png",
+        "cumulative_flow-2.0-2.png",
+        "double_burndown-2.0-2.png",
+        "release_burnup-2.0.png",
+        "total_burn_and_creep-2.0-2.png",
+    ]
+    assert plt.get_fignums() == []
+
+
+def test_plot_errors(data_dir: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test that missing arguments and unknown targets are reported.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        capsys (pytest.CaptureFixture): Fixture capturing the usage errors
+    """
+    for argv, message in (
+        (["plot", "trends", "double", "-r", "2.0"], "-s/--sprint_number"),
+        (["plot", "release", "-s", "2"], "-r/--release is required for"),
+        (["plot", "cumulative_flow"], "-r/--release is required for"),
+        (["plot", "gantt"], "invalid choice: 'gantt'"),
+    ):
+        with pytest.raises(SystemExit):
+            main(["--data_dir", str(data_dir), *argv])
+        assert message in capsys.readouterr().err
+
+    with pytest.raises(ValueError, match="Unknown target 'gantt'"):
+        render_target("gantt", SharedData(data_dir), data_dir)
+
+
+def test_shared_data_load(data_dir: Path) -> None:
+    """Test that the shared data loads the sprint tasks once.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+    """
+    data = SharedData(data_dir)
+    assert not data.is_loaded
+
+    sprint_tasks = data.load()
+    assert data.is_loaded
+    assert data.load() is sprint_tasks
+    assert data.sprint_tasks is sprint_tasks
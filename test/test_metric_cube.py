@@ -0,0 +1,56 @@
+"""Test the cube of the daily metrics of all sprints"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.sprint_tasks import SprintTasks
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=3, n_tasks=30)]
+)
+def test_metric_cube(sprint_tasks: SprintTasks) -> None:
+    """Test that slices of the cube equal the metrics computed until a date.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    cube = sprint_tasks.get_metric_cube()
+    assert list(cube.sprint_names) == list(sprint_tasks.sprint_tasks_sheets.keys())
+    assert cube.values.shape[:2] == cube.dates.shape
+
+    for sprint_name in cube.sprint_names:
+        dates = sprint_tasks.burndown_sheets[sprint_name].index
+        for until_date in (dates[0], dates[len(dates) // 2], None):
+            sprint_df = cube.get_sprint(sprint_name, until_date)
+            planning_burn_df = sprint_tasks.get_sprint_planning_burn(
+                sprint_name, until_date
+            )
+            creep_burn_df = sprint_tasks.get_creep_burn(sprint_name, until_date)
+            daily_creep = sprint_tasks.get_daily_creep(sprint_name, until_date)
+
+            assert (sprint_df.index == planning_burn_df.index).all()
+            np.testing.assert_allclose(
+                sprint_df.loc[:, "planning_remaining"],
+                planning_burn_df.loc[:, "remaining"],
+            )
+            np.testing.assert_allclose(
+                sprint_df.loc[:, "creep_remaining"],
+                creep_burn_df.loc[:, "remaining"].astype(float),
+            )
+            for category in cube.metrics[2:]:
+                np.testing.assert_allclose(
+                    sprint_df.loc[:, category], daily_creep.get(category, 0)
+                )
+
+    # A day of all sprints is a slice, and the long table holds every day
+    day_df = cube.get_day(1)
+    assert list(day_df.index) == list(cube.sprint_names)
+    assert day_df.loc[cube.sprint_names[0], "date"] == pd.Timestamp(cube.dates[0, 1])
+    cube_df = cube.to_frame()
+    assert len(cube_df) == sum(
+        len(sheet) for sheet in sprint_tasks.burndown_sheets.values()
+    )
+    assert not cube_df.loc[:, list(cube.metrics)].isna().any(axis=None)
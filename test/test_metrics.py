@@ -0,0 +1,75 @@
+"""Test the export of the metrics"""
+
+import json
+from pathlib import Path
+from typing import Tuple
+
+import pandas as pd
+
+from burndown.metrics import get_metric_group, get_metrics, save_metrics
+
+
+def get_test_frames() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Get the total burn and categories of three sprints in two releases.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: The total burn, burn
+            categories and creep categories
+    """
+    index = pd.Index(["2.0-1", "2.0-2", "2.1-1"], name="Sprint")
+    total_burn = pd.DataFrame(
+        {
+            "total_points": [10.0, 20.0, 30.0],
+            "sprint_start_burned": [5.0, 15.0, 20.0],
+            "sprint_start_points": [10, 20, 40],
+            "person_days": [10, 10, 20],
+            "Release": ["2.0", "2.0", "2.1"],
+        },
+        index=index,
+    )
+    burn_categories = pd.DataFrame(
+        {"Bug": [4.0, 6.0, 10.0], "Feature": [6.0, 14.0, 20.0]}, index=index
+    )
+    burn_categories["Release"] = total_burn["Release"]
+    creep_categories = pd.DataFrame(
+        {"Unplanned": [2.0, 0.0, 3.0], "Re-estimation": [0.0, 2.0, 1.0]}, index=index
+    )
+    creep_categories["Release"] = total_burn["Release"]
+    return total_burn, burn_categories, creep_categories
+
+
+def test_get_metrics() -> None:
+    """Test that the ratios are computed from the sums of the releases."""
+    metrics = get_metrics(*get_test_frames())
+    totals = get_metric_group(metrics, "total")
+
+    assert list(metrics.index) == ["2.0", "2.1"]
+    assert list(totals.loc[:, "burned"]) == [30.0, 30.0]
+    assert list(totals.loc[:, "achievement"]) == [100 * 20 / 30, 50.0]
+    assert list(totals.loc[:, "burn_per_person_day"]) == [1.5, 1.5]
+    assert list(get_metric_group(metrics, "creep_percentage").loc["2.0"]) == [
+        50.0,
+        50.0,
+    ]
+
+    sprint_metrics = get_metrics(*get_test_frames(), by="sprint")
+    assert list(sprint_metrics.index) == ["2.0-1", "2.0-2", "2.1-1"]
+    assert sprint_metrics.loc["2.0-1", "burned_percentage.Bug"] == 40.0
+
+
+def test_save_metrics(tmp_path: Path) -> None:
+    """Test that the metrics can be read back from JSON and CSV.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    metrics = get_metrics(*get_test_frames())
+    save_metrics(metrics, tmp_path.joinpath("metrics.json"))
+    save_metrics(metrics, tmp_path.joinpath("metrics.csv"))
+
+    json_metrics = json.loads(tmp_path.joinpath("metrics.json").read_text())
+    assert json_metrics["2.1"]["total.achievement"] == 50.0
+    csv_metrics = pd.read_csv(tmp_path.joinpath("metrics.csv"), dtype={"Release": str})
+    pd.testing.assert_frame_equal(
+        csv_metrics.set_index("Release"), metrics, check_names=False
+    )
@@ -7,7 +7,7 @@ import pandas as pd
 
 from burndown.burndown import get_ideal_burndown
 from burndown.excel_io import read_sheet, save_sheet
-from burndown.plots import plot_burndown
+from burndown.plots import get_stack_bottoms, plot_burndown
 from burndown.sprint_dates import SprintDates
 
 
@@ -68,5 +68,12 @@ def test_burndown(tmp_path: Path) -> None:
     assert len(list(save_path.glob("*.png"))) == 1
 
 
+def test_get_stack_bottoms() -> None:
+    """Test that positive and negative values are stacked apart."""
+    values = np.array([[1.0, -2.0, 3.0], [0.0, 2.0, -1.0]])
+    expected = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+    assert np.allclose(get_stack_bottoms(values), expected)
+
+
 if __name__ == "__main__":
     test_burndown()
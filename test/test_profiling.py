@@ -0,0 +1,111 @@
+"""Test the profiling of the stages of a run"""
+
+import json
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from burndown.excel_io import read_sheet
+from burndown.profiling import get_profiler, profiled, profiling, span, track_frame
+
+
+@profiled("derive")
+def derive(seconds: float) -> float:
+    """Sleep to be profiled.
+
+    Args:
+        seconds (float): Seconds to sleep
+
+    Returns:
+        float: The seconds slept
+    """
+    time.sleep(seconds)
+    return seconds
+
+
+def test_profiling(tmp_path: Path) -> None:
+    """Test that the spans are nested, saved as a trace and summarized.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    # Nothing is recorded when profiling is disabled
+    with span("disabled"):
+        assert derive(0) == 0
+    assert get_profiler() is None
+
+    trace_path = tmp_path.joinpath("trace.json")
+    with profiling(trace_path):
+        profiler = get_profiler()
+        with span("load", "load", sheet="2.0-1"):
+            derive(0.02)
+            derive(0.01)
+    assert get_profiler() is None
+
+    summary = {entry["name"]: entry for entry in profiler.get_summary()}
+    assert set(summary.keys()) == {"run", "load", "derive"}
+    assert summary["derive"]["calls"] == 2
+    # The self time of a span excludes the time of its children
+    assert summary["load"]["total"] >= 0.03
+    assert summary["load"]["self"] < summary["load"]["total"] - 0.025
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    load_event = next(event for event in events if event["name"] == "load")
+    assert load_event["ph"] == "X"
+    assert load_event["cat"] == "load"
+    assert load_event["args"] == {"sheet": "2.0-1"}
+    assert load_event["dur"] >= 30_000
+
+
+def test_read_sheet_spans(tmp_path: Path) -> None:
+    """Test that every sheet of a workbook is parsed in its own span.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    path = tmp_path.joinpath("burndown.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        for sheet_name in ("2.0-1", "2.0-2"):
+            pd.DataFrame({"remaining": [1, 2]}).to_excel(writer, sheet_name=sheet_name)
+
+    with profiling(tmp_path.joinpath("trace.json")):
+        profiler = get_profiler()
+        sheets = read_sheet(path)
+        sheet = read_sheet(path, "2.0-2", index_col=0)
+
+    assert list(sheets.keys()) == ["2.0-1", "2.0-2"]
+    assert list(sheet.loc[:, "remaining"]) == [1, 2]
+    parsed_sheets = [
+        span.args["sheet"]
+        for span in profiler.spans
+        if span.name == "parse burndown.xlsx"
+    ]
+    assert parsed_sheets == ["2.0-1", "2.0-2", "2.0-2"]
+
+
+def test_profiling_memory() -> None:
+    """Test that the peak and retained memory of the spans are recorded."""
+    with profiling(None):
+        assert get_profiler() is None
+
+    with profiling(None, memory=True):
+        profiler = get_profiler()
+        with span("load"):
+            with span("allocate"):
+                # Freed at the end of the span, so it only counts towards the peak
+                buffer = bytearray(8 * 2**20)
+                del buffer
+            frame = pd.DataFrame({"name": [f"task {i}" for i in range(10_000)]})
+            track_frame("tasks", frame)
+            track_frame("freed", pd.DataFrame({"points": [1.0]}))
+
+    spans = {span.name: span for span in profiler.spans}
+    assert spans["allocate"].peak_memory >= 8 * 2**20
+    assert spans["allocate"].retained_memory < 2**20
+    # The peak of a span includes the peak of its children
+    assert spans["load"].peak_memory >= spans["allocate"].peak_memory
+    assert spans["load"].retained_memory >= frame.memory_usage(deep=True).sum() / 2
+    # Only the DataFrames alive at the end of the run are reported
+    assert profiler.frame_memory == {"tasks": frame.memory_usage(deep=True).sum()}
+    assert profiler.snapshot is not None
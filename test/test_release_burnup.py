@@ -0,0 +1,139 @@
+"""Test the burnup of a release"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.sprint_tasks import SprintTasks
+
+
+def get_raw_sheets(start: str, tasks: List[list]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Get the raw burndown and sprint tasks sheets of a sprint of five days.
+
+    Args:
+        start (str): The first day of the sprint
+        tasks (List[list]): The burned, creep_date, creep, Date Closed and Points of
+            each task
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The burndown and sprint tasks sheets
+    """
+    burndown_sheet = pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=5),
+            "ideal_burndown": np.nan,
+            "remaining": np.nan,
+        }
+    )
+    sprint_tasks_sheet = pd.DataFrame(
+        tasks, columns=["burned", "creep_date", "creep", "Date Closed", "Points"]
+    )
+    sprint_tasks_sheet["creep_category"] = np.where(
+        sprint_tasks_sheet.loc[:, "creep"].notna(), "Unplanned", None
+    )
+    sprint_tasks_sheet["category"] = "Feature"
+    sprint_tasks_sheet["Created"] = pd.Timestamp("2022-12-01")
+    sprint_tasks_sheet["Original estimate"] = sprint_tasks_sheet.loc[:, "Points"]
+    return burndown_sheet, sprint_tasks_sheet
+
+
+def test_release_burnup(sprint_tasks: SprintTasks) -> None:
+    """Test the scope and done points of a hand made release of two sprints.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    sheets = {
+        "9.0-1": get_raw_sheets(
+            "2023-01-02",
+            [
+                [5.0, None, None, "2023-01-03", 5.0],
+                [0.0, None, None, None, 3.0],
+                [2.0, "2023-01-04", 2.0, "2023-01-05", 2.0],
+            ],
+        ),
+        "9.0-2": get_raw_sheets(
+            "2023-01-09",
+            [
+                [4.0, None, None, "2023-01-10", 4.0],
+                [0.0, "2023-01-11", 1.0, None, 1.0],
+            ],
+        ),
+    }
+    sprint_tasks.update_sprints(
+        {name: burndown for name, (burndown, _) in sheets.items()},
+        {name: tasks for name, (_, tasks) in sheets.items()},
+    )
+    burnup_df = sprint_tasks.get_release_burnup("9.0")
+
+    # The week-end between the sprints belongs to the first sprint
+    assert burnup_df.index[0] == pd.Timestamp("2023-01-02")
+    assert burnup_df.index[-1] == pd.Timestamp("2023-01-13")
+    assert burnup_df.loc[:, "sprint"].tolist() == ["9.0-1"] * 7 + ["9.0-2"] * 5
+    np.testing.assert_allclose(
+        burnup_df.loc[:, "done"], [0, 5, 5, 7, 7, 7, 7, 7, 11, 11, 11, 11]
+    )
+    # The scope of the second sprint starts from the points done before it
+    np.testing.assert_allclose(
+        burnup_df.loc[:, "scope"], [8, 8, 10, 10, 10, 10, 10, 11, 11, 12, 12, 12]
+    )
+    np.testing.assert_allclose(
+        burnup_df.loc[:, "remaining"],
+        burnup_df.loc[:, "scope"] - burnup_df.loc[:, "done"],
+    )
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=2, n_sprints=3, n_tasks=20)]
+)
+def test_release_burnup_agrees_with_sprints(sprint_tasks: SprintTasks) -> None:
+    """Test that the burnup equals the total creep and burn of the sprints.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    total_dfs = sprint_tasks.get_total_sprint_creep_and_burn()
+    releases = sorted({name.split("-")[0] for name in total_dfs.keys()})
+    assert len(releases) == 2
+    for release in releases:
+        burnup_df = sprint_tasks.get_release_burnup(release)
+        sprint_dfs = {
+            name: total_df
+            for name, total_df in total_dfs.items()
+            if name.split("-")[0] == release
+        }
+
+        def get_daily(column: str, name: Optional[str] = None) -> pd.Series:
+            """Sum the daily increase of an accumulated column over the sprints."""
+            return sum(
+                total_df.loc[:, column]
+                .diff()
+                .fillna(total_df.loc[:, column])
+                .reindex(burnup_df.index, fill_value=0)
+                for sprint_name, total_df in sprint_dfs.items()
+                if name is None or sprint_name == name
+            )
+
+        # Consecutive sprints share a day, so the sprints are summed per day
+        done = get_daily("accum_burned").cumsum()
+        np.testing.assert_allclose(done, burnup_df.loc[:, "done"])
+        # Within a sprint the scope only grows with the creep
+        sprints = burnup_df.loc[:, "sprint"]
+        in_sprint = sprints == sprints.shift()
+        np.testing.assert_allclose(
+            burnup_df.loc[:, "scope"].diff().loc[in_sprint],
+            get_daily("accum_creep").loc[in_sprint],
+        )
+        # A sprint starts from the points done before it plus its planned points
+        for name in sprint_dfs.keys():
+            start = sprints.index[sprints == name][0]
+            planned = sprint_tasks.sprint_planning_dfs[name]
+            expected = (
+                done.shift(fill_value=0).loc[start]
+                + planned.loc[:, "Original estimate"].sum()
+                + get_daily("accum_creep", name).loc[start]
+            )
+            assert burnup_df.loc[start, "scope"] == pytest.approx(expected)
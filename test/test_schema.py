@@ -0,0 +1,96 @@
+"""Test the validation of the spreadsheets against their schemas"""
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from burndown.schema import (
+    SPRINT_TASKS_SCHEMA,
+    SchemaError,
+    apply_capacity_schema,
+    apply_schema,
+)
+from burndown.sprint_tasks import SprintTasks
+
+
+def get_sprint_tasks_sheet() -> pd.DataFrame:
+    """Get a sprint tasks sheet as read from a spreadsheet.
+
+    Returns:
+        pd.DataFrame: The sheet
+    """
+    return pd.DataFrame(
+        {
+            "burned": [3.0, 0.0],
+            "creep_date": [np.nan, np.nan],
+            "creep": [np.nan, 2.0],
+            "creep_category": [np.nan, "Unplanned"],
+            "category": ["Feature", "Bug"],
+            "Created": [pd.Timestamp("2021-12-20 09:30"), pd.Timestamp("2022-01-05")],
+            "Date Closed": [pd.Timestamp("2022-01-04 13:10"), pd.NaT],
+            "Original estimate": [3, 2],
+            "Points": [3, 2],
+        }
+    )
+
+
+def test_apply_schema() -> None:
+    """Test that the columns are converted to the dtypes of the schema."""
+    sheet = apply_schema(get_sprint_tasks_sheet(), SPRINT_TASKS_SCHEMA, "2.0-1")
+
+    assert sheet.loc[:, "creep_date"].dtype == "datetime64[ns]"
+    assert sheet.loc[0, "Date Closed"] == pd.Timestamp("2022-01-04")
+    assert sheet.loc[:, "Points"].dtype == "float64"
+    assert sheet.loc[:, "category"].dtype == "category"
+
+
+def test_apply_schema_errors() -> None:
+    """Test that the errors report the sheet, row and column."""
+    sheet = get_sprint_tasks_sheet()
+    sheet.loc[1, "Points"] = "two"
+    with pytest.raises(SchemaError, match="Sheet '2.0-1', row 3, column 'Points'"):
+        apply_schema(sheet, SPRINT_TASKS_SCHEMA, "2.0-1")
+
+    sheet = get_sprint_tasks_sheet().drop(columns="creep")
+    with pytest.raises(SchemaError, match="column 'creep': The column is missing"):
+        apply_schema(sheet, SPRINT_TASKS_SCHEMA, "2.0-1")
+
+
+def test_apply_capacity_schema() -> None:
+    """Test that the capacities are converted and errors report their cell."""
+    person_days = apply_capacity_schema({"2.0-1": 10, "2.0-2": None}, "capacity.xlsx")
+    assert person_days.loc["2.0-1"] == 10.0
+    assert np.isnan(person_days.loc["2.0-2"])
+
+    with pytest.raises(
+        SchemaError, match="Sheet 'capacity.xlsx/2.0-2', row 11, column 'F'"
+    ):
+        apply_capacity_schema({"2.0-1": 10, "2.0-2": "ten"}, "capacity.xlsx")
+    with pytest.raises(SchemaError, match="Cannot convert None to float"):
+        apply_capacity_schema({"2.0-2": None}, "capacity.xlsx", required=True)
+
+
+def test_sprint_tasks_schema(sprint_tasks: SprintTasks) -> None:
+    """Test that rows without a category are dropped before their conversion.
+
+    Args:
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    sprint_name = list(sprint_tasks.sprint_tasks_sheets.keys())[0]
+    sprint_tasks_sheet = sprint_tasks.sprint_tasks_sheets[sprint_name]
+    raw_sheet = sprint_tasks.raw_sprint_tasks_sheets[sprint_name].copy()
+    # The sum row is the last row of the sheet
+    assert raw_sheet.loc[:, "category"].isna().iloc[-1]
+    raw_sheet.loc[raw_sheet.index[-1], "Points"] = "Total of the sprint"
+    sprint_tasks.update_sprints(dict(), {sprint_name: raw_sheet})
+    pd.testing.assert_frame_equal(
+        sprint_tasks.sprint_tasks_sheets[sprint_name], sprint_tasks_sheet
+    )
+
+    raw_sheet.loc[raw_sheet.index[1], "Points"] = "three"
+    with pytest.raises(
+        SchemaError, match=re.escape(f"{sprint_name}', row 3, column 'Points'")
+    ):
+        sprint_tasks.update_sprints(dict(), {sprint_name: raw_sheet})
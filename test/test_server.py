@@ -0,0 +1,120 @@
+"""Test the dashboard server"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import openpyxl
+import pytest
+
+from burndown.server import ChartCache, DashboardState, get_handler
+from burndown.targets import SharedData
+
+
+def test_chart_cache() -> None:
+    """Test that the least recently used chart is evicted and hits are counted."""
+    cache = ChartCache(max_size=2)
+    cache.put(("sprint", "2.0-1", 0), [b"1"])
+    cache.put(("sprint", "2.0-2", 0), [b"2"])
+    assert cache.get(("sprint", "2.0-1", 0)) == [b"1"]
+    cache.put(("sprint", "2.0-3", 0), [b"3"])
+
+    assert cache.get(("sprint", "2.0-2", 0)) is None
+    assert cache.get(("sprint", "2.0-3", 0)) == [b"3"]
+    assert cache.get_status()["hits"] == 2
+    assert cache.get_status()["misses"] == 1
+
+
+def test_concurrent_chart_cache() -> None:
+    """Test that the cache stays consistent when used from several threads."""
+    cache = ChartCache(max_size=4)
+
+    def use_cache(thread: int) -> None:
+        for index in range(1000):
+            key = (thread, index % 8)
+            if cache.get(key) is None:
+                cache.put(key, [b""])
+
+    threads = [threading.Thread(target=use_cache, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    status = cache.get_status()
+    assert status["size"] == 4
+    assert status["hits"] + status["misses"] == 4000
+
+
+def test_server(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the server renders charts and returns errors as HTTP statuses.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the metrics fail
+    """
+    plt.switch_backend("Agg")
+    state = DashboardState(SharedData(data_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), get_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def get_status(path: str) -> int:
+        try:
+            with urllib.request.urlopen(f"{url}{path}") as response:
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+    try:
+        with urllib.request.urlopen(f"{url}/chart/burndown/2.0-1/0.png") as response:
+            assert response.headers["Content-Type"] == "image/png"
+            assert response.read().startswith(b"\x89PNG")
+        with urllib.request.urlopen(f"{url}/metrics.json") as response:
+            metrics = json.loads(response.read())
+        assert set(metrics["total_burn"].keys()) == set(
+            state.data.sprint_tasks.sprint_tasks_sheets.keys()
+        )
+        assert get_status("/chart/burndown/2.0-1/1.png") == 404
+        assert get_status("/chart/burndown/2.0-1/first.png") == 404
+        assert get_status("/chart/sprint/2.0-9/0.png") == 404
+        assert get_status("/chart/release/9.0/0.png") == 404
+        assert get_status("/unknown") == 404
+
+        # The errors of rendering are not reported as missing pages
+        for error in (RuntimeError, ValueError, KeyError):
+
+            def fail() -> None:
+                raise error("Rendering failed")
+
+            monkeypatch.setattr(state, "get_metrics", fail)
+            assert get_status("/metrics.json") == 500
+        with urllib.request.urlopen(f"{url}/status") as response:
+            status = json.loads(response.read())
+        assert status["latency"]["chart"]["count"] == 5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reload_waits_for_invalid_content(data_dir: Path) -> None:
+    """Test that a spreadsheet missing a column is not read again on each request.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+    """
+    state = DashboardState(SharedData(data_dir))
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+    workbook = openpyxl.load_workbook(sprint_tasks_path)
+    for worksheet in workbook.worksheets:
+        header = [cell.value for cell in worksheet[1]]
+        worksheet.delete_cols(header.index("Created") + 1)
+    workbook.save(sprint_tasks_path)
+
+    assert not state.reload_if_changed()
+    assert state.watcher.poll() == []
+    assert state.data_version == 0
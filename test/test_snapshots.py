@@ -0,0 +1,128 @@
+"""Test the snapshot archive of the sprint tasks"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark.generate import FixtureConfig
+from burndown.snapshots import (
+    SNAPSHOT_DIR_NAME,
+    SnapshotArchive,
+    decode_sheet,
+    encode_sheet,
+    get_row_keys,
+)
+from burndown.sprint_tasks import SprintTasks, read_sprint_tasks_sheets
+
+
+@pytest.mark.parametrize(
+    "fixture_config", [FixtureConfig(n_releases=1, n_sprints=3, n_tasks=20)]
+)
+def test_snapshot_archive(data_dir: Path) -> None:
+    """Test that only the changed rows are stored and past states are restored.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+    """
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+    sheets = read_sprint_tasks_sheets(sprint_tasks_path, with_key=True)
+    sprint_name = list(sheets.keys())[-1]
+    archive = SnapshotArchive(data_dir.joinpath(SNAPSHOT_DIR_NAME))
+
+    first_path = archive.capture(sheets, pd.Timestamp("2023-01-02 08:00"))
+    assert first_path is not None
+    assert archive.capture(sheets, pd.Timestamp("2023-01-03 08:00")) is None
+    with pytest.raises(ValueError):
+        archive.capture(sheets, pd.Timestamp("2023-01-01"))
+
+    # Re-estimate a task, insert a creep task and remove the first sprint
+    changed_sheets = {name: sheet.copy() for name, sheet in sheets.items()}
+    changed_sheets[sprint_name].loc[3, "Points"] = 13.0
+    creep_task = changed_sheets[sprint_name].iloc[[0]].assign(Key="TASK-NEW")
+    changed_sheets[sprint_name] = pd.concat(
+        [
+            changed_sheets[sprint_name].iloc[:2],
+            creep_task,
+            changed_sheets[sprint_name].iloc[2:],
+        ],
+        ignore_index=True,
+    )
+    changed_sheets.pop(list(sheets.keys())[0])
+    second_path = archive.capture(changed_sheets, pd.Timestamp("2023-01-04 08:00"))
+    # The rows after the inserted task are identified by their key
+    with np.load(second_path, allow_pickle=False) as snapshot:
+        assert snapshot["rows"].tolist() == [2, 4]
+        assert snapshot["Points"][1] == 13.0
+        assert snapshot["keyed_sprints"].tolist() == [1]
+    assert archive.snapshot_paths == [first_path, second_path]
+
+    # A new archive reconstructs the states from the files
+    archive = SnapshotArchive(data_dir.joinpath(SNAPSHOT_DIR_NAME))
+    for as_of, expected in (
+        (pd.Timestamp("2023-01-03"), sheets),
+        (None, changed_sheets),
+    ):
+        loaded = archive.load(as_of)
+        assert list(loaded.keys()) == list(expected.keys())
+        for name, sheet in expected.items():
+            pd.testing.assert_frame_equal(
+                loaded[name], decode_sheet(encode_sheet(sheet))
+            )
+    with pytest.raises(FileNotFoundError):
+        archive.load(pd.Timestamp("2023-01-01"))
+
+    # The sprint tasks can be loaded as they were at a snapshot
+    sprint_tasks = SprintTasks(
+        sprint_tasks_path,
+        data_dir.joinpath("burndown.xlsx"),
+        as_of=pd.Timestamp("2023-01-03"),
+    )
+    current = SprintTasks(sprint_tasks_path, data_dir.joinpath("burndown.xlsx"))
+    assert list(sprint_tasks.sprint_tasks_sheets.keys()) == list(sheets.keys())
+    pd.testing.assert_frame_equal(
+        sprint_tasks.get_burn_categories(), current.get_burn_categories()
+    )
+
+
+def test_row_keys() -> None:
+    """Test that repeated and missing task keys are numbered."""
+    sheet = pd.DataFrame({"Key": ["A", None, "B", "A", None, "A#1"]})
+
+    assert get_row_keys(sheet).tolist() == ["A#0", "#0", "B#0", "A#1", "#1", "A#1#0"]
+    assert get_row_keys(sheet.drop(columns="Key")).tolist() == [
+        f"#{index}" for index in range(6)
+    ]
+
+
+def test_snapshot_keyframes(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the states are reconstructed from the last keyframe.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to shorten the keyframe interval
+    """
+    monkeypatch.setattr("burndown.snapshots.KEYFRAME_INTERVAL", 3)
+    sheets = read_sprint_tasks_sheets(
+        data_dir.joinpath("sprint_tasks.xlsx"), with_key=True
+    )
+    sprint_name = list(sheets.keys())[-1]
+    archive = SnapshotArchive(data_dir.joinpath(SNAPSHOT_DIR_NAME))
+    states = list()
+    for day in range(7):
+        sheets = {name: sheet.copy() for name, sheet in sheets.items()}
+        sheets[sprint_name].loc[day, "burned"] = float(day)
+        archive.capture(sheets, pd.Timestamp("2023-01-02") + pd.Timedelta(days=day))
+        states.append(sheets)
+
+    is_keyframe = [archive.is_keyframe(path) for path in archive.snapshot_paths]
+    assert is_keyframe == [True, False, False, True, False, False, True]
+    # The states are reconstructed without the deltas before their keyframe
+    archive.snapshot_paths[0].unlink()
+    archive = SnapshotArchive(data_dir.joinpath(SNAPSHOT_DIR_NAME))
+    for day in (4, 6):
+        loaded = archive.load(pd.Timestamp("2023-01-02") + pd.Timedelta(days=day))
+        pd.testing.assert_frame_equal(
+            loaded[sprint_name], decode_sheet(encode_sheet(states[day][sprint_name]))
+        )
@@ -0,0 +1,69 @@
+"""Test the archive of the closed sprints"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from burndown.__main__ import main
+from burndown.excel_io import read_sheet
+from burndown.sprint_archive import ARCHIVE_DIR_NAME, SprintArchive
+from burndown.sprint_tasks import SprintTasks
+from burndown.targets import SharedData
+from burndown.watch import reload_changed
+
+
+def test_close_sprint(data_dir: Path, sprint_tasks: SprintTasks) -> None:
+    """Test that closed sprints are read from the archive instead of the sheets.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        sprint_tasks (SprintTasks): The sprint tasks of generated spreadsheets
+    """
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+    burndown_path = data_dir.joinpath("burndown.xlsx")
+    live = sprint_tasks
+    sprint_names = list(live.sprint_tasks_sheets.keys())
+    total_burn = live.get_total_burn()
+
+    archive = SprintArchive(data_dir.joinpath(ARCHIVE_DIR_NAME))
+    with pytest.raises(ValueError):
+        # The sprint is not finished yet
+        archive.close_sprint(live, sprint_names[0], pd.Timestamp("2022-01-04"))
+    assert archive.sprint_names == []
+
+    # The sheets are only removed when asked
+    for sprint_name, options in (
+        (sprint_names[1], []),
+        (sprint_names[0], ["--remove_sheets"]),
+    ):
+        release, sprint_number = sprint_name.split("-")
+        main(
+            ["--data_dir", str(data_dir), "close", "-r", release, "-s", sprint_number]
+            + options
+        )
+    with pytest.raises(ValueError):
+        archive.close_sprint(live, sprint_names[0])
+    assert archive.sprint_names == sprint_names[:2]
+    for path in (burndown_path, sprint_tasks_path, data_dir.joinpath("capacity.xlsx")):
+        assert list(read_sheet(path).keys()) == sprint_names[1:]
+
+    archived = SprintTasks(sprint_tasks_path, burndown_path)
+    assert list(archived.sprint_tasks_sheets.keys()) == sprint_names
+    assert set(archived.archived_person_days.keys()) == set(sprint_names[:2])
+    pd.testing.assert_frame_equal(archived.get_total_burn(), total_burn)
+    for sprint_name in sprint_names:
+        pd.testing.assert_frame_equal(
+            archived.sprint_tasks_sheets[sprint_name].reset_index(drop=True),
+            live.sprint_tasks_sheets[sprint_name].reset_index(drop=True),
+            check_like=True,
+        )
+        pd.testing.assert_frame_equal(
+            archived.burndown_sheets[sprint_name], live.burndown_sheets[sprint_name]
+        )
+
+    # Reloading the spreadsheets keeps the archived sprints
+    data = SharedData(data_dir)
+    data.sprint_tasks
+    assert reload_changed(data, [sprint_tasks_path, burndown_path]) == set()
+    assert list(data.sprint_tasks.sprint_tasks_sheets.keys()) == sprint_names
@@ -0,0 +1,20 @@
+"""Test the sprint dates"""
+
+import pandas as pd
+
+from burndown.sprint_dates import SprintDates, get_ranges_without_development
+
+
+def test_get_ranges_without_development() -> None:
+    """Test that consecutive days without development are merged."""
+    # 2022-01-31 is a Monday
+    sprint_dates = SprintDates(
+        pd.to_datetime("2022-01-31"), 14, [pd.to_datetime("2022-02-02")]
+    )
+    ranges = get_ranges_without_development(sprint_dates.dates_without_development)
+
+    assert ranges == [
+        (pd.to_datetime("2022-02-01"), pd.to_datetime("2022-02-02")),
+        (pd.to_datetime("2022-02-04"), pd.to_datetime("2022-02-06")),
+        (pd.to_datetime("2022-02-11"), pd.to_datetime("2022-02-13")),
+    ]
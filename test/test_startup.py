@@ -0,0 +1,103 @@
+"""Test that the command line interfaces start without the heavy imports"""
+
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+ROOT_PATH = Path(__file__).parents[1].resolve()
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib")
+
+
+def get_import_times(args: List[str]) -> Dict[str, int]:
+    """Run python with -X importtime and return the time spent on each import.
+
+    Args:
+        args (List[str]): The arguments to python
+
+    Returns:
+        Dict[str, int]: The cumulative import time in microseconds of each module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "burndown",
+        "burndown.burndown",
+        "burndown.create_new_sprint",
+        "burndown.dashboard",
+        "burndown.metrics",
+        "burndown.plot_release_burnup",
+        "burndown.plot_sprint",
+        "burndown.plot_sprint_burndown",
+        "burndown.plot_sprint_double_burndown",
+        "burndown.plot_sprint_trends",
+        "burndown.plot_cumulative_flow",
+        "burndown.plot_lead_time",
+        "survey.plot_agile_maturity",
+    ],
+)
+def test_help_without_heavy_imports(module: str) -> None:
+    """Test that --help does not import pandas, numpy nor matplotlib.
+
+    Args:
+        module (str): The module to run
+    """
+    import_times = get_import_times(["-m", module, "--help"])
+    heavy_imports = [name for name in import_times if name in HEAVY_MODULES]
+    assert heavy_imports == [], f"--help of {module} imports {heavy_imports}"
+
+
+def test_daily_update_without_pandas(tmp_path: Path) -> None:
+    """Test that the remaining points of a day are stored without importing pandas.
+
+    Args:
+        tmp_path (Path): Temporary path to save files to
+    """
+    import openpyxl
+
+    sheet_path = tmp_path.joinpath("burndown.xlsx")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "2.0-1"
+    sheet.append(["date", "ideal_burndown", "remaining"])
+    sheet.append([datetime(2022, 1, 3), 30, 30])
+    sheet.append([datetime(2022, 1, 4), 15, None])
+    workbook.save(sheet_path)
+
+    code = (
+        "import sys; from datetime import datetime; "
+        "from burndown.excel_io import save_indexed_values; "
+        f"save_indexed_values({str(sheet_path)!r}, 'remaining', "
+        "{None: {datetime(2022, 1, 4): 20.0, datetime(2022, 1, 5): 10.0}}); "
+        # openpyxl imports numpy if it is installed, so only pandas is checked
+        "assert 'pandas' not in sys.modules and 'matplotlib' not in sys.modules"
+    )
+    import_times = get_import_times(["-c", code])
+
+    assert "openpyxl" in import_times
+    sheet = openpyxl.load_workbook(sheet_path)["2.0-1"]
+    assert [row[2] for row in sheet.iter_rows(min_row=2, values_only=True)] == [
+        30,
+        20,
+        10,
+    ]
@@ -0,0 +1,102 @@
+"""Test the parsing and analytics of the agile maturity survey"""
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from survey.analytics import (
+    get_dimension_means,
+    get_dimension_trends,
+    get_level_distribution,
+    get_round_deltas,
+)
+from survey.plot_agile_maturity import get_level_matrix
+from survey.plots import plot_agile_maturity_trends
+
+
+def create_level_matrix() -> pd.DataFrame:
+    """Create the levels of three survey rounds.
+
+    Returns:
+        pd.DataFrame: The levels as returned by get_level_matrix
+    """
+    index = pd.MultiIndex.from_tuples(
+        [("2.0-2", 0), ("2.0-2", 1), ("2.0-4", 0), ("2.0-4", 1), ("2.0-10", 0)],
+        names=["Sprint", "Respondent"],
+    )
+    columns = pd.Index(["Team work", "Planning"], name="Dimension")
+    return pd.DataFrame(
+        [[1.0, 2.0], [3.0, np.nan], [3.0, 2.0], [3.0, 4.0], [5.0, np.nan]],
+        index=index,
+        columns=columns,
+    )
+
+
+def test_get_level_matrix() -> None:
+    """Test that the levels of all the rounds are extracted in the sheet order."""
+    raw_dfs = {
+        "2.0-2": pd.DataFrame(
+            {
+                "Name": ["a", "b"],
+                "TEAM WORK: How do we collaborate?": ["LEVEL 2: Some", "LEVEL 4: Most"],
+                "PLANNING: How is the sprint planned?": ["LEVEL 1: None", "Unsure"],
+            }
+        ),
+        "2.0-10": pd.DataFrame(
+            {
+                "Name": ["a"],
+                "TEAM WORK: How do we collaborate?": ["LEVEL 5: All"],
+                "PLANNING: How is the sprint planned?": [np.nan],
+            }
+        ),
+    }
+    level_matrix = get_level_matrix(raw_dfs)
+
+    assert list(level_matrix.columns) == ["Team work", "Planning"]
+    assert list(level_matrix.index) == [("2.0-2", 0), ("2.0-2", 1), ("2.0-10", 0)]
+    np.testing.assert_array_equal(
+        level_matrix.to_numpy(), [[2.0, 1.0], [4.0, np.nan], [5.0, np.nan]]
+    )
+
+
+def test_analytics() -> None:
+    """Test the means, deltas, trends and distributions of the survey rounds."""
+    level_matrix = create_level_matrix()
+
+    dimension_means = get_dimension_means(level_matrix)
+    assert list(dimension_means.index) == ["2.0-2", "2.0-4", "2.0-10"]
+    np.testing.assert_array_equal(
+        dimension_means.to_numpy(), [[2.0, 2.0], [3.0, 3.0], [5.0, np.nan]]
+    )
+    np.testing.assert_array_equal(
+        get_round_deltas(dimension_means).to_numpy(),
+        [[np.nan, np.nan], [1.0, 1.0], [2.0, np.nan]],
+    )
+
+    trends = get_dimension_trends(dimension_means)
+    slope, intercept = np.polyfit(range(3), dimension_means["Team work"], 1)
+    assert np.isclose(trends.loc["Team work", "slope"], slope)
+    assert np.isclose(trends.loc["Team work", "first"], intercept)
+    # The round without answers is left out of the fit
+    assert trends.loc["Planning", "slope"] == 1.0
+    assert trends.loc["Planning", "last"] == 4.0
+    assert list(trends["rounds"]) == [3, 2]
+
+    distribution = get_level_distribution(level_matrix, normalize=False)
+    assert list(distribution.columns) == [1, 2, 3, 4, 5]
+    assert list(distribution.loc[("2.0-2", "Team work")]) == [1, 0, 1, 0, 0]
+    assert list(distribution.loc[("2.0-10", "Planning")]) == [0, 0, 0, 0, 0]
+    shares = get_level_distribution(level_matrix)
+    assert list(shares.loc[("2.0-4", "Planning")]) == [0, 0.5, 0, 0.5, 0]
+
+
+def test_plot_agile_maturity_trends(tmp_path: Path) -> None:
+    """Test that the radars and trends are saved and the figure is released."""
+    plt.switch_backend("Agg")
+    dimension_means = get_dimension_means(create_level_matrix())
+    plot_agile_maturity_trends(dimension_means, tmp_path, n_columns=2)
+
+    assert len(list(tmp_path.glob("*-agile_assessment_trends.png"))) == 1
+    assert len(plt.get_fignums()) == 0
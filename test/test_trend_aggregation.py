@@ -0,0 +1,46 @@
+"""Test the aggregation of the sprint trends"""
+
+import pandas as pd
+
+from burndown.trend_aggregation import (
+    aggregate_categories,
+    aggregate_total_burn,
+    get_buckets,
+)
+
+
+def test_aggregate_by_release() -> None:
+    """Test that the sprints are summed into their releases."""
+    sprint_start_dates = pd.Series(
+        pd.to_datetime(["2022-01-03", "2022-01-17", "2022-04-04"]),
+        index=["2.0-1", "2.0-2", "2.1-1"],
+    )
+    buckets = get_buckets(sprint_start_dates, "release")
+    categories_df = pd.DataFrame(
+        {"Bug": [1.0, 2.0, 3.0], "Release": ["2.0", "2.0", "2.1"]},
+        index=sprint_start_dates.index,
+    )
+    total_burn_df = pd.DataFrame(
+        {
+            "total_points": [10.0, 20.0, 30.0],
+            "sprint_start_burned": [5.0, 5.0, 10.0],
+            "sprint_start_points": [10.0, 10.0, 10.0],
+            "person_days": [10.0, 10.0, 20.0],
+        },
+        index=sprint_start_dates.index,
+    )
+
+    categories = aggregate_categories(categories_df, buckets)
+    total_burn = aggregate_total_burn(total_burn_df, buckets)
+
+    assert categories.loc[:, "Bug"].tolist() == [3.0, 3.0]
+    assert total_burn.loc[:, "achievement"].tolist() == [50.0, 100.0]
+    assert total_burn.loc[:, "burn_per_person_day"].tolist() == [1.5, 1.5]
+
+
+def test_aggregate_by_quarter() -> None:
+    """Test that the sprints are bucketed by the quarter they start in."""
+    sprint_start_dates = pd.Series(
+        pd.to_datetime(["2022-03-28", "2022-04-11"]), index=["2.0-1", "2.0-2"]
+    )
+    assert get_buckets(sprint_start_dates, "quarter").tolist() == ["2022Q1", "2022Q2"]
@@ -0,0 +1,139 @@
+"""Test the detection of changes in the spreadsheets"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from burndown.targets import SharedData
+from burndown.watch import get_changed_sheets, get_dependent_targets, watch
+
+
+def test_get_changed_sheets() -> None:
+    """Test that only the changed, added and removed sheets are reported."""
+    old_sheets = {
+        "2.0-1": pd.DataFrame({"burned": [1.0, 2.0]}),
+        "2.0-2": pd.DataFrame({"burned": [3.0]}),
+        "2.0-3": pd.DataFrame({"burned": [4.0]}),
+    }
+    new_sheets = {
+        "2.0-1": pd.DataFrame({"burned": [1.0, 2.0]}),
+        "2.0-2": pd.DataFrame({"burned": [5.0]}),
+        "2.0-4": pd.DataFrame({"burned": [6.0]}),
+    }
+    changed, removed = get_changed_sheets(old_sheets, new_sheets)
+
+    assert changed == {"2.0-2", "2.0-4"}
+    assert removed == {"2.0-3"}
+
+
+def test_get_dependent_targets() -> None:
+    """Test that only the charts of the changed sprints are rendered."""
+    dependent = get_dependent_targets(
+        changed_sprints={"2.0-2"},
+        sprint_names=["2.0-1", "2.0-2"],
+        targets=["double", "release", "cumulative_flow", "trends"],
+    )
+
+    assert dependent == [
+        ("double", "2.0-2"),
+        ("release", "2.0"),
+        ("cumulative_flow", "2.0"),
+        ("trends", None),
+    ]
+
+
+def watch_edits(
+    data_dir: Path, edits: List[Callable[[], None]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Watch the spreadsheets while they are edited, one edit per poll.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        edits (List[Callable[[], None]]): The edits of the spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the edits while sleeping
+    """
+    edits = list(edits)
+
+    def sleep(seconds: float) -> None:
+        if len(edits) > 0:
+            edits.pop(0)()
+
+    monkeypatch.setattr("burndown.watch.time.sleep", sleep)
+    charts_dir = data_dir.joinpath("charts")
+    watch(SharedData(data_dir), charts_dir, targets=["trends"], max_events=2)
+
+
+def test_watch_retries_partial_writes(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a spreadsheet being written is read again on the next poll.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the edits while sleeping
+    """
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+    content = sprint_tasks_path.read_bytes()
+    watch_edits(
+        data_dir,
+        [
+            lambda: sprint_tasks_path.write_bytes(content[: len(content) // 2]),
+            lambda: sprint_tasks_path.write_bytes(content),
+        ],
+        monkeypatch,
+    )
+    assert len(list(data_dir.joinpath("charts").glob("*.png"))) > 0
+
+
+def test_watch_stops_on_errors(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that errors which do not go away by reading again stop the watch.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the edits while sleeping
+    """
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+
+    def add_sprint_without_burndown() -> None:
+        workbook = openpyxl.load_workbook(sprint_tasks_path)
+        workbook.copy_worksheet(workbook.worksheets[-1]).title = "2.0-6"
+        workbook.save(sprint_tasks_path)
+
+    with pytest.raises(KeyError, match="2.0-6"):
+        watch_edits(data_dir, [add_sprint_without_burndown], monkeypatch)
+
+
+def test_watch_waits_for_invalid_content(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a spreadsheet missing a column is only read again once it is saved.
+
+    Args:
+        data_dir (Path): Directory containing generated spreadsheets
+        monkeypatch (pytest.MonkeyPatch): Fixture to make the edits while sleeping
+    """
+    sprint_tasks_path = data_dir.joinpath("sprint_tasks.xlsx")
+    content = sprint_tasks_path.read_bytes()
+
+    def remove_created_column() -> None:
+        workbook = openpyxl.load_workbook(sprint_tasks_path)
+        for worksheet in workbook.worksheets:
+            header = [cell.value for cell in worksheet[1]]
+            worksheet.delete_cols(header.index("Created") + 1)
+        workbook.save(sprint_tasks_path)
+
+    # Reading the spreadsheet again on the poll without a change would use up the
+    # second event before the fix
+    watch_edits(
+        data_dir,
+        [
+            remove_created_column,
+            lambda: None,
+            lambda: sprint_tasks_path.write_bytes(content),
+        ],
+        monkeypatch,
+    )
+    assert len(list(data_dir.joinpath("charts").glob("*.png"))) > 0